@@ -17,7 +17,9 @@ from axelrod.load_data_ import load_pso_tables, load_weights
 from axelrod import graph
 from axelrod.plot import Plot
 from axelrod.game import DefaultGame, Game
-from axelrod.history import History, LimitedHistory
+from axelrod.packed_interactions import PackedInteractions
+from axelrod.match_summary import MatchSummary
+from axelrod.history import FlippedHistory, History, LimitedHistory
 from axelrod.player import Player
 from axelrod.classifier import Classifiers
 from axelrod.evolvable_player import EvolvablePlayer
@@ -25,9 +27,11 @@ from axelrod.mock_player import MockPlayer
 from axelrod.match import Match
 from axelrod.moran import MoranProcess, ApproximateMoranProcess
 from axelrod.strategies import *
-from axelrod.deterministic_cache import DeterministicCache
+from axelrod.deterministic_cache import DeterministicCache, SharedCache
+from axelrod.persistent_cache import PersistentCache
 from axelrod.match_generator import *
 from axelrod.tournament import Tournament
 from axelrod.result_set import ResultSet
+from axelrod.result_aggregator import StreamingResultSet
 from axelrod.ecosystem import Ecosystem
 from axelrod.fingerprint import AshlockFingerprint, TransitiveFingerprint
@@ -1,6 +1,7 @@
 """Utilities used by various strategies."""
 
 import itertools
+from collections import deque
 from functools import lru_cache
 
 from axelrod.action import Action
@@ -45,6 +46,97 @@ def detect_cycle(history, min_size=1, max_size=12, offset=0):
     return None
 
 
+class CycleDetector(object):
+    """Incrementally detects cycles in a growing sequence such as a history.
+
+    Gives the same results as `detect_cycle` without rescanning the sequence:
+    for every candidate cycle length up to `max_size`, the detector records
+    whether an element has differed from the element that many places
+    before it. Each new element is compared with at most `max_size` earlier
+    elements, and only the first and last `max_size` elements are kept.
+
+    Parameters
+    ----------
+    max_size: int, 12
+        The maximum length of the cycle
+    offset: int, 0
+        The amount of history to skip initially
+    """
+
+    def __init__(self, max_size=12, offset=0):
+        self.max_size = max_size
+        self.offset = offset
+        self.reset()
+
+    def reset(self):
+        """Forgets every element seen so far."""
+        self._consumed = 0
+        self._length = 0
+        self._head = []
+        self._tail = deque(maxlen=self.max_size)
+        # The cycle lengths consistent with the elements seen so far
+        self._candidates = list(range(1, self.max_size + 1))
+
+    def append(self, element):
+        """Adds an element to the end of the sequence."""
+        tail = self._tail
+        length = self._length
+        self._candidates = [
+            size
+            for size in self._candidates
+            if size > length or tail[-size] == element
+        ]
+        if length < self.max_size:
+            self._head.append(element)
+        tail.append(element)
+        self._length += 1
+
+    def update(self, history):
+        """Adds the elements of a history that have not been seen yet.
+
+        The history is assumed to only grow between calls: if it is shorter
+        than at the previous call, the detector is reset.
+
+        Parameters
+        ----------
+        history: sequence of C and D
+            The sequence to look for cycles within
+        """
+        if len(history) < self._consumed:
+            self.reset()
+        start = max(self._consumed, self.offset)
+        if start < len(history):
+            for element in history[start:]:
+                self.append(element)
+        self._consumed = max(self._consumed, len(history))
+
+    def cycle(self, min_size=1):
+        """Returns the shortest cycle of the sequence, as `detect_cycle`.
+
+        Parameters
+        ----------
+        min_size: int, 1
+            The minimum length of the cycle
+
+        Returns
+        -------
+        Tuple of C and D
+            The cycle detected in the sequence, or None
+        """
+        new_max_size = min(self._length // 2, self.max_size)
+        for size in self._candidates:
+            if size > new_max_size:
+                break
+            if size >= min_size:
+                return tuple(self._head[:size])
+        return None
+
+    def __eq__(self, other):
+        if not isinstance(other, CycleDetector):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+
 @lru_cache()
 def recursive_thue_morse(n):
     """The recursive definition of the Thue-Morse sequence.
@@ -29,6 +29,14 @@ class Action(Enum):
     C = 0  # Cooperate
     D = 1  # Defect
 
+    # Actions are hashed by their values. This is much faster than hashing
+    # their names (the default for Enum members), and actions are hashed
+    # several times per turn, when scoring. Unlike identity hashes, these are
+    # the same in every run, so that sets and dicts of actions are always
+    # iterated in the same order.
+    def __hash__(self):
+        return self._value_
+
     def __lt__(self, other):
         return self.value < other.value
 
@@ -40,9 +48,7 @@ class Action(Enum):
 
     def flip(self):
         """Returns the opposite Action."""
-        if self == Action.C:
-            return Action.D
-        return Action.C
+        return _FLIPPED[self]
 
     @classmethod
     def from_char(cls, character):
@@ -70,6 +76,9 @@ class Action(Enum):
         raise UnknownActionError('Character must be "C" or "D".')
 
 
+_FLIPPED = {Action.C: Action.D, Action.D: Action.C}
+
+
 def str_to_actions(actions: str) -> Tuple[Action, ...]:
     """Converts a string to a tuple of actions.
 
@@ -0,0 +1,134 @@
+"""
+Tools to play all repetitions of a memory-one pairing at once.
+
+For players whose behaviour is entirely described by a four-vector
+(P(C|CC), P(C|CD), P(C|DC), P(C|DD)) and an initial action, the actions of
+every repetition of a match can be computed simultaneously as NumPy arrays of
+shape (repetitions, turns). Actions are encoded with their values: C is 0 and
+D is 1.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from axelrod.action import Action
+from axelrod.random_ import RandomGenerator
+from axelrod.strategies.memoryone import MemoryOnePlayer, WinStayLoseShift
+
+C, D = Action.C, Action.D
+
+STATES = [(C, C), (C, D), (D, C), (D, D)]
+
+
+def memory_one_parameters(player) -> Optional[Tuple[np.ndarray, Action]]:
+    """
+    Returns the four-vector (as an array) and the initial action of a player
+    that can be played by the batch engine, or None if the player's strategy
+    is not exactly described by a four-vector.
+
+    Parameters
+    ----------
+    player : axelrod.Player
+
+    Returns
+    -------
+    tuple or None
+        (four_vector, initial action)
+    """
+    if type(player).strategy is MemoryOnePlayer.strategy:
+        four_vector = np.array([player._four_vector[s] for s in STATES])
+        return four_vector, player._initial
+    if type(player).strategy is WinStayLoseShift.strategy:
+        return np.array([1, 0, 0, 1]), C
+    return None
+
+
+def is_batchable(players) -> bool:
+    """Determines if a pair of players can be played by the batch engine."""
+    return all(memory_one_parameters(player) is not None for player in players)
+
+
+def play_memory_one_batch(
+    players, turns: int, repetitions: int, noise: float = 0, random=None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Plays every repetition of a match between two memory-one players at once.
+
+    All random values (the players' Bernoulli draws and the noise flips) are
+    sampled in bulk before play starts.
+
+    Parameters
+    ----------
+    players : tuple
+        A pair of axelrod.Player objects for which `is_batchable` holds
+    turns : integer
+        The number of turns per match
+    repetitions : integer
+        The number of matches to play
+    noise : float
+        The probability that a player's intended action should be flipped
+    random : axelrod.RandomGenerator
+        The random generator used to sample actions and noise. An unseeded
+        generator is used if none is given.
+
+    Returns
+    -------
+    tuple
+        Two arrays of shape (repetitions, turns) holding the actions of the
+        first and second player, encoded as 0 (C) and 1 (D).
+    """
+    parameters = [memory_one_parameters(player) for player in players]
+    if any(p is None for p in parameters):
+        raise ValueError("Both players must be memory-one players.")
+    (vector, initial), (covector, coinitial) = parameters
+    if random is None:
+        random = RandomGenerator()
+
+    plays = np.empty((repetitions, turns), dtype=np.int8)
+    coplays = np.empty((repetitions, turns), dtype=np.int8)
+    if turns == 0:
+        return plays, coplays
+
+    draws = None
+    if any(0 < p < 1 for p in np.concatenate([vector, covector])):
+        draws = random.random(turns - 1, 2, repetitions)
+    flips = None
+    if noise:
+        flips = random.random(turns, 2, repetitions) < noise
+
+    plays[:, 0] = initial.value
+    coplays[:, 0] = coinitial.value
+    if flips is not None:
+        plays[:, 0] ^= flips[0, 0]
+        coplays[:, 0] ^= flips[0, 1]
+
+    for turn in range(1, turns):
+        last_play, last_coplay = plays[:, turn - 1], coplays[:, turn - 1]
+        # The state index matches the order of STATES: 2 * own + opponent
+        p = vector[2 * last_play + last_coplay]
+        q = covector[2 * last_coplay + last_play]
+        if draws is None:
+            plays[:, turn] = p < 1
+            coplays[:, turn] = q < 1
+        else:
+            plays[:, turn] = draws[turn - 1, 0] >= p
+            coplays[:, turn] = draws[turn - 1, 1] >= q
+        if flips is not None:
+            plays[:, turn] ^= flips[turn, 0]
+            coplays[:, turn] ^= flips[turn, 1]
+
+    return plays, coplays
+
+
+def batch_to_interactions(plays, coplays) -> List[List[Tuple[Action, Action]]]:
+    """
+    Converts the arrays returned by `play_memory_one_batch` to a list of
+    interactions, one per repetition:
+
+        [[(C, D), (D, C),...], ...]
+    """
+    actions = (C, D)
+    return [
+        [(actions[a], actions[b]) for a, b in zip(row, corow)]
+        for row, corow in zip(plays.tolist(), coplays.tolist())
+    ]
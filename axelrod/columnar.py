@@ -0,0 +1,409 @@
+"""
+A binary, column oriented format for the interactions of a tournament.
+
+The CSV file written by a tournament holds one row per player per
+interaction, formatting the actions of every match as strings and every
+result as text, which `ResultSet` then parses back. The columnar format
+holds the same rows in a directory of NumPy `.npy` files, one per column,
+which are written in bulk for each chunk of matches and read back with
+memory maps:
+
+    interaction_index.npy, player_index.npy, ..., good_partner.npy
+    actions.npy
+
+The actions of the matches are not stored in the rows: `actions.npy` is a
+blob of the packed interactions of every match (see `PackedInteractions`)
+and the rows hold the offset and length of their match in the blob. The two
+rows of an interaction are consecutive, the first being that of the first
+player of the match.
+"""
+
+import os
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from axelrod.action import Action
+from axelrod.packed_interactions import PackedInteractions
+
+C, D = Action.C, Action.D
+
+# The columns of the rows and their types, in the order of the CSV header
+INDEX_COLUMNS = [
+    ("Interaction index", np.int64),
+    ("Player index", np.int64),
+    ("Opponent index", np.int64),
+    ("Repetition", np.int64),
+]
+RESULT_COLUMNS = [
+    ("Score", np.float64),
+    ("Score difference", np.float64),
+    ("Turns", np.int64),
+    ("Score per turn", np.float64),
+    ("Score difference per turn", np.float64),
+    ("Win", np.int64),
+    ("Initial cooperation", np.bool_),
+    ("Cooperation count", np.int64),
+    ("CC count", np.int64),
+    ("CD count", np.int64),
+    ("DC count", np.int64),
+    ("DD count", np.int64),
+    ("CC to C count", np.int64),
+    ("CC to D count", np.int64),
+    ("CD to C count", np.int64),
+    ("CD to D count", np.int64),
+    ("DC to C count", np.int64),
+    ("DC to D count", np.int64),
+    ("DD to C count", np.int64),
+    ("DD to D count", np.int64),
+    ("Good partner", np.int64),
+]
+ACTIONS_COLUMNS = [
+    ("Actions offset", np.int64),
+    ("Actions length", np.int64),
+]
+ACTIONS_FILE = "actions.npy"
+
+# The states of a match seen by each of its players
+_STATES = (
+    [(C, C), (C, D), (D, C), (D, D)],
+    [(C, C), (D, C), (C, D), (D, D)],
+)
+
+# The .npy headers are written with a fixed size, so that the length of a
+# column can be filled in once all of its rows have been written.
+_MAGIC = b"\x93NUMPY\x01\x00"
+_HEADER_SIZE = 128
+
+
+def column_file_name(column: str) -> str:
+    """Returns the name of the file holding a column."""
+    return column.lower().replace(" ", "_") + ".npy"
+
+
+def is_columnar(filename: str) -> bool:
+    """Whether a path is a directory of interactions in the columnar
+    format."""
+    return os.path.isfile(os.path.join(filename, ACTIONS_FILE))
+
+
+def has_results(directory: str) -> bool:
+    """Whether a directory in the columnar format holds the results of the
+    interactions, and not only their actions."""
+    return os.path.isfile(os.path.join(directory, column_file_name("Score")))
+
+
+def _write_header(io, dtype, length: int) -> None:
+    """Writes the header of a one dimensional .npy file at the start of a
+    file."""
+    header = repr(
+        {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+            "fortran_order": False,
+            "shape": (length,),
+        }
+    )
+    padding = _HEADER_SIZE - len(_MAGIC) - 2 - len(header) - 1
+    header = (header + " " * padding + "\n").encode("latin1")
+    io.seek(0)
+    io.write(_MAGIC + np.uint16(len(header)).tobytes() + header)
+
+
+def chunk_columns(results, interaction_index: int, build_results=True):
+    """
+    Returns the rows of the output dictionary of a chunk of matches, without
+    their actions, as lists of column values.
+
+    Parameters
+    ----------
+    results : dict
+        Mapping player index pairs to lists of [interactions, results] pairs,
+        as returned by `Tournament._play_matches`
+    interaction_index : int
+        The index of the first interaction
+    build_results : bool
+        Whether or not the results of the matches are included
+
+    Returns
+    -------
+    tuple
+        A dictionary mapping column names to lists of values, and the list
+        of the interactions of the matches
+    """
+    column_types = (
+        INDEX_COLUMNS + RESULT_COLUMNS if build_results else INDEX_COLUMNS
+    )
+    columns = {column: [] for column, _ in column_types}
+    interactions_list = []
+    for index_pair, interactions in results.items():
+        for repetition, (interaction, match_results) in enumerate(interactions):
+            interactions_list.append(interaction)
+            for index, player_index in enumerate(index_pair):
+                columns["Interaction index"].append(interaction_index)
+                columns["Player index"].append(player_index)
+                columns["Opponent index"].append(index_pair[index - 1])
+                columns["Repetition"].append(repetition)
+                if build_results:
+                    _append_results(columns, index, match_results)
+            interaction_index += 1
+    return columns, interactions_list
+
+
+def _append_results(columns, index: int, match_results) -> None:
+    """Appends the results of a match for one of its players."""
+    (
+        scores,
+        score_diffs,
+        turns,
+        score_per_turns,
+        score_diffs_per_turns,
+        initial_cooperation,
+        cooperations,
+        state_distribution,
+        state_to_action_distributions,
+        winner_index,
+    ) = match_results
+    columns["Score"].append(scores[index])
+    columns["Score difference"].append(score_diffs[index])
+    columns["Turns"].append(turns)
+    columns["Score per turn"].append(score_per_turns[index])
+    columns["Score difference per turn"].append(score_diffs_per_turns[index])
+    columns["Win"].append(int(winner_index is index))
+    columns["Initial cooperation"].append(initial_cooperation[index])
+    columns["Cooperation count"].append(cooperations[index])
+    distribution = state_to_action_distributions[index]
+    for name, state in zip(["CC", "CD", "DC", "DD"], _STATES[index]):
+        columns[name + " count"].append(state_distribution[state])
+        columns[name + " to C count"].append(distribution[(state, C)])
+        columns[name + " to D count"].append(distribution[(state, D)])
+    columns["Good partner"].append(
+        int(cooperations[index] >= cooperations[index - 1])
+    )
+
+
+class ColumnarWriter(object):
+    """
+    Writes the interactions of a tournament to a directory in the columnar
+    format. The lengths of the columns are only written by `close`.
+
+    Parameters
+    ----------
+    directory : string
+        The directory to write to. It is created if it does not exist.
+    build_results : bool
+        Whether or not the results of the matches are written
+    position : list
+        The number of rows and the size of the actions of a directory
+        written by a previous writer, as returned by `position`, to append to
+        it. Anything written after that position is discarded.
+    """
+
+    def __init__(
+        self, directory: str, build_results: bool = True, position=None
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.build_results = build_results
+        self.columns = INDEX_COLUMNS + ACTIONS_COLUMNS
+        if build_results:
+            self.columns = INDEX_COLUMNS + RESULT_COLUMNS + ACTIONS_COLUMNS
+        self.rows, self.actions_size = position or (0, 0)
+        self._files = {}
+        for column, dtype in self.columns + [(ACTIONS_FILE, np.uint8)]:
+            name = (
+                column if column == ACTIONS_FILE else column_file_name(column)
+            )
+            if position is None:
+                io = open(os.path.join(directory, name), "wb")
+                _write_header(io, dtype, 0)
+            else:
+                length = self.rows
+                if column == ACTIONS_FILE:
+                    length = self.actions_size
+                io = open(os.path.join(directory, name), "r+b")
+                io.truncate(_HEADER_SIZE + length * np.dtype(dtype).itemsize)
+                io.seek(0, os.SEEK_END)
+            self._files[column] = io
+
+    def position(self) -> List[int]:
+        """Returns the number of rows and the size of the actions written,
+        once they have been flushed to their files."""
+        for io in self._files.values():
+            io.flush()
+        return [self.rows, self.actions_size]
+
+    def write_interactions(self, results, interaction_index: int) -> int:
+        """
+        Writes the output dictionary of a chunk of matches.
+
+        Parameters
+        ----------
+        results : dict
+            Mapping player index pairs to lists of [interactions, results]
+            pairs, as returned by `Tournament._play_matches`
+        interaction_index : int
+            The index of the first interaction
+
+        Returns
+        -------
+        int
+            The number of interactions written
+        """
+        columns, interactions = chunk_columns(
+            results, interaction_index, self.build_results
+        )
+        blobs = [interaction.to_bytes() for interaction in interactions]
+        sizes = np.array([len(blob) for blob in blobs], dtype=np.int64)
+        offsets = self.actions_size + np.cumsum(sizes) - sizes
+        lengths = [len(interaction) for interaction in interactions]
+        columns["Actions offset"] = np.repeat(offsets, 2)
+        columns["Actions length"] = np.repeat(lengths, 2)
+
+        for column, dtype in self.columns:
+            np.asarray(columns[column], dtype=dtype).tofile(self._files[column])
+        self._files[ACTIONS_FILE].write(b"".join(blobs))
+        self.rows += 2 * len(interactions)
+        self.actions_size += int(sizes.sum())
+        return len(interactions)
+
+    def close(self) -> None:
+        """Writes the lengths of the columns and closes their files."""
+        for column, dtype in self.columns:
+            _write_header(self._files[column], dtype, self.rows)
+        _write_header(self._files[ACTIONS_FILE], np.uint8, self.actions_size)
+        for io in self._files.values():
+            io.close()
+        self._files = {}
+
+
+class ColumnStore(object):
+    """
+    Holds the results of the interactions of a tournament in memory, in the
+    columns of the columnar format other than those of the actions. This
+    lets a ResultSet be built without writing or reading an output file.
+    """
+
+    def __init__(self) -> None:
+        self.columns = INDEX_COLUMNS + RESULT_COLUMNS
+        self._arrays = {column: [] for column, _ in self.columns}
+
+    def write_interactions(self, results, interaction_index: int) -> int:
+        """
+        Stores the results of the output dictionary of a chunk of matches.
+
+        Parameters
+        ----------
+        results : dict
+            Mapping player index pairs to lists of [interactions, results]
+            pairs, as returned by `Tournament._play_matches`. The
+            interactions are not used and can be None.
+        interaction_index : int
+            The index of the first interaction
+
+        Returns
+        -------
+        int
+            The number of interactions stored
+        """
+        columns, interactions = chunk_columns(results, interaction_index)
+        for column, dtype in self.columns:
+            self._arrays[column].append(np.asarray(columns[column], dtype))
+        return len(interactions)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Returns the stored rows."""
+        return pd.DataFrame(
+            {
+                column: np.concatenate(
+                    self._arrays[column] + [np.empty(0, dtype)]
+                )
+                for column, dtype in self.columns
+            }
+        )
+
+
+def read_position(directory: str) -> List[int]:
+    """
+    Returns the number of rows and the size of the actions of a directory in
+    the columnar format, which is the position at which a ColumnarWriter
+    appends to it.
+
+    Parameters
+    ----------
+    directory : string
+        A directory written by a ColumnarWriter
+    """
+    rows = np.load(
+        os.path.join(directory, column_file_name("Player index")),
+        mmap_mode="r",
+    )
+    actions = np.load(os.path.join(directory, ACTIONS_FILE), mmap_mode="r")
+    return [len(rows), len(actions)]
+
+
+def read_columns(directory: str) -> pd.DataFrame:
+    """
+    Reads the rows of a directory in the columnar format.
+
+    Parameters
+    ----------
+    directory : string
+        A directory written by a ColumnarWriter
+
+    Returns
+    -------
+    pandas.DataFrame
+        The rows, with the columns of the CSV format other than the names of
+        the players and their actions
+    """
+    data = {}
+    for column, _ in INDEX_COLUMNS + RESULT_COLUMNS + ACTIONS_COLUMNS:
+        path = os.path.join(directory, column_file_name(column))
+        if os.path.exists(path):
+            data[column] = np.load(path, mmap_mode="r")
+    return pd.DataFrame(data)
+
+
+def read_interactions(directory: str) -> Dict[Tuple[int, int], List]:
+    """
+    Reads the interactions of a directory in the columnar format.
+
+    Parameters
+    ----------
+    directory : string
+        A directory written by a ColumnarWriter
+
+    Returns
+    -------
+    dict
+        Mapping tuples of player indices to lists of interactions
+    """
+    players = np.load(
+        os.path.join(directory, column_file_name("Player index")),
+        mmap_mode="r",
+    )[::2]
+    opponents = np.load(
+        os.path.join(directory, column_file_name("Opponent index")),
+        mmap_mode="r",
+    )[::2]
+    offsets = np.load(
+        os.path.join(directory, column_file_name("Actions offset")),
+        mmap_mode="r",
+    )[::2]
+    lengths = np.load(
+        os.path.join(directory, column_file_name("Actions length")),
+        mmap_mode="r",
+    )[::2]
+    actions = np.load(os.path.join(directory, ACTIONS_FILE), mmap_mode="r")
+
+    pairs_to_interactions = defaultdict(list)
+    for player, opponent, offset, length in zip(
+        players.tolist(), opponents.tolist(), offsets.tolist(), lengths.tolist()
+    ):
+        size = (2 * length + 7) // 8
+        interaction = PackedInteractions.from_bytes(
+            length, actions[offset : offset + size].tobytes()
+        )
+        pairs_to_interactions[(player, opponent)].append(interaction.to_list())
+    return pairs_to_interactions
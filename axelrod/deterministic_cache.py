@@ -14,11 +14,12 @@ else:
 
 import pickle
 from collections import UserDict
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from axelrod import Classifiers
 
 from .action import Action
+from .packed_interactions import PackedInteractions
 from .player import Player
 
 CachePlayerKey = Tuple[Player, Player]
@@ -28,12 +29,15 @@ CacheKey = Tuple[str, str]
 def _key_transform(key: CachePlayerKey) -> CacheKey:
     """Convert a CachePlayerKey to a CacheKey
 
+    The representation of the players is used rather than their name, so
+    that players with different parameters are not confused.
+
     Parameters
     ----------
     key: tuple
-        A 3-tuple: (player instance, player instance)
+        A 2-tuple: (player instance, player instance)
     """
-    return key[0].name, key[1].name
+    return repr(key[0]), repr(key[1])
 
 
 def _is_valid_key(key: CachePlayerKey) -> bool:
@@ -62,10 +66,60 @@ def _is_valid_key(key: CachePlayerKey) -> bool:
     return True
 
 
+class CyclicInteractions(object):
+    """The interactions of a deterministic match that repeats a cycle.
+
+    Deterministic matches eventually revisit a joint state of both players,
+    after which play repeats. Such a match is fully described by the
+    interactions before the cycle starts (the prefix) and one repetition of
+    the cycle, and can be expanded to any number of turns.
+    """
+
+    def __init__(
+        self,
+        prefix: List[Tuple[Action, Action]],
+        cycle: List[Tuple[Action, Action]],
+    ) -> None:
+        if not cycle:
+            raise ValueError("The cycle must not be empty.")
+        self.prefix = list(prefix)
+        self.cycle = list(cycle)
+
+    def expand(self, turns: int) -> List[Tuple[Action, Action]]:
+        """Returns the list of interactions of a match of the given length."""
+        if turns <= len(self.prefix):
+            return self.prefix[:turns]
+        remaining = turns - len(self.prefix)
+        repetitions, extra = divmod(remaining, len(self.cycle))
+        return self.prefix + self.cycle * repetitions + self.cycle[:extra]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.stop is None or key.stop < 0:
+                raise ValueError("Slices must have a non negative stop.")
+            return self.expand(key.stop)[key]
+        if key < 0:
+            raise IndexError("Cyclic interactions have no end.")
+        if key < len(self.prefix):
+            return self.prefix[key]
+        return self.cycle[(key - len(self.prefix)) % len(self.cycle)]
+
+    def __eq__(self, other):
+        if not isinstance(other, CyclicInteractions):
+            return False
+        return self.prefix == other.prefix and self.cycle == other.cycle
+
+    def __repr__(self):
+        return "CyclicInteractions(prefix={}, cycle={})".format(
+            self.prefix, self.cycle
+        )
+
+
 def _is_valid_value(value: List) -> bool:
     """Validate a deterministic cache value.
 
-    The value just needs to be a list, with any contents.
+    The value needs to be a list, with any contents, or an instance of
+    PackedInteractions or CyclicInteractions.
 
     Parameters
     ----------
@@ -75,7 +129,7 @@ def _is_valid_value(value: List) -> bool:
     -------
     Boolean indicating if the value is valid
     """
-    return isinstance(value, list)
+    return isinstance(value, (list, PackedInteractions, CyclicInteractions))
 
 
 class DeterministicCache(UserDict):
@@ -90,11 +144,24 @@ class DeterministicCache(UserDict):
     By also storing those cached results in a file, we can re-use the cache
     between multiple tournaments if necessary.
 
-    The cache is a dictionary mapping pairs of Player classes to a list of
-    resulting interactions. e.g. for a 3 turn Match between Cooperator and
-    Alternator, the dictionary entry would be:
+    The cache is a dictionary mapping pairs of players (stored using their
+    representations) to a list of resulting interactions. e.g. for a 3 turn
+    Match between Cooperator and Alternator, the dictionary entry would be:
+
+    ("Cooperator", "Alternator"): [(C, C), (C, D), (C, C)]
+
+    Matches that were found to repeat a cycle are stored as
+    CyclicInteractions, which can provide the results of a match of any
+    length.
 
-    (axelrod.Cooperator, axelrod.Alternator): [(C, C), (C, D), (C, C)]
+    When saved to a file, lists of interactions are stored as
+    PackedInteractions, using two bits per turn.
+
+    Snapshots of the players (see `Player.snapshot`) taken at the end of the
+    cached interactions can be stored alongside an entry, so that a longer
+    match can continue from the end of the cached interactions rather than
+    replay them. Snapshots are only held in memory: they are discarded when
+    the entry changes and are not saved to file.
 
     Most of the functionality is provided by the UserDict class (which uses an
     instance of dict as the 'data' attribute to hold the dictionary entries).
@@ -114,17 +181,24 @@ class DeterministicCache(UserDict):
         """
         super().__init__()
         self.mutable = True
+        self._snapshots = {}  # type: Dict[CacheKey, Tuple[Dict, Dict]]
         if file_name is not None:
             self.load(file_name)
 
+    def _transform_key(self, key: CachePlayerKey):
+        """Returns the key under which the entry for a pair of players is
+        stored."""
+        return _key_transform(key)
+
     def __delitem__(self, key: CachePlayerKey):
-        return super().__delitem__(_key_transform(key))
+        self._snapshots.pop(self._transform_key(key), None)
+        return super().__delitem__(self._transform_key(key))
 
     def __getitem__(self, key: CachePlayerKey) -> List[Tuple[Action, Action]]:
-        return super().__getitem__(_key_transform(key))
+        return super().__getitem__(self._transform_key(key))
 
     def __contains__(self, key):
-        return super().__contains__(_key_transform(key))
+        return super().__contains__(self._transform_key(key))
 
     def __setitem__(self, key: CachePlayerKey, value):
         """Validate the key and value before setting them."""
@@ -141,7 +215,33 @@ class DeterministicCache(UserDict):
                 "Value must be a list with length equal to turns attribute"
             )
 
-        super().__setitem__(_key_transform(key), value)
+        self._snapshots.pop(self._transform_key(key), None)
+        super().__setitem__(self._transform_key(key), value)
+
+    def get_snapshots(self, key: CachePlayerKey) -> Optional[Tuple[Dict, Dict]]:
+        """Returns the snapshots of the players at the end of the cached
+        interactions for a key, or None if there are none."""
+        return self._snapshots.get(self._transform_key(key))
+
+    def set_snapshots(
+        self, key: CachePlayerKey, snapshots: Tuple[Dict, Dict]
+    ) -> None:
+        """
+        Stores the snapshots of the players at the end of the cached
+        interactions for a key.
+
+        Parameters
+        ----------
+        key : tuple
+            A pair of players with an entry in the cache
+        snapshots : tuple
+            The snapshots of both players, as returned by `Player.snapshot`
+        """
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+        if key not in self:
+            raise KeyError("Snapshots can only be stored for cached entries.")
+        self._snapshots[self._transform_key(key)] = tuple(snapshots)
 
     def save(self, file_name: str) -> bool:
         """Serialise the cache dictionary to a file.
@@ -151,8 +251,14 @@ class DeterministicCache(UserDict):
         file_name : string
             File path to which the cache should be saved
         """
+        data = {
+            key: PackedInteractions.from_interactions(value)
+            if isinstance(value, list)
+            else value
+            for key, value in self.data.items()
+        }
         with open(file_name, "wb") as io:
-            pickle.dump(self.data, io)
+            pickle.dump(data, io)
         return True
 
     def load(self, file_name: str) -> bool:
@@ -167,10 +273,76 @@ class DeterministicCache(UserDict):
             data = pickle.load(io)
 
         if isinstance(data, dict):
-            self.data = data
+            self._snapshots = {}
+            self.data = {
+                key: value.to_list()
+                if isinstance(value, PackedInteractions)
+                else value
+                for key, value in data.items()
+            }
         else:
             raise ValueError(
                 "Cache file exists but is not the correct format. "
                 "Try deleting and re-building the cache file."
             )
         return True
+
+
+class SharedCache(DeterministicCache):
+    """A DeterministicCache holding its entries as PackedInteractions in a
+    dictionary that can be shared between processes.
+
+    Tournaments use a single shared cache for all of their matches, so that
+    each distinct pairing of deterministic players is only played once. In a
+    parallel tournament the dictionary is a proxy to a dictionary held by a
+    `multiprocessing.Manager`, which is used by all worker processes. Packing
+    the entries keeps both the memory used by the cache and the cost of
+    sending entries between processes small.
+
+    Each process also holds the unpacked entries it has used, and snapshots
+    of the players, until `clear_local` is called (for example at the end of
+    a chunk of repetitions of the same match).
+
+    Parameters
+    ----------
+    data : dict
+        The dictionary holding the entries, for example a
+        `multiprocessing.managers.DictProxy`. Defaults to a new dictionary.
+    """
+
+    def __init__(self, data=None) -> None:
+        super().__init__()
+        if data is not None:
+            self.data = data
+        self._local = {}  # type: Dict[CacheKey, List[Tuple[Action, Action]]]
+
+    def __contains__(self, key):
+        return self._transform_key(key) in self._local or super().__contains__(
+            key
+        )
+
+    def __getitem__(self, key: CachePlayerKey):
+        transformed_key = self._transform_key(key)
+        if transformed_key not in self._local:
+            value = super().__getitem__(key)
+            if isinstance(value, PackedInteractions):
+                value = value.to_list()
+            self._local[transformed_key] = value
+        return self._local[transformed_key]
+
+    def __setitem__(self, key: CachePlayerKey, value):
+        packed = value
+        if isinstance(value, list) and _is_valid_key(key):
+            packed = PackedInteractions.from_interactions(value)
+        super().__setitem__(key, packed)
+        self._local[self._transform_key(key)] = value
+
+    def __delitem__(self, key: CachePlayerKey):
+        self._local.pop(self._transform_key(key), None)
+        return super().__delitem__(key)
+
+    def clear_local(self) -> None:
+        """Discards the unpacked entries and the snapshots of the players
+        held by this process."""
+        self._local = {}
+        self._snapshots = {}
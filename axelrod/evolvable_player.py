@@ -21,6 +21,8 @@ class EvolvablePlayer(Player):
     name = "EvolvablePlayer"
     parent_class = Player
     parent_kwargs = []  # type: List[str]
+    # __init__ seeds the player, so reset always calls it
+    _fast_reset_subclasses = False
 
     def __init__(self, seed=None):
         # Parameter seed is required for reproducibility. Player will throw
@@ -441,6 +441,7 @@ class TransitiveFingerprint(object):
         filename: str = None,
         progress_bar: bool = True,
         seed: int = None,
+        max_repetitions: int = None,
     ) -> np.ndarray:
         """Creates a spatial tournament to run the necessary matches to obtain
         fingerprint data.
@@ -462,6 +463,10 @@ class TransitiveFingerprint(object):
             if None, a filename will be generated.
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
+        max_repetitions : int, optional
+            The maximum number of repetitions against an opponent played
+            together, so that the repetitions against few opponents can be
+            shared between processes
 
         Returns
         ----------
@@ -488,6 +493,7 @@ class TransitiveFingerprint(object):
             noise=noise,
             repetitions=repetitions,
             seed=seed,
+            max_repetitions=max_repetitions,
         )
         tournament.play(
             filename=filename,
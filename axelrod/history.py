@@ -1,17 +1,57 @@
+import copy
 from collections import Counter
 
 from axelrod.action import Action, actions_to_str
 
 C, D = Action.C, Action.D
 
+# The states of play, indexed by their integer codes: 2 * play + coplay
+STATES = [(C, C), (C, D), (D, C), (D, D)]
+
+# The number of plays held in the rolling codes of a history
+CODE_DEPTH = 64
+_CODE_MASK = (1 << CODE_DEPTH) - 1
+
+
+def encode_actions(actions):
+    """Encodes a sequence of actions as an integer, with one bit per action
+    (0 for C and 1 for D) and the last action in the lowest bit.
+
+    For example, (D, C, D, D) is encoded as 0b1011. Sequences of the same
+    length are ordered by their codes as by `itertools.product((C, D))`.
+    """
+    code = 0
+    for action in actions:
+        code = (code << 1) | (action is D)
+    return code
+
 
 class History(object):
     """
     History class to track the history of play and metadata including
     the number of cooperations and defections, and if available, the
     opponents plays and the state distribution of the history of play.
+
+    Counts are held as integers indexed by the codes of actions (0 for C and
+    1 for D) rather than in Counters keyed by actions, and the state
+    distribution is only built as a Counter when it is requested. The
+    attributes are declared in `__slots__`, which makes them faster to access
+    on every turn.
+
+    The history also keeps the codes (see `encode_actions`) of its last and
+    first `CODE_DEPTH` plays, so that strategies can read their recent plays
+    or openings as a single integer.
     """
 
+    __slots__ = (
+        "_plays",
+        "_coplays",
+        "_defections",
+        "_state_counts",
+        "_code",
+        "_opening_code",
+    )
+
     def __init__(self, plays=None, coplays=None):
         """
         Parameters
@@ -25,8 +65,10 @@ class History(object):
         # Coplays is tracked mainly for computation of the state distribution
         # when cloning or dualing.
         self._coplays = []
-        self._actions = Counter()
-        self._state_distribution = Counter()
+        self._defections = 0
+        self._state_counts = [0] * 4
+        self._code = 0
+        self._opening_code = 0
         if plays:
             self.extend(plays, coplays)
 
@@ -34,33 +76,68 @@ class History(object):
         """Appends a new (play, coplay) pair an updates metadata for
         number of cooperations and defections, and the state distribution."""
         self._plays.append(play)
-        self._actions[play] += 1
         self._coplays.append(coplay)
-        self._state_distribution[(play, coplay)] += 1
+        defection = play is D
+        self._defections += defection
+        self._state_counts[2 * defection + (coplay is D)] += 1
+        self._code = ((self._code << 1) | defection) & _CODE_MASK
+        if len(self._plays) <= CODE_DEPTH:
+            self._opening_code = self._code
 
     def copy(self):
         """Returns a new object with the same data."""
-        return self.__class__(plays=self._plays, coplays=self._coplays)
+        new_history = copy.copy(self)
+        new_history._plays = self._plays.copy()
+        new_history._coplays = self._coplays.copy()
+        new_history._state_counts = self._state_counts.copy()
+        return new_history
 
     def flip_plays(self):
         """Creates a flipped plays history for use with DualTransformer."""
         flipped_plays = [action.flip() for action in self._plays]
         return self.__class__(plays=flipped_plays, coplays=self._coplays)
 
+    def flipped(self):
+        """Returns a view of the history with flipped plays, sharing its
+        storage (see FlippedHistory)."""
+        return FlippedHistory(self)
+
     def extend(self, plays, coplays):
         """A function that emulates list.extend."""
         # We could repeatedly call self.append but this is more efficient.
         self._plays.extend(plays)
-        self._actions.update(plays)
         self._coplays.extend(coplays)
-        self._state_distribution.update(zip(plays, coplays))
+        self._defections += sum(play is D for play in plays)
+        for play, coplay in zip(plays, coplays):
+            self._state_counts[2 * (play is D) + (coplay is D)] += 1
+        self._code = encode_actions(self._plays[-CODE_DEPTH:])
+        self._opening_code = encode_actions(self._plays[:CODE_DEPTH])
 
     def reset(self):
         """Clears all data in the History object."""
         self._plays.clear()
         self._coplays.clear()
-        self._actions.clear()
-        self._state_distribution.clear()
+        self._defections = 0
+        self._state_counts = [0] * 4
+        self._code = 0
+        self._opening_code = 0
+
+    def recent_code(self, depth):
+        """Returns the code of the last `depth` plays (see `encode_actions`).
+
+        Plays before the start of the history are encoded as C.
+        """
+        if depth <= CODE_DEPTH:
+            return self._code & ((1 << depth) - 1)
+        return encode_actions(self[-depth:])
+
+    def opening_code(self, depth):
+        """Returns the code of the first `depth` plays (see
+        `encode_actions`), or of the whole history if it is shorter."""
+        length = min(len(self._plays), CODE_DEPTH)
+        if depth <= length:
+            return self._opening_code >> (length - depth)
+        return encode_actions(self[:depth])
 
     @property
     def coplays(self):
@@ -68,22 +145,29 @@ class History(object):
 
     @property
     def cooperations(self):
-        return self._actions[C]
+        return len(self._plays) - self._defections
 
     @property
     def defections(self):
-        return self._actions[D]
+        return self._defections
 
     @property
     def state_distribution(self):
-        return self._state_distribution
+        return Counter(
+            {
+                state: count
+                for state, count in zip(STATES, self._state_counts)
+                if count
+            }
+        )
 
     def __eq__(self, other):
         if isinstance(other, list):
-            return self._plays == other
+            return self.__list__() == other
         elif isinstance(other, History):
             return (
-                self._plays == other._plays and self._coplays == other._coplays
+                self.__list__() == other.__list__()
+                and self.coplays == other.coplays
             )
         raise TypeError("Cannot compare types.")
 
@@ -91,6 +175,9 @@ class History(object):
         # Passthrough keys and slice objects
         return self._plays[key]
 
+    def __iter__(self):
+        return iter(self._plays)
+
     def __str__(self):
         return actions_to_str(self._plays)
 
@@ -108,8 +195,13 @@ class LimitedHistory(History):
     """
     History class that only tracks the last N rounds. Used for testing memory
     depth.
+
+    Rounds are held in ring buffers of length N: once the history is full,
+    appending a round overwrites the oldest one in constant time.
     """
 
+    __slots__ = ("memory_depth", "_start", "_dropped_states")
+
     def __init__(self, memory_depth, plays=None, coplays=None):
         """
         Parameters
@@ -117,26 +209,195 @@ class LimitedHistory(History):
         memory_depth, int:
             length of history to retain
         """
-        super().__init__(plays=plays, coplays=coplays)
         self.memory_depth = memory_depth
+        # The index of the oldest round in the buffers
+        self._start = 0
+        # A bit for each state that has been dropped from the buffers
+        self._dropped_states = 0
+        super().__init__(plays=plays, coplays=coplays)
+
+    def _ordered(self, values):
+        """Returns the values of a buffer from the oldest to the newest."""
+        start = self._start
+        if not start:
+            return values
+        return values[start:] + values[:start]
 
     def flip_plays(self):
         """Creates a flipped plays history for use with DualTransformer."""
-        flipped_plays = [action.flip() for action in self._plays]
+        flipped_plays = [action.flip() for action in self]
         return self.__class__(
-            self.memory_depth, plays=flipped_plays, coplays=self._coplays
+            self.memory_depth, plays=flipped_plays, coplays=self.coplays
         )
 
+    def extend(self, plays, coplays):
+        """A function that emulates list.extend."""
+        for play, coplay in zip(plays, coplays):
+            self.append(play, coplay)
+
     def append(self, play, coplay):
         """Appends a new (play, coplay) pair an updates metadata for
         number of cooperations and defections, and the state distribution."""
-
-        self._plays.append(play)
-        self._actions[play] += 1
-        if coplay:
+        if self.memory_depth <= 0:
+            return
+        if len(self._plays) < self.memory_depth:
+            self._plays.append(play)
             self._coplays.append(coplay)
-            self._state_distribution[(play, coplay)] += 1
-        if len(self._plays) > self.memory_depth:
-            first_play, first_coplay = self._plays.pop(0), self._coplays.pop(0)
-            self._actions[first_play] -= 1
-            self._state_distribution[(first_play, first_coplay)] -= 1
+        else:
+            start = self._start
+            first_play, first_coplay = self._plays[start], self._coplays[start]
+            self._defections -= first_play is D
+            if first_coplay is not None:
+                state = 2 * (first_play is D) + (first_coplay is D)
+                self._state_counts[state] -= 1
+                self._dropped_states |= 1 << state
+            self._plays[start] = play
+            self._coplays[start] = coplay
+            self._start = (start + 1) % len(self._plays)
+        self._defections += play is D
+        if coplay is not None:
+            self._state_counts[2 * (play is D) + (coplay is D)] += 1
+        self._code = ((self._code << 1) | (play is D)) & _CODE_MASK
+
+    def reset(self):
+        """Clears all data in the History object."""
+        super().reset()
+        self._start = 0
+        self._dropped_states = 0
+
+    @property
+    def state_distribution(self):
+        # States that have been dropped are kept with a count of zero
+        return Counter(
+            {
+                state: count
+                for index, (state, count) in enumerate(
+                    zip(STATES, self._state_counts)
+                )
+                if count or self._dropped_states >> index & 1
+            }
+        )
+
+    def recent_code(self, depth):
+        """Returns the code of the last `depth` retained plays."""
+        return super().recent_code(min(depth, len(self._plays)))
+
+    def opening_code(self, depth):
+        """Returns the code of the first `depth` retained plays."""
+        return encode_actions(self[:depth])
+
+    @property
+    def coplays(self):
+        return self._ordered(self._coplays)
+
+    def __getitem__(self, key):
+        if self._start and isinstance(key, int):
+            length = len(self._plays)
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError("History index out of range")
+            return self._plays[(key + self._start) % length]
+        return self._ordered(self._plays)[key]
+
+    def __iter__(self):
+        return iter(self._ordered(self._plays))
+
+    def __str__(self):
+        return actions_to_str(self)
+
+    def __list__(self):
+        return self._ordered(self._plays)
+
+
+class FlippedHistory(History):
+    """
+    A read only view of a history in which the plays are flipped, used by
+    DualTransformer.
+
+    The view shares the storage of the underlying history: plays are only
+    flipped when they are read and the counts of cooperations and defections
+    are swapped, so that creating the view and reading from it do not copy
+    the history.
+    """
+
+    __slots__ = ("_history",)
+
+    def __init__(self, history):
+        """
+        Parameters
+        ----------
+        history: History
+            The history to flip.
+        """
+        self._history = history
+
+    def append(self, play, coplay):
+        raise TypeError("A flipped history cannot be modified.")
+
+    def extend(self, plays, coplays):
+        raise TypeError("A flipped history cannot be modified.")
+
+    def reset(self):
+        raise TypeError("A flipped history cannot be modified.")
+
+    def copy(self):
+        """Returns a new History with the flipped plays."""
+        return self._history.flip_plays()
+
+    def flip_plays(self):
+        """Returns a new History with the plays of the underlying history."""
+        return self._history.copy()
+
+    def flipped(self):
+        """Returns the underlying history."""
+        return self._history
+
+    def recent_code(self, depth):
+        mask = (1 << min(depth, len(self._history))) - 1
+        return self._history.recent_code(depth) ^ mask
+
+    def opening_code(self, depth):
+        mask = (1 << min(depth, len(self._history))) - 1
+        return self._history.opening_code(depth) ^ mask
+
+    @property
+    def coplays(self):
+        return self._history.coplays
+
+    @property
+    def cooperations(self):
+        return self._history.defections
+
+    @property
+    def defections(self):
+        return self._history.cooperations
+
+    @property
+    def state_distribution(self):
+        return Counter(
+            {
+                (play.flip(), coplay): count
+                for (play, coplay), count in (
+                    self._history.state_distribution.items()
+                )
+            }
+        )
+
+    def __getitem__(self, key):
+        plays = self._history[key]
+        if isinstance(key, slice):
+            return [play.flip() for play in plays]
+        return plays.flip()
+
+    def __iter__(self):
+        return (play.flip() for play in self._history)
+
+    def __str__(self):
+        return actions_to_str(self)
+
+    def __list__(self):
+        return list(self)
+
+    def __len__(self):
+        return len(self._history)
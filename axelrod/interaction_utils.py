@@ -6,27 +6,57 @@ form:
 
 This is used by both the Match class and the ResultSet class which analyse
 interactions.
+
+All functions also accept axelrod.PackedInteractions, in which case they
+operate on the packed actions directly.
 """
 from collections import Counter, defaultdict
 
+import numpy as np
 import pandas as pd
 import tqdm
 from axelrod.action import Action, str_to_actions
 
+from .columnar import is_columnar, read_interactions
 from .game import Game
+from .packed_interactions import PackedInteractions
 
 C, D = Action.C, Action.D
 
+STATES = [(C, C), (C, D), (D, C), (D, D)]
+
+
+def _packed_state_counts(interactions):
+    """Returns the number of turns spent in each state, in the order of
+    STATES, for PackedInteractions."""
+    return np.bincount(interactions.states, minlength=4).tolist()
+
 
 def compute_scores(interactions, game=None):
     """Returns the scores of a given set of interactions."""
     if not game:
         game = Game()
+    if isinstance(interactions, PackedInteractions):
+        table = [game.score(state) for state in STATES]
+        return [table[state] for state in interactions.states.tolist()]
     return [game.score(plays) for plays in interactions]
 
 
 def compute_final_score(interactions, game=None):
     """Returns the final score of a given set of interactions."""
+    if isinstance(interactions, PackedInteractions):
+        if len(interactions) == 0:
+            return None
+        if not game:
+            game = Game()
+        counts = _packed_state_counts(interactions)
+        return tuple(
+            sum(
+                count * game.score(state)[player_index]
+                for count, state in zip(counts, STATES)
+            )
+            for player_index in [0, 1]
+        )
     scores = compute_scores(interactions, game)
     if len(scores) == 0:
         return None
@@ -40,6 +70,11 @@ def compute_final_score(interactions, game=None):
 
 def compute_final_score_per_turn(interactions, game=None):
     """Returns the mean score per round for a set of interactions"""
+    if isinstance(interactions, PackedInteractions):
+        scores = compute_final_score(interactions, game)
+        if scores is None:
+            return None
+        return tuple(score / len(interactions) for score in scores)
     scores = compute_scores(interactions, game)
     num_turns = len(interactions)
 
@@ -71,6 +106,13 @@ def compute_cooperations(interactions):
     if len(interactions) == 0:
         return None
 
+    if isinstance(interactions, PackedInteractions):
+        num_turns = len(interactions)
+        return (
+            num_turns - int(interactions.plays.sum()),
+            num_turns - int(interactions.coplays.sum()),
+        )
+
     cooperation = tuple(
         sum([play[player_index] == C for play in interactions])
         for player_index in [0, 1]
@@ -110,6 +152,11 @@ def compute_state_distribution(interactions):
     """
     if not interactions:
         return None
+    if isinstance(interactions, PackedInteractions):
+        counts = _packed_state_counts(interactions)
+        return Counter(
+            {state: count for state, count in zip(STATES, counts) if count}
+        )
     return Counter(interactions)
 
 
@@ -132,7 +179,7 @@ def compute_normalised_state_distribution(interactions):
     if not interactions:
         return None
 
-    interactions_count = Counter(interactions)
+    interactions_count = compute_state_distribution(interactions)
     total = sum(interactions_count.values(), 0)
 
     normalized_count = Counter(
@@ -173,6 +220,23 @@ def compute_state_to_action_distribution(interactions):
     if not interactions:
         return None
 
+    if isinstance(interactions, PackedInteractions):
+        states = interactions.states[:-1]
+        distributions = []
+        for actions in (interactions.plays[1:], interactions.coplays[1:]):
+            counts = np.bincount(2 * states + actions, minlength=8).tolist()
+            distributions.append(
+                Counter(
+                    {
+                        (state, action): counts[2 * i + j]
+                        for i, state in enumerate(STATES)
+                        for j, action in enumerate((C, D))
+                        if counts[2 * i + j]
+                    }
+                )
+            )
+        return distributions
+
     distributions = [
         Counter(
             [
@@ -253,9 +317,11 @@ def compute_sparklines(interactions, c_symbol="█", d_symbol=" "):
 
 def read_interactions_from_file(filename, progress_bar=True):
     """
-    Reads a file and returns a dictionary mapping tuples of player pairs to
-    lists of interactions
+    Reads a file (or a directory in the columnar format) and returns a
+    dictionary mapping tuples of player pairs to lists of interactions
     """
+    if is_columnar(filename):
+        return read_interactions(filename)
     df = pd.read_csv(filename)[
         ["Interaction index", "Player index", "Opponent index", "Actions"]
     ]
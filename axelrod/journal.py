@@ -0,0 +1,164 @@
+"""
+A journal of the pairs of players of a tournament whose interactions have
+been written, kept next to its output so that an interrupted tournament can
+be resumed.
+
+The journal is a text file of JSON lines: a header identifying the
+tournament, then a line for each pair of players once its interactions have
+been written to the output:
+
+    {"tournament": "<sha256 of the tournament parameters>"}
+    {"edge": [0, 1], "chunks": [[0, 5, 1234], [5, 5, 5678]],
+     "interactions": 10, "position": 5012}
+
+The chunks of a pair are given by their first repetition, their number of
+repetitions and their seed. The number of interactions and the position in
+the output are those once the pair had been written: when resuming, the
+output is truncated to the position of the last line of the journal, which
+discards anything written after it, and the pairs of the journal are not
+played again. As the seeds of the chunks only depend on the seed of the
+tournament, the results are those of an uninterrupted tournament.
+"""
+
+import json
+import os
+from typing import List, Optional, Set, Tuple
+
+JournalEntry = Tuple[Tuple[int, int], Tuple[int, ...]]
+
+
+def journal_file_name(filename: str) -> str:
+    """Returns the name of the journal of an output file (or columnar
+    directory)."""
+    return filename.rstrip(os.sep) + ".journal"
+
+
+def group_entry(chunks: List[Tuple]) -> JournalEntry:
+    """Returns the pair of players and the seeds of the chunks of a pair of
+    players, which identify it in a journal."""
+    return (
+        tuple(int(index) for index in chunks[0][0]),
+        tuple(int(seed) for _, _, _, seed in chunks),
+    )
+
+
+class TournamentJournal(object):
+    """
+    Records the pairs of players of a tournament that have been written to
+    its output.
+
+    Parameters
+    ----------
+    file_name : string
+        The path of the journal. An existing journal is read if it was
+        written by the same tournament, and a ValueError is raised
+        otherwise.
+    key : string
+        Identifies the parameters of the tournament
+    """
+
+    def __init__(self, file_name: str, key: str) -> None:
+        self.file_name = file_name
+        self.key = key
+        self.completed = set()  # type: Set[JournalEntry]
+        self.interactions = 0
+        self.position = None  # type: Optional[object]
+        self._io = None
+        self._lines = 0
+        self.load()
+
+    def load(self) -> None:
+        """Reads the pairs of players recorded in the journal. A last line
+        which was not completely written is ignored."""
+        if not os.path.exists(self.file_name):
+            return
+        with open(self.file_name, "r") as io:
+            lines = io.read().split("\n")
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            header = {}
+        if header.get("tournament") != self.key:
+            raise ValueError(
+                "The journal {} was written by a different "
+                "tournament.".format(self.file_name)
+            )
+        self._lines = 1
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            self.completed.add(
+                (
+                    tuple(entry["edge"]),
+                    tuple(seed for _, _, seed in entry["chunks"]),
+                )
+            )
+            self.interactions = entry["interactions"]
+            self.position = entry["position"]
+            self._lines += 1
+
+    def reset(self) -> None:
+        """Forgets the pairs of players recorded in the journal."""
+        self.completed = set()
+        self.interactions = 0
+        self.position = None
+        self._lines = 0
+        if os.path.exists(self.file_name):
+            os.remove(self.file_name)
+
+    def is_completed(self, chunks: List[Tuple]) -> bool:
+        """Whether the chunks of a pair of players have been written."""
+        return group_entry(chunks) in self.completed
+
+    def record(self, chunks: List[Tuple], interactions: int, position) -> None:
+        """
+        Records that the chunks of a pair of players have been written.
+
+        Parameters
+        ----------
+        chunks : list
+            The chunks of the pair, as built by
+            `MatchGenerator.build_match_chunk_groups`
+        interactions : int
+            The number of interactions written to the output
+        position
+            The position in the output after the interactions of the pair
+        """
+        if self._io is None:
+            new = self.position is None
+            self._io = open(self.file_name, "w" if new else "r+")
+            if new:
+                self._io.write(json.dumps({"tournament": self.key}) + "\n")
+            else:
+                # Drop a last line which was not completely written
+                self._io.seek(0)
+                lines = self._io.read().split("\n")
+                complete = lines[: self._lines]
+                self._io.seek(0)
+                self._io.write("\n".join(complete) + "\n")
+                self._io.truncate()
+        first_repetition = 0
+        chunk_list = []
+        for _, _, repetitions, seed in chunks:
+            chunk_list.append([first_repetition, repetitions, int(seed)])
+            first_repetition += repetitions
+        edge, _ = group_entry(chunks)
+        entry = {
+            "edge": list(edge),
+            "chunks": chunk_list,
+            "interactions": interactions,
+            "position": position,
+        }
+        self._io.write(json.dumps(entry) + "\n")
+        self._io.flush()
+        self.completed.add(group_entry(chunks))
+        self.interactions = interactions
+        self.position = position
+
+    def close(self) -> None:
+        """Closes the file of the journal."""
+        if self._io is not None:
+            self._io.close()
+            self._io = None
@@ -0,0 +1,232 @@
+"""
+Exact expected outcomes of matches between memory-one and memory-two players.
+
+For players whose behaviour only depends on the last two rounds of play, a
+match is a Markov chain on the joint actions of the last two rounds. Expected
+scores and cooperation rates can then be obtained exactly from the transition
+matrix of that chain rather than estimated from repeated sampling:
+
+- for a fixed number of turns the per-turn distributions are summed using
+  matrix powers,
+- for matches ending with probability `prob_end` after each turn the sum is
+  a discounted geometric series, obtained with a linear solve.
+
+States are indexed by the joint actions of two consecutive rounds
+((a, b), (c, d)) using the values of the actions: 8a + 4b + 2c + d.
+"""
+
+from collections import Counter, namedtuple
+from itertools import product
+from typing import Optional
+
+import numpy as np
+from axelrod.action import Action
+from axelrod.batch_match import memory_one_parameters
+from axelrod.game import Game
+from axelrod.strategies.memorytwo import MemoryTwoPlayer
+
+C, D = Action.C, Action.D
+
+JOINT_ACTIONS = [(C, C), (C, D), (D, C), (D, D)]
+
+ExpectedOutcome = namedtuple(
+    "ExpectedOutcome",
+    ["length", "score_per_turn", "cooperation", "state_distribution"],
+)
+
+
+class _Responder(object):
+    """The probability of cooperating of a single player given the history
+    of play."""
+
+    def __init__(self, player):
+        parameters = memory_one_parameters(player)
+        if parameters is not None:
+            four_vector, initial = parameters
+            self.memory_depth = 1
+            self.vector = dict(zip(JOINT_ACTIONS, four_vector))
+            self.initial = (initial,)
+        elif type(player).strategy is MemoryTwoPlayer.strategy:
+            self.memory_depth = 2
+            self.vector = player._sixteen_vector
+            self.initial = tuple(player._initial)
+        else:
+            raise ValueError(
+                "Players must be memory-one or memory-two players."
+            )
+
+    def cooperation_probability(self, plays, coplays) -> float:
+        """The probability of cooperating after the given histories (of
+        length at least 1)."""
+        turn = len(plays)
+        if turn < len(self.initial):
+            return 1.0 if self.initial[turn] == C else 0.0
+        if self.memory_depth == 1:
+            return self.vector[(plays[-1], coplays[-1])]
+        return self.vector[(tuple(plays[-2:]), tuple(coplays[-2:]))]
+
+    def first_cooperation_probability(self) -> float:
+        return 1.0 if self.initial[0] == C else 0.0
+
+
+def is_analytic(players) -> bool:
+    """Determines if a pair of players can be analysed exactly."""
+    try:
+        for player in players:
+            _Responder(player)
+    except ValueError:
+        return False
+    return True
+
+
+def _with_noise(p: float, noise: float) -> float:
+    """The probability of playing C when intending C with probability p."""
+    return p * (1 - noise) + (1 - p) * noise
+
+
+def _joint_distribution(p: float, q: float) -> np.ndarray:
+    """The distribution of the joint action given both players'
+    probabilities of cooperating, in the order of JOINT_ACTIONS."""
+    return np.array([p * q, p * (1 - q), (1 - p) * q, (1 - p) * (1 - q)])
+
+
+def _state_index(first_round, second_round) -> int:
+    a, b = first_round
+    c, d = second_round
+    return 8 * a.value + 4 * b.value + 2 * c.value + d.value
+
+
+def _geometric_sum(matrix: np.ndarray, n: int) -> np.ndarray:
+    """Returns I + A + A^2 + ... + A^(n - 1) using O(log(n)) products."""
+    size = matrix.shape[0]
+    if n == 0:
+        return np.zeros((size, size))
+    if n == 1:
+        return np.eye(size)
+    half = _geometric_sum(matrix, n // 2)
+    power = np.linalg.matrix_power(matrix, n // 2)
+    total = half + power @ half
+    if n % 2:
+        total = np.eye(size) + matrix @ total
+    return total
+
+
+def expected_outcome(
+    players,
+    turns: Optional[float] = None,
+    prob_end: Optional[float] = None,
+    noise: float = 0,
+    game: Optional[Game] = None,
+) -> ExpectedOutcome:
+    """
+    Computes the exact expected outcome of a match between two memory-one or
+    memory-two players.
+
+    Parameters
+    ----------
+    players : tuple
+        A pair of axelrod.Player objects for which `is_analytic` holds
+    turns : integer
+        The maximum number of turns of the match
+    prob_end : float
+        The probability of a given turn ending the match
+    noise : float
+        The probability that a player's intended action should be flipped
+    game : axelrod.Game
+        The game object used to score the match
+
+    Returns
+    -------
+    ExpectedOutcome
+        A namedtuple with:
+
+        - length: the expected number of turns,
+        - score_per_turn: the expected score of each player divided by the
+          expected length,
+        - cooperation: the expected cooperation rate of each player,
+        - state_distribution: a Counter mapping each joint action to its
+          expected frequency.
+    """
+    if game is None:
+        game = Game()
+    if turns is None:
+        turns = float("inf")
+    if not prob_end:
+        prob_end = 0
+    if turns == float("inf") and prob_end == 0:
+        raise ValueError("The match must have a finite expected length.")
+
+    player, coplayer = map(_Responder, players)
+    continuation = 1 - prob_end
+
+    def probabilities(plays, coplays):
+        p = player.cooperation_probability(plays, coplays)
+        q = coplayer.cooperation_probability(coplays, plays)
+        return _with_noise(p, noise), _with_noise(q, noise)
+
+    # The first turn does not depend on any history
+    counts = _joint_distribution(
+        _with_noise(player.first_cooperation_probability(), noise),
+        _with_noise(coplayer.first_cooperation_probability(), noise),
+    )
+
+    # Distribution of the joint actions of the first two rounds
+    initial_states = np.zeros(16)
+    transitions = np.zeros((16, 16))
+    for first_round in JOINT_ACTIONS:
+        probability = counts[JOINT_ACTIONS.index(first_round)]
+        p, q = probabilities([first_round[0]], [first_round[1]])
+        for second_round, value in zip(
+            JOINT_ACTIONS, _joint_distribution(p, q)
+        ):
+            initial_states[_state_index(first_round, second_round)] += (
+                probability * value
+            )
+    for first_round, second_round in product(JOINT_ACTIONS, repeat=2):
+        plays = [first_round[0], second_round[0]]
+        coplays = [first_round[1], second_round[1]]
+        p, q = probabilities(plays, coplays)
+        for third_round, value in zip(JOINT_ACTIONS, _joint_distribution(p, q)):
+            transitions[
+                _state_index(first_round, second_round),
+                _state_index(second_round, third_round),
+            ] = value
+
+    # The joint action of a turn is the second round of the state
+    marginal = np.zeros((16, 4))
+    for first_round, second_round in product(JOINT_ACTIONS, repeat=2):
+        marginal[
+            _state_index(first_round, second_round),
+            JOINT_ACTIONS.index(second_round),
+        ] = 1
+
+    # Turns after the first: sum of continuation ^ t * v_1 * T ^ (t - 1)
+    discounted = continuation * transitions
+    if turns == float("inf"):
+        total = np.linalg.solve((np.eye(16) - discounted).T, initial_states)
+    elif turns >= 2:
+        total = initial_states @ _geometric_sum(discounted, int(turns) - 1)
+    else:
+        total = np.zeros(16)
+    counts = counts + continuation * (total @ marginal)
+
+    length = counts.sum()
+    scores = np.array([game.score(state) for state in JOINT_ACTIONS])
+    score_per_turn = tuple(counts @ scores / length)
+    cooperation = (
+        (counts[0] + counts[1]) / length,
+        (counts[0] + counts[2]) / length,
+    )
+    state_distribution = Counter(
+        {
+            state: value / length
+            for state, value in zip(JOINT_ACTIONS, counts)
+            if value > 0
+        }
+    )
+    return ExpectedOutcome(
+        length=length,
+        score_per_turn=score_per_turn,
+        cooperation=cooperation,
+        state_distribution=state_distribution,
+    )
@@ -1,10 +1,16 @@
+from itertools import count
 from math import ceil, log
 
 import axelrod.interaction_utils as iu
 from axelrod import DEFAULT_TURNS, Classifiers
 from axelrod.action import Action
-from axelrod.deterministic_cache import DeterministicCache
+from axelrod.batch_match import is_batchable, play_memory_one_batch
+from axelrod.deterministic_cache import CyclicInteractions, DeterministicCache
 from axelrod.game import Game
+from axelrod.markov_chain import expected_outcome
+from axelrod.match_summary import MatchSummary
+from axelrod.packed_interactions import PackedInteractions
+from axelrod.player import Player
 from axelrod.random_ import RandomGenerator
 
 C, D = Action.C, Action.D
@@ -16,6 +22,47 @@ def is_stochastic(players, noise):
     return noise or any(map(Classifiers["stochastic"], players))
 
 
+def is_order_independent(players):
+    """Determines if the result of a match between players does not depend
+    on the order in which they play, which is the case unless one of them
+    inspects or manipulates the other."""
+    return not any(
+        Classifiers[name](player)
+        for player in players
+        for name in [
+            "inspects_source",
+            "manipulates_source",
+            "manipulates_state",
+        ]
+    )
+
+
+def state_key_function(player):
+    """
+    Returns a function giving the state key of a player (see
+    `Player.state_key`), or None if the player's state cannot be summarised.
+
+    Transformed players are not summarised as transformers may hold state of
+    their own. A state key defined by a strategy class is only trusted if
+    that class also defines (or inherits) the strategy in use.
+    """
+    if Classifiers["stochastic"](player):
+        return None
+    if not is_order_independent([player]):
+        return None
+    if "length" in (Classifiers["makes_use_of"](player) or set()):
+        return None
+    if hasattr(player, "original_class"):
+        return None
+
+    mro = type(player).__mro__
+    key_owner = next(c for c in mro if "state_key" in c.__dict__)
+    strategy_owner = next(c for c in mro if "strategy" in c.__dict__)
+    if key_owner is not Player and not issubclass(key_owner, strategy_owner):
+        return None
+    return player.state_key
+
+
 class Match(object):
     """The Match class conducts matches between two players."""
 
@@ -30,6 +77,7 @@ class Match(object):
         match_attributes=None,
         reset=True,
         seed=None,
+        detect_cycles=False,
     ):
         """
         Parameters
@@ -54,6 +102,11 @@ class Match(object):
             Whether to reset players or not
         seed : int
             Random seed for reproducibility
+        detect_cycles : bool
+            Whether to detect when a deterministic match revisits a joint
+            state of the players and extrapolate the remaining turns from the
+            resulting cycle instead of playing them. The players' histories
+            then only hold the turns that were actually played.
         """
 
         defaults = {
@@ -65,6 +118,7 @@ class Match(object):
         self.turns, self.prob_end = defaults[(turns is None, prob_end is None)]
 
         self.result = []
+        self.summary = MatchSummary()
         self.noise = noise
 
         self.set_seed(seed)
@@ -91,6 +145,7 @@ class Match(object):
 
         self.players = list(players)
         self.reset = reset
+        self.detect_cycles = detect_cycles
 
     def set_seed(self, seed):
         """Sets a random seed for the Match, for reproducibility. Initializes
@@ -142,7 +197,10 @@ class Match(object):
         """
         if cache_key not in self._cache:
             return False
-        return len(self._cache[cache_key]) >= turns
+        cached = self._cache[cache_key]
+        if isinstance(cached, CyclicInteractions):
+            return True
+        return len(cached) >= turns
 
     def simultaneous_play(self, player, coplayer, noise=0):
         """This pits two players against each other."""
@@ -162,8 +220,13 @@ class Match(object):
         The resulting list of actions from a match between two players.
 
         This method determines whether the actions list can be obtained from
-        the deterministic cache and returns it from there if so. If not, it
-        calls the play method for player1 and returns the list from there.
+        the deterministic cache and returns it from there if so. If the cache
+        holds a shorter match along with snapshots of the players at its end,
+        play continues from there. Otherwise the match is played from the
+        first turn.
+
+        The statistics of the match are counted as it is played and are held
+        by `summary` (an axelrod.MatchSummary) once it has been played.
 
         Returns
         -------
@@ -175,36 +238,279 @@ class Match(object):
 
         i.e. One entry per turn containing a pair of actions.
         """
-        if self.prob_end:
-            r = self._random.random()
-            turns = min(sample_length(self.prob_end, r), self.turns)
-        else:
-            turns = self.turns
+        turns = self._sample_turns()
         cache_key = (self.players[0], self.players[1])
-
-        if self._stochastic or not self._cached_enough_turns(cache_key, turns):
-            for p in self.players:
-                if self.reset:
-                    p.reset()
-                p.set_match_attributes(**self.match_attributes)
-                # Generate a random seed for the player, if stochastic
-                if Classifiers["stochastic"](p):
-                    p.set_seed(self._random.random_seed_int())
-            result = []
-            for _ in range(turns):
-                plays = self.simultaneous_play(
-                    self.players[0], self.players[1], self.noise
-                )
-                result.append(plays)
+        reversed_key = (self.players[1], self.players[0])
+        summary = MatchSummary()
+
+        if (
+            not self._stochastic
+            and not self._cached_enough_turns(cache_key, turns)
+            and is_order_independent(self.players)
+            and self._cached_enough_turns(reversed_key, turns)
+        ):
+            # The same players were cached in the other order
+            result = [
+                (coplay, play)
+                for play, coplay in self._cache[reversed_key][:turns]
+            ]
+        elif self._stochastic or not self._cached_enough_turns(
+            cache_key, turns
+        ):
+            self._prepare_players()
+            cached_prefix = self._cached_prefix(cache_key)
+            if cached_prefix is None:
+                result = self._play_turns(turns, summary)
+            else:
+                prefix, snapshots = cached_prefix
+                for player, snapshot in zip(self.players, snapshots):
+                    # The snapshot holds the attributes of the shorter match
+                    match_attributes = player.match_attributes
+                    player.restore(snapshot)
+                    player.match_attributes = match_attributes
+                summary.extend(prefix)
+                result = self._play_turns(turns - len(prefix), summary)
+                if isinstance(result, CyclicInteractions):
+                    result = CyclicInteractions(
+                        prefix + result.prefix, result.cycle
+                    )
+                else:
+                    result = prefix + result
 
             if self._cache_update_required:
                 self._cache[cache_key] = result
+                if self.reset and isinstance(result, list):
+                    self._cache.set_snapshots(
+                        cache_key, [p.snapshot() for p in self.players]
+                    )
+            if isinstance(result, CyclicInteractions):
+                result = result[:turns]
+                # Count the repetitions of the cycle that were not played
+                summary.extend(result[len(summary) :])
         else:
             result = self._cache[cache_key][:turns]
+            if isinstance(result, PackedInteractions):
+                summary.extend(result)
+                result = result.to_list()
 
+        if not summary.length:
+            summary.extend(result)
         self.result = result
+        self.summary = summary
+        return result
+
+    def play_iter(self, stop=None):
+        """
+        A generator of the turns of a match between two players.
+
+        Turns are played lazily, one per iteration, and `result` holds the
+        turns played so far. The number of turns is sampled as in `play` when
+        the match has a probabilistic ending, so both methods give the same
+        match for a given seed. The deterministic cache is read from in the
+        same way as in `play` but is only updated once all turns have been
+        played.
+
+        Parameters
+        ----------
+        stop : callable
+            A predicate called with the list of turns played so far after
+            each turn. No further turns are played once it returns True. If
+            given, the match can have an infinite number of turns.
+
+        Yields
+        ------
+        tuple
+            The pair of actions of each turn, e.g. (C, D)
+        """
+        turns = self._sample_turns()
+        if turns == float("inf") and stop is None:
+            raise ValueError("An infinite match requires a stop predicate.")
+        cache_key = (self.players[0], self.players[1])
+
+        use_cache = (
+            not self._stochastic
+            and turns != float("inf")
+            and self._cached_enough_turns(cache_key, turns)
+        )
+        if use_cache:
+            turn_plays = iter(self._cache[cache_key][:turns])
+        else:
+            self._prepare_players()
+            turn_range = count() if turns == float("inf") else range(turns)
+            turn_plays = (
+                self.simultaneous_play(
+                    self.players[0], self.players[1], self.noise
+                )
+                for _ in turn_range
+            )
+
+        self.result = []
+        self.summary = MatchSummary()
+        for plays in turn_plays:
+            self.result.append(plays)
+            self.summary.update(plays)
+            yield plays
+            if stop is not None and stop(self.result):
+                return
+
+        if not use_cache and self._cache_update_required:
+            self._cache[cache_key] = list(self.result)
+
+    def _cached_prefix(self, cache_key):
+        """
+        Returns the cached interactions for the players along with snapshots
+        of the players at their end, if the match can be continued from them,
+        or None otherwise.
+
+        Players that make use of the length of the match are not continued,
+        as their play may depend on it.
+        """
+        if self._stochastic or not self.reset or cache_key not in self._cache:
+            return None
+        snapshots = self._cache.get_snapshots(cache_key)
+        if snapshots is None:
+            return None
+        if any(
+            "length" in (Classifiers["makes_use_of"](p) or set())
+            for p in self.players
+        ):
+            return None
+        attributes = {
+            k: v for k, v in self.match_attributes.items() if k != "length"
+        }
+        for snapshot in snapshots:
+            snapshot_attributes = snapshot["match_attributes"]
+            if any(
+                snapshot_attributes.get(k) != v for k, v in attributes.items()
+            ):
+                return None
+        prefix = self._cache[cache_key]
+        if isinstance(prefix, PackedInteractions):
+            prefix = prefix.to_list()
+        return list(prefix), snapshots
+
+    def _sample_turns(self):
+        """
+        Returns the number of turns to play, sampled if the match has a
+        probabilistic ending.
+        """
+        if self.prob_end:
+            r = self._random.random()
+            return min(sample_length(self.prob_end, r), self.turns)
+        return self.turns
+
+    def _prepare_players(self):
+        """Resets the players (if required) and passes them the match
+        attributes and a random seed (if stochastic)."""
+        for p in self.players:
+            if self.reset:
+                p.reset()
+            p.set_match_attributes(**self.match_attributes)
+            # Generate a random seed for the player, if stochastic
+            if Classifiers["stochastic"](p):
+                p.set_seed(self._random.random_seed_int())
+
+    def _play_turns(self, turns, summary=None):
+        """
+        Plays the given number of turns, counting them in the given
+        MatchSummary (if any).
+
+        If cycle detection is enabled and a deterministic match revisits a
+        joint state of the players, play stops and CyclicInteractions
+        describing the whole match are returned. Otherwise the list of
+        interactions is returned.
+        """
+        key_functions = None
+        if self.detect_cycles and not self._stochastic:
+            key_functions = [state_key_function(p) for p in self.players]
+            if None in key_functions:
+                key_functions = None
+
+        player, coplayer = self.players
+        seen = {}
+        result = []
+        for turn in range(turns):
+            if key_functions is not None:
+                key = tuple(f() for f in key_functions)
+                if None in key:
+                    key_functions = None
+                elif key in seen:
+                    start = seen[key]
+                    return CyclicInteractions(result[:start], result[start:])
+                else:
+                    seen[key] = turn
+            plays = self.simultaneous_play(player, coplayer, self.noise)
+            result.append(plays)
+            if summary is not None:
+                summary.update(plays)
         return result
 
+    def play_batch(self, repetitions):
+        """
+        Plays all repetitions of a match between two memory-one players at
+        once.
+
+        Rather than calling the players' strategies turn by turn, the actions
+        of every repetition are computed together from the players'
+        four-vectors, with all random draws and noise flips sampled in bulk.
+        This is only available for pairs of players whose behaviour is
+        entirely described by a four-vector (MemoryOnePlayer and its
+        subclasses that do not override `strategy`, and WinStayLoseShift) and
+        for matches of a fixed number of turns.
+
+        Parameters
+        ----------
+        repetitions : integer
+            The number of matches to play
+
+        Returns
+        -------
+        A tuple of two numpy arrays of shape (repetitions, turns), holding the
+        actions of each player encoded as 0 (C) and 1 (D).
+        """
+        if self.prob_end:
+            raise ValueError("Batch play requires a fixed number of turns.")
+        if not is_batchable(self.players):
+            raise ValueError("Batch play requires two memory-one players.")
+        for p in self.players:
+            if self.reset:
+                p.reset()
+            p.set_match_attributes(**self.match_attributes)
+        return play_memory_one_batch(
+            self.players,
+            turns=self.turns,
+            repetitions=repetitions,
+            noise=self.noise,
+            random=self._random,
+        )
+
+    def expected_outcome(self):
+        """
+        The exact expected outcome of the match, computed from the Markov chain
+        of the joint play rather than by sampling.
+
+        This is only available if both players are memory-one players (as
+        described in `play_batch`) or MemoryTwoPlayer instances that do not
+        override `strategy`.
+
+        Returns
+        -------
+        axelrod.markov_chain.ExpectedOutcome
+            A namedtuple holding the expected length, score per turn,
+            cooperation rates and state distribution of the match.
+        """
+        for p in self.players:
+            if self.reset:
+                p.reset()
+            p.set_match_attributes(**self.match_attributes)
+        return expected_outcome(
+            self.players,
+            turns=self.turns,
+            prob_end=self.prob_end,
+            noise=self.noise,
+            game=self.game,
+        )
+
     def scores(self):
         """Returns the scores of the previous Match plays."""
         return iu.compute_scores(self.result, self.game)
@@ -253,6 +559,48 @@ class Match(object):
         return self.turns
 
 
+def mutual_defection_stop(length):
+    """
+    Returns a stop predicate for `Match.play_iter` that is True once both
+    players have defected in each of the last `length` turns.
+    """
+
+    def stop(interactions):
+        return len(interactions) >= length and all(
+            plays == (D, D) for plays in interactions[-length:]
+        )
+
+    return stop
+
+
+def score_stop(threshold, game=None):
+    """
+    Returns a stop predicate for `Match.play_iter` that is True once either
+    player's total score reaches `threshold`.
+
+    The totals are updated with the turns added to the list of interactions
+    since the previous call, so that checking the predicate after every turn
+    remains cheap.
+    """
+    if game is None:
+        game = Game()
+    state = {"interactions": None, "counted": 0, "totals": [0, 0]}
+
+    def stop(interactions):
+        if interactions is not state["interactions"]:
+            # A new match has started
+            state.update(interactions=interactions, counted=0, totals=[0, 0])
+        totals = state["totals"]
+        for plays in interactions[state["counted"] :]:
+            scores = game.score(plays)
+            totals[0] += scores[0]
+            totals[1] += scores[1]
+        state["counted"] = len(interactions)
+        return max(totals) >= threshold
+
+    return stop
+
+
 def sample_length(prob_end, random_value):
     """
     Sample length of a game.
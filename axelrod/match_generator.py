@@ -1,5 +1,13 @@
+import statistics
+
+import numpy as np
+from axelrod.classifier import Classifiers
 from axelrod.random_ import BulkRandomGenerator
 
+# How many times slower than other strategies a strategy classified as
+# long_run_time is assumed to be, until its timings have been recorded.
+LONG_RUN_TIME_FACTOR = 100
+
 
 class MatchGenerator(object):
     def __init__(
@@ -13,6 +21,8 @@ class MatchGenerator(object):
         edges=None,
         match_attributes=None,
         seed=None,
+        max_repetitions=None,
+        timings=None,
     ):
         """
         A class to generate matches. This is used by the Tournament class which
@@ -39,6 +49,15 @@ class MatchGenerator(object):
             The default is to use the correct values for turns, game and noise
             but these can be overridden if desired.
         seed : int
+        max_repetitions : int
+            The maximum number of repetitions of a chunk. The repetitions of
+            pairs of players with more repetitions are split between several
+            chunks, each with its own seed derived from the seed of the pair.
+        timings : dict
+            The timings recorded for each strategy, as held by the `timings`
+            of another match generator. These are shared and added to, so that
+            the timings recorded by one tournament can be used to schedule
+            the matches of the next. Defaults to no timings.
         """
         self.players = players
         self.turns = turns
@@ -48,7 +67,10 @@ class MatchGenerator(object):
         self.opponents = players
         self.prob_end = prob_end
         self.match_attributes = match_attributes
+        self.max_repetitions = max_repetitions
         self.random_generator = BulkRandomGenerator(seed)
+        # Mapping strategy names to the seconds and turns recorded for them
+        self.timings = {} if timings is None else timings
 
         self.edges = edges
         if edges is not None:
@@ -72,15 +94,126 @@ class MatchGenerator(object):
         tuples
             ((player1 index, player2 index), match object)
         """
+        for chunks in self.build_match_chunk_groups():
+            yield from chunks
+
+    def build_match_chunk_groups(self):
+        """
+        A generator that returns, for each pair of players, the list of
+        chunks playing their repetitions. There is a single chunk unless the
+        repetitions are split by `max_repetitions`, in which case the
+        repetitions of the chunks, in order, make up those of the pair.
+
+        Yields
+        -------
+        lists
+            Lists of tuples ((player1 index, player2 index), match parameters,
+            repetitions, seed)
+        """
         if self.edges is None:
             edges = complete_graph(self.players)
         else:
             edges = self.edges
 
         for index_pair in edges:
-            match_params = self.build_single_match_params()
             r = next(self.random_generator)
-            yield (index_pair, match_params, self.repetitions, r)
+            sizes = split_repetitions(self.repetitions, self.max_repetitions)
+            if len(sizes) == 1:
+                seeds = [r]
+            else:
+                seeds = derive_seeds(r, len(sizes))
+            yield [
+                (index_pair, self.build_single_match_params(), size, seed)
+                for size, seed in zip(sizes, seeds)
+            ]
+
+    def record_timing(self, index_pair, seconds, turns):
+        """
+        Records the time taken to play the matches of a pair of players. The
+        time is shared equally between the strategies of the two players.
+
+        Parameters
+        ----------
+        index_pair : tuple
+            The indices of the players
+        seconds : float
+            The time taken to play the matches
+        turns : int
+            The total number of turns of the matches
+        """
+        for index in index_pair:
+            name = self.players[index].name
+            recorded_seconds, recorded_turns = self.timings.get(name, (0, 0))
+            self.timings[name] = (
+                recorded_seconds + seconds / 2,
+                recorded_turns + turns,
+            )
+
+    def expected_length(self):
+        """
+        Returns the expected number of turns of a match.
+        """
+        lengths = []
+        if self.turns is not None:
+            lengths.append(self.turns)
+        if self.prob_end is not None and self.prob_end > 0:
+            lengths.append(1 / self.prob_end)
+        return min(lengths, default=1)
+
+    def player_costs(self):
+        """
+        Estimates the time taken by each player to play a turn.
+
+        Players whose strategies have recorded timings use them. Other
+        players are assumed to take the median time per turn of the recorded
+        strategies (or one unit of time if there are none), multiplied by
+        LONG_RUN_TIME_FACTOR if they are classified as long_run_time.
+
+        Returns
+        -------
+        list
+            The estimated time per turn of each player
+        """
+        recorded = {
+            name: seconds / turns
+            for name, (seconds, turns) in self.timings.items()
+            if turns > 0
+        }
+        default = statistics.median(recorded.values()) if recorded else 1
+        costs = []
+        for player in self.players:
+            if player.name in recorded:
+                costs.append(recorded[player.name])
+            elif Classifiers["long_run_time"](player):
+                costs.append(default * LONG_RUN_TIME_FACTOR)
+            else:
+                costs.append(default)
+        return costs
+
+    def estimate_costs(self, chunks):
+        """
+        Estimates the time taken to play each of a list of chunks, from the
+        costs of the players, the expected length of the matches and the
+        number of repetitions.
+
+        Parameters
+        ----------
+        chunks : list
+            Chunks built by `build_match_chunks`
+
+        Returns
+        -------
+        list
+            The estimated cost of each chunk
+        """
+        player_costs = self.player_costs()
+        length = self.expected_length()
+        return [
+            (player_costs[index_pair[0]] + player_costs[index_pair[1]])
+            * length
+            * repetitions
+            for index_pair, _, repetitions, _ in chunks
+        ]
 
     def build_single_match_params(self):
         """
@@ -95,6 +228,71 @@ class MatchGenerator(object):
         }
 
 
+def split_repetitions(repetitions, max_repetitions=None):
+    """
+    Splits a number of repetitions into as few parts as possible of at most
+    `max_repetitions`, with sizes differing by at most one.
+
+    Parameters
+    ----------
+    repetitions : int
+        The number of repetitions to split
+    max_repetitions : int
+        The maximum size of a part, or None to not split the repetitions
+
+    Returns
+    -------
+    list
+        The sizes of the parts
+    """
+    if max_repetitions is None or repetitions <= max_repetitions:
+        return [repetitions]
+    parts = -(-repetitions // max_repetitions)
+    size, remainder = divmod(repetitions, parts)
+    return [size + 1] * remainder + [size] * (parts - remainder)
+
+
+def derive_seeds(seed, n):
+    """
+    Returns n seeds derived from a seed.
+
+    Parameters
+    ----------
+    seed : int
+        The seed from which the others are derived
+    n : int
+        The number of seeds
+
+    Returns
+    -------
+    list
+        The derived seeds
+    """
+    random_generator = BulkRandomGenerator(seed, batch_size=n)
+    return [next(random_generator) for _ in range(n)]
+
+
+def extension_seed(seed, num_players):
+    """
+    Returns the seed of the matches of the pairs of players added to a
+    tournament, derived from the seed of the tournament and its number of
+    players before they were added.
+
+    Parameters
+    ----------
+    seed : int
+        The seed of the tournament
+    num_players : int
+        The number of players of the tournament before the extension
+
+    Returns
+    -------
+    int
+        The seed of the extension
+    """
+    return int(np.random.SeedSequence([seed, num_players]).generate_state(1)[0])
+
+
 def complete_graph(players):
     """
     Return generator of edges of a complete graph on a set of players
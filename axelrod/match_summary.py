@@ -0,0 +1,186 @@
+"""
+Statistics of a match accumulated as it is played.
+
+Rather than computing each statistic of a match with a separate pass over its
+interactions (as the functions of `axelrod.interaction_utils` do), a
+MatchSummary counts the transitions between the joint actions of consecutive
+turns while the match is played. The scores, cooperations, state
+distribution and state to action distributions of both players all follow
+from these counts and the joint action of the first turn.
+
+Joint actions are encoded as 2 * play + coplay, so that the codes 0, 1, 2, 3
+correspond to the states CC, CD, DC, DD.
+"""
+from collections import Counter
+
+import numpy as np
+from axelrod.action import Action
+
+from .game import Game
+from .packed_interactions import PackedInteractions
+
+C, D = Action.C, Action.D
+
+STATES = [(C, C), (C, D), (D, C), (D, D)]
+
+
+class MatchSummary(object):
+    """
+    Running counts of the joint actions of a match.
+
+    Attributes
+    ----------
+    length : integer
+        The number of turns
+    first_state : integer
+        The code of the joint action of the first turn, or None
+    last_state : integer
+        The code of the joint action of the last turn, or None
+    state_counts : list
+        The number of turns spent in each state, in the order of STATES
+    transition_counts : list
+        The number of times each state followed another: entry 4 * i + j
+        counts the turns in state j following a turn in state i
+    """
+
+    def __init__(self) -> None:
+        self.length = 0
+        self.first_state = None
+        self.last_state = None
+        self.state_counts = [0] * 4
+        self.transition_counts = [0] * 16
+
+    @classmethod
+    def from_interactions(cls, interactions) -> "MatchSummary":
+        """Builds the summary of a list of interactions (or
+        PackedInteractions)."""
+        summary = cls()
+        summary.extend(interactions)
+        return summary
+
+    def update(self, plays) -> None:
+        """Counts a turn given the pair of actions played, e.g. (C, D)."""
+        play, coplay = plays
+        state = 2 * (play is D) + (coplay is D)
+        if self.last_state is None:
+            self.first_state = state
+        else:
+            self.transition_counts[4 * self.last_state + state] += 1
+        self.state_counts[state] += 1
+        self.last_state = state
+        self.length += 1
+
+    def extend(self, interactions) -> None:
+        """Counts the turns of a list of interactions (or
+        PackedInteractions)."""
+        if not isinstance(interactions, PackedInteractions):
+            for plays in interactions:
+                self.update(plays)
+            return
+        if len(interactions) == 0:
+            return
+        states = interactions.states.astype(np.intp)
+        if self.last_state is None:
+            self.first_state = int(states[0])
+        else:
+            self.transition_counts[4 * self.last_state + int(states[0])] += 1
+        for counts, new_counts in [
+            (self.state_counts, np.bincount(states, minlength=4)),
+            (
+                self.transition_counts,
+                np.bincount(4 * states[:-1] + states[1:], minlength=16),
+            ),
+        ]:
+            for i, count in enumerate(new_counts.tolist()):
+                counts[i] += count
+        self.last_state = int(states[-1])
+        self.length += len(states)
+
+    def final_score(self, game: Game = None):
+        """Returns the final score of both players."""
+        if not self.length:
+            return None
+        if not game:
+            game = Game()
+        return tuple(
+            sum(
+                count * game.score(state)[player_index]
+                for count, state in zip(self.state_counts, STATES)
+            )
+            for player_index in [0, 1]
+        )
+
+    def final_score_per_turn(self, game: Game = None):
+        """Returns the mean score per turn of both players."""
+        scores = self.final_score(game)
+        if scores is None:
+            return None
+        return tuple(score / self.length for score in scores)
+
+    def winner_index(self, game: Game = None):
+        """Returns the index of the winner, False if there is no winner or
+        None if no turns were played."""
+        scores = self.final_score(game)
+        if scores is None:
+            return None
+        if scores[0] == scores[1]:
+            return False
+        return max([0, 1], key=lambda i: scores[i])
+
+    def cooperations(self):
+        """Returns the number of cooperations of both players."""
+        if not self.length:
+            return None
+        cc, cd, dc, _ = self.state_counts
+        return cc + cd, cc + dc
+
+    def initial_cooperation(self):
+        """Returns whether each player cooperated on the first turn."""
+        if not self.length:
+            return None
+        return tuple(action == C for action in STATES[self.first_state])
+
+    def state_distribution(self):
+        """Returns a Counter of the number of turns spent in each state."""
+        if not self.length:
+            return None
+        return Counter(
+            {
+                state: count
+                for state, count in zip(STATES, self.state_counts)
+                if count
+            }
+        )
+
+    def state_to_action_distribution(self):
+        """
+        Returns a list (for each player) of Counters of the number of times
+        each action followed each state, as given by
+        `axelrod.interaction_utils.compute_state_to_action_distribution`.
+        """
+        if not self.length:
+            return None
+        distributions = []
+        for player_index in [0, 1]:
+            counter = Counter()
+            for i, state in enumerate(STATES):
+                for j, next_state in enumerate(STATES):
+                    count = self.transition_counts[4 * i + j]
+                    if count:
+                        counter[(state, next_state[player_index])] += count
+            distributions.append(counter)
+        return distributions
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __eq__(self, other):
+        if not isinstance(other, MatchSummary):
+            return NotImplemented
+        return (
+            self.length == other.length
+            and self.first_state == other.first_state
+            and self.last_state == other.last_state
+            and self.state_counts == other.state_counts
+            and self.transition_counts == other.transition_counts
+        )
@@ -1,11 +1,11 @@
 """Implementation of the Moran process on Graphs."""
 
 from collections import Counter
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
-from axelrod import DEFAULT_TURNS, EvolvablePlayer, Game, Player
+from axelrod import DEFAULT_TURNS, Classifiers, EvolvablePlayer, Game, Player
 from axelrod.deterministic_cache import DeterministicCache
 from axelrod.graph import Graph, complete_graph
 from axelrod.match import Match
@@ -366,6 +366,10 @@ class MoranProcess(object):
         """Plays the next round of the process. Every player is paired up
         against every other player and the total scores are recorded.
 
+        Deterministic matches between players with the same fingerprint keys
+        (see `Player.fingerprint_key`) as an earlier pair of the round are
+        not played again: the scores of the earlier match are used.
+
         Returns
         -------
         scores:
@@ -373,9 +377,22 @@ class MoranProcess(object):
         """
         N = len(self.players)
         scores = [0] * N
+        outcomes = {}  # type: Dict[Tuple[str, str], Tuple[float, float]]
         for i, j in self._matchup_indices():
             player1 = self.players[i]
             player2 = self.players[j]
+            seed = next(self._bulk_random)
+            key = None
+            if not (self.noise or self.prob_end) and not (
+                Classifiers["stochastic"](player1)
+                or Classifiers["stochastic"](player2)
+            ):
+                key = (player1.fingerprint_key(), player2.fingerprint_key())
+            if key in outcomes:
+                match_scores = outcomes[key]
+                scores[i] += match_scores[0]
+                scores[j] += match_scores[1]
+                continue
             match = Match(
                 (player1, player2),
                 turns=self.turns,
@@ -383,10 +400,12 @@ class MoranProcess(object):
                 noise=self.noise,
                 game=self.game,
                 deterministic_cache=self.deterministic_cache,
-                seed=next(self._bulk_random),
+                seed=seed,
             )
             match.play()
             match_scores = match.final_score_per_turn()
+            if key is not None:
+                outcomes[key] = match_scores
             scores[i] += match_scores[0]
             scores[j] += match_scores[1]
         self.score_history.append(scores)
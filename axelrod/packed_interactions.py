@@ -0,0 +1,146 @@
+"""
+A compact container for the interactions of a match.
+
+Interactions are usually lists of the form:
+
+    [(C, D), (D, C),...]
+
+which cost tens of bytes per turn in memory and when pickled. The
+PackedInteractions class holds the same information using two bits per turn
+(one per player, with C as 0 and D as 1) and behaves like a read only list of
+pairs of actions. The functions in `axelrod.interaction_utils` operate on
+the packed bits directly.
+"""
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from axelrod.action import Action
+
+C, D = Action.C, Action.D
+
+ACTIONS = (C, D)
+STATE_CODES = {(C, C): 0, (C, D): 1, (D, C): 2, (D, D): 3}
+
+
+class PackedInteractions(object):
+    """
+    The interactions of a match stored with two bits per turn.
+
+    Parameters
+    ----------
+    plays : array like
+        The actions of the first player encoded as 0 (C) and 1 (D)
+    coplays : array like
+        The actions of the second player encoded as 0 (C) and 1 (D)
+    """
+
+    def __init__(self, plays, coplays) -> None:
+        plays = np.asarray(plays, dtype=np.uint8)
+        coplays = np.asarray(coplays, dtype=np.uint8)
+        if plays.shape != coplays.shape or plays.ndim != 1:
+            raise ValueError("Plays and coplays must have the same length.")
+        self._length = len(plays)
+        # Interleave the players' bits: p0, q0, p1, q1, ...
+        self._packed = np.packbits(np.stack([plays, coplays], axis=1)).tobytes()
+        self._array = None
+
+    @classmethod
+    def from_interactions(cls, interactions) -> "PackedInteractions":
+        """Packs a list of pairs of actions."""
+        if isinstance(interactions, cls):
+            return interactions
+        codes = np.fromiter(
+            map(STATE_CODES.__getitem__, interactions),
+            dtype=np.uint8,
+            count=len(interactions),
+        )
+        return cls(codes >> 1, codes & 1)
+
+    @classmethod
+    def from_bytes(cls, length: int, data: bytes) -> "PackedInteractions":
+        """Builds interactions of the given length from the packed bytes
+        returned by `to_bytes`."""
+        packed = cls.__new__(cls)
+        packed.__setstate__({"_length": length, "_packed": bytes(data)})
+        return packed
+
+    def to_bytes(self) -> bytes:
+        """Returns the packed bits of the interactions."""
+        return self._packed
+
+    @property
+    def array(self) -> np.ndarray:
+        """A read only (turns, 2) array of the actions, encoded as 0 (C) and 1
+        (D). Columns are the actions of each player."""
+        if self._array is None:
+            bits = np.unpackbits(
+                np.frombuffer(self._packed, dtype=np.uint8),
+                count=2 * self._length,
+            )
+            self._array = bits.reshape(self._length, 2)
+            self._array.flags.writeable = False
+        return self._array
+
+    @property
+    def plays(self) -> np.ndarray:
+        """A view of the encoded actions of the first player."""
+        return self.array[:, 0]
+
+    @property
+    def coplays(self) -> np.ndarray:
+        """A view of the encoded actions of the second player."""
+        return self.array[:, 1]
+
+    @property
+    def states(self) -> np.ndarray:
+        """The joint actions encoded as 2 * play + coplay, so that the codes
+        0, 1, 2, 3 correspond to the states CC, CD, DC, DD."""
+        return 2 * self.plays + self.coplays
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used to store the interactions."""
+        return len(self._packed)
+
+    def to_list(self) -> List[Tuple[Action, Action]]:
+        """Returns the interactions as a list of pairs of actions."""
+        return [(ACTIONS[a], ACTIONS[b]) for a, b in self.array.tolist()]
+
+    def actions_to_str(self, index: int) -> str:
+        """Returns the actions of the player with the given index (0 or 1) as
+        a string of 'C's and 'D's."""
+        characters = np.array(["C", "D"])
+        return "".join(characters[self.array[:, index]])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Tuple[Action, Action]]:
+        return iter(self.to_list())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            array = self.array[key]
+            return PackedInteractions(array[:, 0], array[:, 1])
+        a, b = self.array[key]
+        return ACTIONS[a], ACTIONS[b]
+
+    def __eq__(self, other):
+        if isinstance(other, PackedInteractions):
+            return self._length == other._length and (
+                self._packed == other._packed
+            )
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return "PackedInteractions({})".format(self.to_list())
+
+    def __getstate__(self):
+        return {"_length": self._length, "_packed": self._packed}
+
+    def __setstate__(self, state):
+        self._length = state["_length"]
+        self._packed = state["_packed"]
+        self._array = None
@@ -0,0 +1,333 @@
+"""
+A deterministic cache stored on disk and addressed by content.
+
+Entries are keyed by a hash of the fingerprint keys of both players (see
+`Player.fingerprint_key`), which cover their classes, transformers and
+parameters, the scores of the game and, for players that make use of it, the
+length of the match. Unlike the keys of an in memory DeterministicCache,
+these are safe to share between tournaments using different games or
+parametrised players.
+
+The cache is stored in a single file holding the packed interactions of
+every entry, followed by an index mapping each hash to the location of its
+entry and the offset of that index:
+
+    [entries][pickled index][index offset]
+
+The file is memory mapped, so entries are only read when they are used, and
+can be opened read only by any number of processes. New entries are kept in
+memory until `flush` rewrites the file, keeping the most recently used
+entries within the size limit of the cache.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from axelrod.deterministic_cache import (
+    CachePlayerKey,
+    CyclicInteractions,
+    DeterministicCache,
+)
+from axelrod.packed_interactions import PackedInteractions
+
+_OFFSET = struct.Struct("<Q")
+
+
+def content_key(key: CachePlayerKey) -> str:
+    """
+    Returns the content address of the entry for a pair of players.
+
+    The game and length of the match are read from the match attributes of
+    the players, which are set by the match being cached.
+
+    Parameters
+    ----------
+    key : tuple
+        A pair of axelrod.Player objects
+
+    Returns
+    -------
+    string
+        The hexadecimal SHA-256 hash of the fingerprint keys of the players
+    """
+    parts = [player.fingerprint_key() for player in key]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _packed_size(length: int) -> int:
+    """The number of bytes used to pack interactions of a given length."""
+    return (2 * length + 7) // 8
+
+
+def _entry_size(value) -> int:
+    """The number of bytes used to store a cached value."""
+    if isinstance(value, CyclicInteractions):
+        return _packed_size(len(value.prefix)) + _packed_size(len(value.cycle))
+    return _packed_size(len(value))
+
+
+class PersistentCache(DeterministicCache):
+    """
+    A DeterministicCache stored in a memory mapped file, addressed by the
+    content of its keys and bounded in size.
+
+    Entries are ordered from least to most recently used. When the size of
+    the cache goes over `max_size`, the least recently used entries are
+    evicted. Entries added to the cache are only written to the file by
+    `flush` (or `save`), which should be called by a single process at a
+    time. Other processes can share the file by opening it read only.
+
+    Parameters
+    ----------
+    file_name : string
+        Path to the file holding the cache. It is created by `flush` if it
+        does not exist.
+    max_size : integer
+        The maximum number of bytes of packed interactions held by the cache,
+        or None for no limit
+    read_only : bool
+        Whether the cache can be modified
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        max_size: Optional[int] = None,
+        read_only: bool = False,
+    ) -> None:
+        super().__init__()
+        self.file_name = file_name
+        self.max_size = max_size
+        self.read_only = read_only
+        self.mutable = not read_only
+        self._mmap = None
+        self._index = {}  # type: Dict[str, Tuple[int, int, int]]
+        self._sizes = OrderedDict()  # type: OrderedDict[str, int]
+        self.load(file_name)
+
+    def _transform_key(self, key: CachePlayerKey) -> str:
+        return content_key(key)
+
+    def _touch(self, digest: str) -> None:
+        """Marks an entry as the most recently used."""
+        self._sizes.move_to_end(digest)
+
+    def _read(self, digest: str):
+        """Reads an entry from the file."""
+        offset, length, cycle_length = self._index[digest]
+        size = _packed_size(length)
+        prefix = PackedInteractions.from_bytes(
+            length, self._mmap[offset : offset + size]
+        )
+        if not cycle_length:
+            return prefix
+        cycle = PackedInteractions.from_bytes(
+            cycle_length,
+            self._mmap[
+                offset + size : offset + size + _packed_size(cycle_length)
+            ],
+        )
+        return CyclicInteractions(prefix.to_list(), cycle.to_list())
+
+    def _evict(self) -> None:
+        """Evicts the least recently used entries until the cache is within
+        its size limit, always keeping the most recent entry."""
+        if self.max_size is None:
+            return
+        size = sum(self._sizes.values())
+        while size > self.max_size and len(self._sizes) > 1:
+            digest, entry_size = self._sizes.popitem(last=False)
+            self.data.pop(digest, None)
+            self._index.pop(digest, None)
+            self._snapshots.pop(digest, None)
+            size -= entry_size
+
+    def __contains__(self, key):
+        return self._transform_key(key) in self._sizes
+
+    def __getitem__(self, key: CachePlayerKey):
+        digest = self._transform_key(key)
+        if digest not in self._sizes:
+            raise KeyError(key)
+        self._touch(digest)
+        if digest in self.data:
+            return self.data[digest]
+        return self._read(digest)
+
+    def __setitem__(self, key: CachePlayerKey, value):
+        super().__setitem__(key, value)
+        digest = self._transform_key(key)
+        self._index.pop(digest, None)
+        self._sizes[digest] = _entry_size(value)
+        self._touch(digest)
+        self._evict()
+
+    def __delitem__(self, key: CachePlayerKey):
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+        digest = self._transform_key(key)
+        if digest not in self._sizes:
+            raise KeyError(key)
+        del self._sizes[digest]
+        self.data.pop(digest, None)
+        self._index.pop(digest, None)
+        self._snapshots.pop(digest, None)
+
+    def __len__(self):
+        return len(self._sizes)
+
+    def __iter__(self):
+        return iter(list(self._sizes))
+
+    def __getstate__(self):
+        """Used for pickling: the file is reopened when unpickled and entries
+        that have not been flushed are copied."""
+        return {
+            "file_name": self.file_name,
+            "max_size": self.max_size,
+            "read_only": self.read_only,
+            "data": dict(self.data),
+        }
+
+    def __setstate__(self, state):
+        self.__init__(
+            state["file_name"],
+            max_size=state["max_size"],
+            read_only=state["read_only"],
+        )
+        for digest, value in state["data"].items():
+            self.data[digest] = value
+            self._index.pop(digest, None)
+            self._sizes[digest] = _entry_size(value)
+
+    def close(self) -> None:
+        """Closes the memory map of the file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _map(self, file_name: str) -> bool:
+        """Memory maps a file, returning whether it holds any data."""
+        if not os.path.exists(file_name) or os.path.getsize(file_name) == 0:
+            return False
+        with open(file_name, "rb") as io:
+            self._mmap = mmap.mmap(io.fileno(), 0, access=mmap.ACCESS_READ)
+        return True
+
+    def load(self, file_name: str) -> bool:
+        """Opens a previously flushed cache file, discarding any entries that
+        have not been flushed.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to a previously flushed cache file
+        """
+        self.close()
+        self.file_name = file_name
+        self.data = {}
+        self._snapshots = {}
+        self._index = {}
+        self._sizes = OrderedDict()
+        if not self._map(file_name):
+            return True
+        try:
+            (index_offset,) = _OFFSET.unpack(self._mmap[-_OFFSET.size :])
+            index = pickle.loads(self._mmap[index_offset : -_OFFSET.size])
+        except (struct.error, pickle.UnpicklingError, EOFError):
+            index = None
+        if not isinstance(index, list):
+            self.close()
+            raise ValueError(
+                "Cache file exists but is not the correct format. "
+                "Try deleting and re-building the cache file."
+            )
+        for digest, location in index:
+            _, length, cycle_length = location
+            self._index[digest] = location
+            self._sizes[digest] = _packed_size(length) + _packed_size(
+                cycle_length
+            )
+        self._evict()
+        return True
+
+    def save(self, file_name: str = None) -> bool:
+        """Writes the cache, including entries read from its own file, to a
+        file. Entries of the file are copied without being read into memory.
+
+        Parameters
+        ----------
+        file_name : string
+            File path to which the cache should be saved. Defaults to the
+            file of the cache.
+        """
+        if file_name is None:
+            file_name = self.file_name
+        own_file = os.path.abspath(file_name) == os.path.abspath(self.file_name)
+        directory = os.path.dirname(os.path.abspath(file_name))
+        index = []
+        replaced = False
+        io = tempfile.NamedTemporaryFile(dir=directory, delete=False)
+        try:
+            with io:
+                offset = 0
+                for digest in self._sizes:
+                    if digest in self.data:
+                        value = self.data[digest]
+                        if isinstance(value, CyclicInteractions):
+                            prefix, cycle = value.prefix, value.cycle
+                        else:
+                            prefix, cycle = value, []
+                        data = b"".join(
+                            PackedInteractions.from_interactions(
+                                part
+                            ).to_bytes()
+                            for part in (prefix, cycle)
+                        )
+                        lengths = (len(prefix), len(cycle))
+                    else:
+                        start, length, cycle_length = self._index[digest]
+                        data = self._mmap[start : start + self._sizes[digest]]
+                        lengths = (length, cycle_length)
+                    io.write(data)
+                    index.append((digest, (offset,) + lengths))
+                    offset += len(data)
+                io.write(pickle.dumps(index))
+                io.write(_OFFSET.pack(offset))
+            if own_file:
+                # The mapped file cannot be replaced while it is open on
+                # Windows
+                self.close()
+            os.replace(io.name, file_name)
+            replaced = True
+        except BaseException:
+            if os.path.exists(io.name):
+                os.remove(io.name)
+            raise
+        finally:
+            if own_file and self._mmap is None:
+                if replaced:
+                    self._index = {
+                        digest: location
+                        for digest, location in index
+                        if digest not in self.data
+                    }
+                self._map(self.file_name)
+        return True
+
+    def flush(self) -> bool:
+        """Writes the cache to its file and reopens it. Snapshots of the
+        players held by the cache are kept."""
+        if self.read_only:
+            raise ValueError("Cannot flush a read only cache.")
+        self.save()
+        snapshots = self._snapshots
+        self.load(self.file_name)
+        self._snapshots = snapshots
+        return True
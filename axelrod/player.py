@@ -1,9 +1,10 @@
 import copy
+import hashlib
 import inspect
 import itertools
 import types
 import warnings
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import numpy as np
 from axelrod import _module_random
@@ -82,6 +83,17 @@ class Player(object, metaclass=PostInitCaller):
     name = "Player"
     classifier = {}  # type: Dict[str, Any]
     _reclassifiers = []
+    # The attributes (other than the history and match attributes) that a
+    # strategy changes during play, mapped to their initial values. If the
+    # class that declares these also defines the `__init__` of the strategy,
+    # `reset` sets them instead of calling `__init__` again. Values are
+    # shallow copied, so they should not depend on the init parameters.
+    _reset_attributes = {}  # type: Dict[str, Any]
+    # Set to True by a class whose `__init__`, and those of its subclasses,
+    # only set up state that play does not change, so that `reset` never
+    # needs to call them. Set to False to always call `__init__` in `reset`,
+    # whatever the base classes declare.
+    _fast_reset_subclasses = None  # type: Optional[bool]
 
     def __new__(cls, *args, **kwargs):
         """Caches arguments for Player cloning."""
@@ -97,6 +109,32 @@ class Player(object, metaclass=PostInitCaller):
         Use *args and **kwargs as value if specified
         and complete the rest with the default values.
         """
+        sig, names, defaults = cls._init_signature()
+        if not args and names is not None:
+            # Without positional arguments, binding amounts to filling in the
+            # defaults, in the order of the signature.
+            if not kwargs:
+                return dict(defaults)
+            if len(kwargs) == len(names) and all(
+                name in kwargs for name in names
+            ):
+                return {name: kwargs[name] for name in names}
+        boundargs = sig.bind_partial(*args, **kwargs)
+        boundargs.apply_defaults()
+        return boundargs.arguments
+
+    @classmethod
+    def _init_signature(cls):
+        """
+        Returns the signature of `__init__` without 'self', the names of its
+        parameters (or None if it takes variable arguments) and the default
+        values of the parameters that have them, as a dictionary.
+
+        These are computed once per class.
+        """
+        cached = cls.__dict__.get("_init_signature_cache")
+        if cached is not None:
+            return cached
         sig = inspect.signature(cls.__init__)
         # The 'self' parameter needs to be removed or the first *args will be
         # assigned to it
@@ -104,9 +142,46 @@ class Player(object, metaclass=PostInitCaller):
         new_params = list(sig.parameters.values())
         new_params.remove(self_param)
         sig = sig.replace(parameters=new_params)
-        boundargs = sig.bind_partial(*args, **kwargs)
+        names = tuple(sig.parameters)
+        if any(
+            param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+            for param in new_params
+        ):
+            names = None
+        boundargs = sig.bind_partial()
         boundargs.apply_defaults()
-        return boundargs.arguments
+        cached = (sig, names, dict(boundargs.arguments))
+        cls._init_signature_cache = cached
+        return cached
+
+    @classmethod
+    def _has_fast_reset(cls):
+        """
+        Whether `reset` can set the declared `_reset_attributes` rather than
+        call `__init__`: true if the class declaring them also defines the
+        `__init__` used by the strategy, or if a class defining the
+        `__init__` of the strategy or of one of its base classes sets
+        `_fast_reset_subclasses`. Computed once per class.
+        """
+        cached = cls.__dict__.get("_has_fast_reset_cache")
+        if cached is not None:
+            return cached
+        cached = False
+        if not any(
+            klass.__dict__.get("_fast_reset_subclasses") is False
+            for klass in cls.__mro__
+        ):
+            defines_init = False
+            for klass in cls.__mro__:
+                if klass.__dict__.get("_fast_reset_subclasses"):
+                    cached = True
+                    break
+                if "_reset_attributes" in klass.__dict__:
+                    cached = "__init__" in klass.__dict__ and not defines_init
+                    break
+                defines_init = defines_init or "__init__" in klass.__dict__
+        cls._has_fast_reset_cache = cached
+        return cached
 
     def __init__(self):
         """Initial class setup."""
@@ -224,6 +299,66 @@ class Player(object, metaclass=PostInitCaller):
             prefix = ", "
         return name
 
+    @classmethod
+    def _fingerprint_class_key(cls) -> str:
+        """
+        Returns a description of the class for `fingerprint_key`: the
+        original strategy class and the transformers (with their arguments)
+        applied to it. Computed once per class.
+        """
+        cached = cls.__dict__.get("_fingerprint_class_key_cache")
+        if cached is not None:
+            return cached
+        parts = []
+        for klass in cls.__mro__:
+            decorator = klass.__dict__.get("decorator")
+            if decorator is None:
+                parts.append(
+                    "{}.{}".format(klass.__module__, klass.__qualname__)
+                )
+                break
+            parts.append(
+                "{}{!r}{!r}".format(
+                    klass.__name__,
+                    decorator.args,
+                    sorted(decorator.kwargs.items()),
+                )
+            )
+        cached = "/".join(parts)
+        cls._fingerprint_class_key_cache = cached
+        return cached
+
+    def fingerprint_key(self) -> str:
+        """
+        Returns a hash of what determines the play of the player: its class
+        (including any strategy transformers applied to it), its init
+        parameters and the match attributes it depends on, which are the
+        scores of the game and, if the strategy makes use of it, the length
+        of the match.
+
+        Players with equal keys play identically (given the same random
+        seed). Unlike `__eq__`, the state of the players is not inspected, so
+        the key is cheap enough to recognise identical players when caching
+        results or removing duplicated work.
+
+        Returns
+        -------
+        string
+            The hexadecimal SHA-256 hash of the content of the player
+        """
+        # Imported here as the classifier module depends on this one
+        from axelrod.classifier import Classifiers
+
+        attributes = self.match_attributes
+        parts = [
+            self._fingerprint_class_key(),
+            repr(list(self.init_kwargs.items())),
+            repr(attributes["game"].RPST()),
+        ]
+        if "length" in (Classifiers["makes_use_of"](self) or ()):
+            parts.append(repr(attributes["length"]))
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
     def __getstate__(self):
         """Used for pickling. Override if Player contains unpickleable attributes."""
         return self.__dict__
@@ -252,11 +387,85 @@ class Player(object, metaclass=PostInitCaller):
         of players) to reset a player's state to its initial starting point.
         It ensures that no 'memory' of previous matches is carried forward.
         """
-        # This also resets the history.
-        self.__init__(**self.init_kwargs)
+        if not self._has_fast_reset():
+            # This also resets the history.
+            self.__init__(**self.init_kwargs)
+            return
+        # The classifier is not copied again: it is copied for each player by
+        # `__init__` and only changed when the player is set up, by
+        # `__init__`, transformers or `receive_match_attributes` (which is
+        # called again here), so it already holds its initial value.
+        self._history = History()
+        self.set_match_attributes()
+        for name, value in self._reset_attributes.items():
+            setattr(self, name, copy.copy(value))
+
+    def _snapshot_shared(self):
+        """
+        Returns the objects that snapshots share with the player rather than
+        copy. Strategies may extend this with large attributes that do not
+        change during play.
+        """
+        return [self.init_kwargs, self.match_attributes]
+
+    def _copy_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Copies a dictionary of attributes for `snapshot` and `restore`."""
+        memo = {id(obj): obj for obj in self._snapshot_shared()}
+        copied_state = {}
+        for name, value in state.items():
+            if isinstance(value, History) and id(value) not in memo:
+                memo[id(value)] = value.copy()
+            copied_state[name] = copy.deepcopy(value, memo)
+        return copied_state
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the state of the player: its history, random
+        number generator and strategy specific attributes.
+
+        Passing the snapshot to `restore` returns the player to this state,
+        so that play can be resumed from the current turn. A snapshot can be
+        restored any number of times. State held by a strategy class rather
+        than by its instances (as for Darwin) is not part of the snapshot.
+        """
+        return self._copy_state(self.__dict__)
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Restores the state of the player from a snapshot returned by
+        `snapshot`.
+        """
+        state = self._copy_state(snapshot)
+        for name in list(self.__dict__):
+            if name not in state:
+                delattr(self, name)
+        self.__dict__.update(state)
+
+    def state_key(self):
+        """
+        Returns a hashable summary of the player's state, or None if no such
+        summary is known.
+
+        Within a deterministic match, if both players have the same state
+        keys at two different turns, the play that follows those turns is
+        identical. This is used by `Match` to detect cycles. The default key
+        is built from the last `memory_depth` rounds of play, and strategies
+        with other internal state may override this method.
+        """
+        depth = self.classifier.get("memory_depth", float("inf"))
+        if depth == float("inf"):
+            return None
+        depth = int(depth)
+        if depth == 0:
+            return ()
+        return (
+            min(len(self._history), depth),
+            tuple(self._history[-depth:]),
+            tuple(self._history.coplays[-depth:]),
+        )
 
     def update_history(self, play, coplay):
-        self.history.append(play, coplay)
+        self._history.append(play, coplay)
 
     @property
     def history(self):
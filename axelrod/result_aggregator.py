@@ -0,0 +1,389 @@
+"""
+Aggregation of the results of a tournament as its matches are played.
+
+A ResultSet is usually built from the rows of every interaction of a
+tournament, read from a file. A `ResultAggregator` instead consumes the
+results of each chunk of matches as they are played and keeps only running
+statistics of them:
+
+- means and variances of the payoffs, score differences and lengths of the
+  matches between each pair of players, updated with Welford's algorithm
+  (in its batched form, due to Chan et al., as a chunk holds several
+  repetitions of a match),
+- sums of the cooperations, good partner counts and state and state to
+  action distributions of each pair of players,
+- sums of the wins and scores of each player in each repetition.
+
+Its memory is O(N^2 + N * repetitions) for N players, independent of the
+number of turns of the matches. A `StreamingResultSet` is then built from
+it.
+"""
+
+from collections import Counter
+from typing import List
+
+import numpy as np
+import pandas as pd
+import tqdm
+from axelrod.action import Action
+
+from .columnar import chunk_columns
+from .result_set import ResultSet, update_progress_bar
+
+C, D = Action.C, Action.D
+
+# The columns averaged over the repetitions of a match
+MEAN_COLUMNS = ["Score per turn", "Score difference per turn", "Turns"]
+
+# The columns summed over the interactions of a pair of players
+SUM_COLUMNS = [
+    "Turns",
+    "Cooperation count",
+    "Good partner",
+    "CC count",
+    "CD count",
+    "DC count",
+    "DD count",
+    "CC to C count",
+    "CC to D count",
+    "CD to C count",
+    "CD to D count",
+    "DC to C count",
+    "DC to D count",
+    "DD to C count",
+    "DD to D count",
+]
+
+_STATE_KEYS = [(C, C), (C, D), (D, C), (D, D)]
+_STATE_TO_ACTION_KEYS = [
+    (state, action) for state in _STATE_KEYS for action in (C, D)
+]
+
+
+class ResultAggregator(object):
+    """
+    Keeps running statistics of the results of the matches of a tournament.
+
+    It has the same `write_interactions` interface as the stores of the
+    `axelrod.columnar` module, so the results of each chunk of matches can
+    be passed to it as they are played. The repetitions of a match must be
+    passed together, in order.
+
+    Parameters
+    ----------
+    num_players : int
+        The number of players of the tournament
+    repetitions : int
+        The number of repetitions of each match
+    """
+
+    def __init__(self, num_players: int, repetitions: int) -> None:
+        self.num_players = num_players
+        self.repetitions = repetitions
+        pairs = num_players ** 2
+        self.count = np.zeros(pairs, dtype=np.int64)
+        self.means = np.zeros((pairs, len(MEAN_COLUMNS)))
+        self.squared_deviations = np.zeros((pairs, len(MEAN_COLUMNS)))
+        self.sums = np.zeros((pairs, len(SUM_COLUMNS)), dtype=np.int64)
+        self.wins = np.zeros(num_players * repetitions, dtype=np.int64)
+        self.scores = np.zeros(num_players * repetitions)
+        self.score_per_turn_sums = np.zeros(num_players * repetitions)
+        self.opponents = np.zeros(num_players * repetitions, dtype=np.int64)
+        self.initial_cooperation = np.zeros(num_players, dtype=np.int64)
+        self.interactions = np.zeros(num_players, dtype=np.int64)
+
+    def write_interactions(self, results, interaction_index: int) -> int:
+        """
+        Updates the statistics with the output dictionary of a chunk of
+        matches.
+
+        Parameters
+        ----------
+        results : dict
+            Mapping player index pairs to lists of [interactions, results]
+            pairs, as returned by `Tournament._play_matches`. The
+            interactions are not used and can be None.
+        interaction_index : int
+            The index of the first interaction
+
+        Returns
+        -------
+        int
+            The number of interactions aggregated
+        """
+        columns, interactions = chunk_columns(results, interaction_index)
+        if not interactions:
+            return 0
+        player = np.asarray(columns["Player index"], dtype=np.int64)
+        opponent = np.asarray(columns["Opponent index"], dtype=np.int64)
+        repetition = np.asarray(columns["Repetition"], dtype=np.int64)
+        pair = player * self.num_players + opponent
+
+        np.add.at(
+            self.sums,
+            pair,
+            np.array([columns[column] for column in SUM_COLUMNS]).T,
+        )
+
+        # Self interactions have two rows for a single pair of players: the
+        # mean of both rows counts once.
+        values = np.array([columns[column] for column in MEAN_COLUMNS]).T
+        self_interaction = player == opponent
+        first_rows = np.arange(len(player)) % 2 == 0
+        values[self_interaction] = np.repeat(
+            (values[self_interaction][::2] + values[self_interaction][1::2])
+            / 2,
+            2,
+            axis=0,
+        )
+        keep = ~self_interaction | first_rows
+        self._update_means(pair[keep], values[keep])
+
+        others = ~self_interaction
+        player_repetition = (
+            player[others] * self.repetitions + repetition[others]
+        )
+        np.add.at(
+            self.wins, player_repetition, np.array(columns["Win"])[others]
+        )
+        np.add.at(
+            self.scores, player_repetition, np.array(columns["Score"])[others]
+        )
+        np.add.at(
+            self.score_per_turn_sums,
+            player_repetition,
+            np.array(columns["Score per turn"])[others],
+        )
+        np.add.at(self.opponents, player_repetition, 1)
+        np.add.at(
+            self.initial_cooperation,
+            player[others],
+            np.array(columns["Initial cooperation"], dtype=np.int64)[others],
+        )
+        np.add.at(self.interactions, player[others], 1)
+        return len(interactions)
+
+    def _update_means(self, pair, values) -> None:
+        """Combines the means and squared deviations of a batch of values
+        with those of the previous values of their pairs of players."""
+        pairs, inverse = np.unique(pair, return_inverse=True)
+        batch_count = np.bincount(inverse)
+        batch_means = np.array(
+            [np.bincount(inverse, column) for column in values.T]
+        ).T / batch_count.reshape(-1, 1)
+        batch_squared_deviations = np.array(
+            [
+                np.bincount(inverse, column)
+                for column in ((values - batch_means[inverse]) ** 2).T
+            ]
+        ).T
+
+        count = self.count[pairs].reshape(-1, 1)
+        total = count + batch_count.reshape(-1, 1)
+        delta = batch_means - self.means[pairs]
+        self.means[pairs] += delta * batch_count.reshape(-1, 1) / total
+        self.squared_deviations[pairs] += (
+            batch_squared_deviations
+            + delta ** 2 * count * batch_count.reshape(-1, 1) / total
+        )
+        self.count[pairs] = total[:, 0]
+
+    def matrix(self, values) -> List[List]:
+        """Returns an array indexed by pairs of players as a list of lists,
+        with the values of the pairs that have not played set to 0."""
+        values = np.where(self.count > 0, values, 0)
+        return values.reshape(self.num_players, self.num_players).tolist()
+
+    def mean_matrix(self, column: str) -> List[List[float]]:
+        """Returns the means of a column over the repetitions of the matches
+        between each pair of players."""
+        return self.matrix(self.means[:, MEAN_COLUMNS.index(column)])
+
+    def std_matrix(self, column: str) -> List[List[float]]:
+        """Returns the standard deviations of a column over the repetitions
+        of the matches between each pair of players."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = (
+                self.squared_deviations[:, MEAN_COLUMNS.index(column)]
+                / self.count
+            )
+        return self.matrix(np.sqrt(variance))
+
+    def sum_matrix(self, column: str) -> np.ndarray:
+        """Returns the sums of a column over the interactions of each pair of
+        players."""
+        return self.sums[:, SUM_COLUMNS.index(column)].reshape(
+            self.num_players, self.num_players
+        )
+
+
+class StreamingResultSet(ResultSet):
+    """
+    A class to hold the results of a tournament, built from the running
+    statistics of a ResultAggregator rather than from the interactions of
+    the tournament.
+
+    The values of the individual repetitions of each match are not kept:
+    the `payoffs`, `score_diffs` and `match_lengths` attributes are None,
+    and the plots using them are not available. All the other attributes
+    are those of a ResultSet, with `payoff_matrix`, `payoff_stddevs` and
+    `payoff_diffs_means` computed from the running means and variances.
+    """
+
+    def __init__(self, aggregator, players, progress_bar=True):
+        """
+        Parameters
+        ----------
+            aggregator : axelrod.result_aggregator.ResultAggregator
+                The statistics of the results of the tournament
+            players : list
+                A list of the names of players.
+            progress_bar: boolean
+                If a progress bar will be shown.
+        """
+        self.filename = None
+        self.aggregator = aggregator
+        self.players, self.repetitions = players, aggregator.repetitions
+        self.num_players = len(self.players)
+
+        if progress_bar:
+            self.progress_bar = tqdm.tqdm(total=16, desc="Analysing")
+
+        self._build_from_aggregator()
+
+        if progress_bar:
+            self.progress_bar.close()
+
+    def _build_from_aggregator(self):
+        """Sets the attributes of the result set."""
+        aggregator = self.aggregator
+        self.payoffs = None
+        self.score_diffs = None
+        self.match_lengths = None
+
+        shape = (self.num_players, self.repetitions)
+        self.wins = aggregator.wins.reshape(shape).tolist()
+        self.scores = aggregator.scores.reshape(shape).tolist()
+        self.normalised_scores = self._build_normalised_scores()
+
+        self.cooperation = self._build_cooperation_matrix()
+        self.good_partner_matrix = self._build_good_partner_sum_matrix()
+        self.state_distribution = self._build_distribution(
+            ["CC count", "CD count", "DC count", "DD count"], _STATE_KEYS
+        )
+        self.normalised_state_distribution = (
+            self._build_normalised_state_distribution()
+        )
+        self.state_to_action_distribution = self._build_distribution(
+            [
+                "CC to C count",
+                "CC to D count",
+                "CD to C count",
+                "CD to D count",
+                "DC to C count",
+                "DC to D count",
+                "DD to C count",
+                "DD to D count",
+            ],
+            _STATE_TO_ACTION_KEYS,
+        )
+        self.normalised_state_to_action_distribution = (
+            self._build_normalised_state_to_action_distribution()
+        )
+
+        interactions_series = pd.Series(aggregator.interactions)
+        self.initial_cooperation_count = aggregator.initial_cooperation.tolist()
+        self.initial_cooperation_rate = self._build_initial_cooperation_rate(
+            interactions_series
+        )
+        self.good_partner_rating = self._build_good_partner_rating(
+            interactions_series
+        )
+
+        self.normalised_cooperation = self._build_normalised_cooperation()
+        self.ranking = self._build_ranking()
+        self.ranked_names = self._build_ranked_names()
+
+        self.payoff_matrix = aggregator.mean_matrix("Score per turn")
+        self.payoff_stddevs = aggregator.std_matrix("Score per turn")
+        self.payoff_diffs_means = aggregator.mean_matrix(
+            "Score difference per turn"
+        )
+        self.cooperating_rating = self._build_cooperating_rating()
+        self.vengeful_cooperation = self._build_vengeful_cooperation()
+        self.eigenjesus_rating = self._build_eigenjesus_rating()
+        self.eigenmoses_rating = self._build_eigenmoses_rating()
+
+    def _total_turns(self) -> np.ndarray:
+        """The total number of turns played by each pair of players. The
+        turns of self interactions are counted in both of their rows."""
+        turns = self.aggregator.sum_matrix("Turns").copy()
+        np.fill_diagonal(turns, np.diagonal(turns) // 2)
+        return turns
+
+    @update_progress_bar
+    def _build_normalised_scores(self):
+        aggregator = self.aggregator
+        shape = (self.num_players, self.repetitions)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalised_scores = np.where(
+                aggregator.opponents > 0,
+                aggregator.score_per_turn_sums / aggregator.opponents,
+                0,
+            )
+        return normalised_scores.reshape(shape).tolist()
+
+    @update_progress_bar
+    def _build_cooperation_matrix(self):
+        cooperation = self.aggregator.sum_matrix("Cooperation count").copy()
+        # Address double count
+        np.fill_diagonal(cooperation, np.diagonal(cooperation) // 2)
+        return cooperation.tolist()
+
+    @update_progress_bar
+    def _build_good_partner_sum_matrix(self):
+        good_partner_matrix = self.aggregator.sum_matrix("Good partner").copy()
+        np.fill_diagonal(good_partner_matrix, 0)
+        return good_partner_matrix.tolist()
+
+    @update_progress_bar
+    def _build_distribution(self, columns, keys):
+        counts = np.stack(
+            [self.aggregator.sum_matrix(column) for column in columns], axis=-1
+        )
+        distribution = []
+        for player_index in range(self.num_players):
+            row = []
+            for opponent_index in range(self.num_players):
+                counter = Counter()
+                if player_index != opponent_index:
+                    for key, value in zip(
+                        keys, counts[player_index, opponent_index].tolist()
+                    ):
+                        if value > 0:
+                            counter[key] = value
+                row.append(counter)
+            distribution.append(row)
+        return distribution
+
+    @update_progress_bar
+    def _build_normalised_cooperation(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalised_cooperation = np.nan_to_num(
+                np.array(self.cooperation) / self._total_turns()
+            )
+        return [list(row) for row in normalised_cooperation]
+
+    @update_progress_bar
+    def _build_cooperating_rating(self):
+        turns = self._total_turns()
+        cooperation = np.array(self.cooperation)
+        np.fill_diagonal(turns, 0)
+        np.fill_diagonal(cooperation, 0)
+        # Max is to deal with edge cases of matches that have no turns
+        return [
+            cs / max(1, ls)
+            for cs, ls in zip(
+                cooperation.sum(axis=1).tolist(), turns.sum(axis=1).tolist()
+            )
+        ]
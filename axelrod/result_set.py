@@ -12,6 +12,7 @@ import tqdm
 from axelrod.action import Action
 
 from . import eigen
+from .columnar import is_columnar, read_columns
 
 C, D = Action.C, Action.D
 
@@ -35,8 +36,9 @@ def update_progress_bar(method):
 
 class ResultSet:
     """
-    A class to hold the results of a tournament. Reads in a CSV file produced
-    by the tournament class.
+    A class to hold the results of a tournament. Reads in a CSV file, or a
+    directory in the columnar format (see `axelrod.columnar`), produced by
+    the tournament class.
     """
 
     def __init__(
@@ -46,7 +48,8 @@ class ResultSet:
         Parameters
         ----------
             filename : string
-                the file from which to read the interactions
+                the file (or columnar directory) from which to read the
+                interactions
             players : list
                 A list of the names of players. If not known will be efficiently
                 read from file.
@@ -59,19 +62,54 @@ class ResultSet:
                 If a progress bar will be shown.
         """
         self.filename = filename
+
+        if processes == 0:
+            processes = cpu_count()
+
+        if is_columnar(filename):
+            df = dd.from_pandas(
+                read_columns(filename), npartitions=processes or 1
+            )
+        else:
+            df = dd.read_csv(filename)
+        self._build(df, players, repetitions, processes, progress_bar)
+
+    @classmethod
+    def from_dataframe(cls, df, players, repetitions, progress_bar=True):
+        """
+        Builds a result set from rows held in memory rather than in a file.
+
+        Parameters
+        ----------
+            df : pandas.DataFrame
+                The rows of the interactions, with the columns of the CSV
+                file other than the names of the players and their actions,
+                for example as returned by `axelrod.columnar.ColumnStore`
+            players : list
+                A list of the names of players.
+            repetitions : int
+                The number of repetitions of each match.
+            progress_bar: boolean
+                If a progress bar will be shown.
+        """
+        result_set = cls.__new__(cls)
+        result_set.filename = None
+        result_set._build(df, players, repetitions, None, progress_bar)
+        return result_set
+
+    def _build(self, df, players, repetitions, processes, progress_bar):
+        """
+        Computes the results from the rows of the interactions, held in a
+        pandas or dask DataFrame.
+        """
         self.players, self.repetitions = players, repetitions
         self.num_players = len(self.players)
 
         if progress_bar:
             self.progress_bar = tqdm.tqdm(total=25, desc="Analysing")
 
-        df = dd.read_csv(filename)
-        dask_tasks = self._build_tasks(df)
-
-        if processes == 0:
-            processes = cpu_count()
-
-        out = self._compute_tasks(tasks=dask_tasks, processes=processes)
+        tasks = self._build_tasks(df)
+        out = self._compute_tasks(tasks=tasks, processes=processes)
 
         self._reshape_out(*out)
 
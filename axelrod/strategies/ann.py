@@ -196,6 +196,10 @@ class ANN(Player):
         "long_run_time": False,
     }
 
+    # The weights are not changed by play, so only the history is reset
+    # between matches. The subclasses only pass weights to __init__.
+    _fast_reset_subclasses = True
+
     def __init__(
         self, num_features: int, num_hidden: int, weights: List[float] = None
     ) -> None:
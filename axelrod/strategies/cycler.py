@@ -101,6 +101,25 @@ class Cycler(Player):
         self.cycle_iter = itertools.cycle(str_to_actions(self.cycle))
         self.classifier["memory_depth"] = len(cycle) - 1
 
+    def _snapshot_shared(self):
+        # Iterators cannot be copied so restore rebuilds the cycle instead
+        return super()._snapshot_shared() + [self.cycle_iter]
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        del snapshot["cycle_iter"]
+        return snapshot
+
+    def restore(self, snapshot):
+        super().restore(snapshot)
+        self.cycle_iter = itertools.cycle(str_to_actions(self.cycle))
+        for _ in range(len(self.history) % len(self.cycle)):
+            next(self.cycle_iter)
+
+    def state_key(self):
+        """The position in the cycle."""
+        return len(self.history) % len(self.cycle)
+
 
 class EvolvableCycler(Cycler, EvolvablePlayer):
     """Evolvable version of Cycler."""
@@ -128,6 +128,16 @@ class FSMPlayer(Player):
         else:
             return self.fsm.move(opponent.history[-1])
 
+    def _snapshot_shared(self):
+        """The transitions of the machine are shared by snapshots."""
+        return super()._snapshot_shared() + [self.fsm._state_transitions]
+
+    def state_key(self):
+        """The state of the machine and the opponent's last move."""
+        if len(self.history) == 0:
+            return ()
+        return self.fsm.state, self.history.coplays[-1]
+
 
 class EvolvableFSMPlayer(FSMPlayer, EvolvablePlayer):
     """Abstract base class for evolvable finite state machine players."""
@@ -83,6 +83,14 @@ class ForgetfulGrudger(Player):
             return D
         return C
 
+    def state_key(self):
+        """The grudge and the opponent's last move."""
+        return (
+            self.grudged,
+            self.grudge_memory,
+            tuple(self.history.coplays[-1:]),
+        )
+
 
 class OppositeGrudger(Player):
     """
@@ -229,6 +229,14 @@ class HMMPlayer(Player):
             self.state = self.hmm.state
             return action
 
+    def _snapshot_shared(self):
+        """The parameters of the model are shared by snapshots."""
+        return super()._snapshot_shared() + [
+            self.hmm.transitions_C,
+            self.hmm.transitions_D,
+            self.hmm.emission_probabilities,
+        ]
+
     def set_seed(self, seed=None):
         super().set_seed(seed=seed)
         # Share RNG with HMM
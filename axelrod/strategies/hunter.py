@@ -1,6 +1,6 @@
 from typing import List, Optional, Tuple
 
-from axelrod._strategy_utils import detect_cycle
+from axelrod._strategy_utils import CycleDetector
 from axelrod.action import Action
 from axelrod.player import Player
 
@@ -125,12 +125,14 @@ class CycleHunter(Player):
     def __init__(self) -> None:
         super().__init__()
         self.cycle = None  # type: Optional[Tuple[Action]]
+        self._cycle_detector = CycleDetector()
 
     def strategy(self, opponent: Player) -> Action:
         """Actual strategy definition that determines player's action."""
         if self.cycle:
             return D
-        cycle = detect_cycle(opponent.history, min_size=3)
+        self._cycle_detector.update(opponent.history)
+        cycle = self._cycle_detector.cycle(min_size=3)
         if cycle:
             if len(set(cycle)) > 1:
                 self.cycle = cycle
@@ -148,6 +150,10 @@ class EventualCycleHunter(CycleHunter):
 
     name = "Eventual Cycle Hunter"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._cycle_detector = CycleDetector(offset=10)
+
     def strategy(self, opponent: Player) -> None:
         """Actual strategy definition that determines player's action."""
         if len(opponent.history) < 10:
@@ -156,7 +162,8 @@ class EventualCycleHunter(CycleHunter):
             return C
         if len(opponent.history) % 10 == 0:
             # recheck
-            self.cycle = detect_cycle(opponent.history, offset=10, min_size=3)
+            self._cycle_detector.update(opponent.history)
+            self.cycle = self._cycle_detector.cycle(min_size=3)
         if self.cycle:
             return D
         else:
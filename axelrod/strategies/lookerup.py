@@ -8,6 +8,7 @@ from axelrod.evolvable_player import (
     InsufficientParametersError,
     crossover_dictionaries,
 )
+from axelrod.history import encode_actions
 from axelrod.player import Player
 
 C, D = Action.C, Action.D
@@ -67,6 +68,11 @@ class LookupTable(object):
          Plays(self_plays=(), op_plays=(D), op_openings=(D)): C,}
 
     and then returns a LookupTable with that dictionary.
+
+    The table is also held as a list indexed by the codes of the plays (see
+    `axelrod.history.encode_actions`), in the order of the keys created by
+    `create_lookup_table_keys`, so that `get_from_codes` is a single list
+    read.
     """
 
     def __init__(self, lookup_dict: dict) -> None:
@@ -80,6 +86,12 @@ class LookupTable(object):
             self._plays_depth, self._op_plays_depth, self._op_openings_depth
         )
         self._raise_error_for_bad_lookup_dict()
+        self._table = [None] * len(self._dict)
+        for key, value in self._dict.items():
+            code = encode_actions(
+                key.self_plays + key.op_plays + key.op_openings
+            )
+            self._table[code] = value
 
     def _raise_error_for_bad_lookup_dict(self):
         if any(
@@ -125,6 +137,14 @@ class LookupTable(object):
             Plays(self_plays=plays, op_plays=op_plays, op_openings=op_openings)
         ]
 
+    def get_from_codes(
+        self, plays_code: int, op_plays_code: int, op_openings_code: int
+    ) -> Any:
+        """Returns the same value as `get` for the codes of the plays (see
+        `axelrod.history.encode_actions`)."""
+        code = (plays_code << self._op_plays_depth) | op_plays_code
+        return self._table[(code << self._op_openings_depth) | op_openings_code]
+
     @property
     def player_depth(self) -> int:
         return self._plays_depth
@@ -319,6 +339,10 @@ class LookerUp(Player):
         Plays(self_plays=(), op_plays=(C,), op_openings=()): C,
     }
 
+    # The lookup table is not changed by play, so only the history is reset
+    # between matches. The subclasses only pass tables to __init__.
+    _fast_reset_subclasses = True
+
     def __init__(
         self,
         lookup_dict: dict = None,
@@ -371,18 +395,30 @@ class LookerUp(Player):
         while turn_index < len(self._initial_actions_pool):
             return self._initial_actions_pool[turn_index]
 
-        player_last_n_plays = get_last_n_plays(
-            player=self, depth=self._lookup.player_depth
-        )
-        opponent_last_n_plays = get_last_n_plays(
-            player=opponent, depth=self._lookup.op_depth
-        )
-        opponent_initial_plays = tuple(
-            opponent.history[: self._lookup.op_openings_depth]
+        lookup = self._lookup
+        return lookup.get_from_codes(
+            self.history.recent_code(lookup.player_depth),
+            opponent.history.recent_code(lookup.op_depth),
+            opponent.history.opening_code(lookup.op_openings_depth),
         )
 
-        return self._lookup.get(
-            player_last_n_plays, opponent_last_n_plays, opponent_initial_plays
+    def _snapshot_shared(self):
+        """The lookup table is shared by snapshots."""
+        return super()._snapshot_shared() + [self._lookup]
+
+    def state_key(self):
+        """The recent plays (and the opponent's openings) used to look up
+        the next action, or the turn number while initial actions are
+        played."""
+        turn = len(self.history)
+        horizon = max(len(self._initial_actions_pool), self._lookup.table_depth)
+        plays_depth = self._lookup.player_depth
+        op_depth = self._lookup.op_depth
+        return (
+            min(turn, horizon),
+            tuple(self.history[-plays_depth:]) if plays_depth else (),
+            tuple(self.history.coplays[-op_depth:]) if op_depth else (),
+            tuple(self.history.coplays[: self._lookup.op_openings_depth]),
         )
 
     @property
@@ -85,6 +85,23 @@ class MetaPlayer(Player):
         for t in self.team:
             t.set_match_attributes(**self.match_attributes)
 
+    def _snapshot_shared(self):
+        # The team members are snapshot individually
+        return super()._snapshot_shared() + self.team
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        snapshot["team"] = [(t, t.snapshot()) for t in self.team]
+        return snapshot
+
+    def restore(self, snapshot):
+        snapshot = dict(snapshot)
+        team = snapshot.pop("team")
+        super().restore(snapshot)
+        for t, team_snapshot in team:
+            t.restore(team_snapshot)
+        self.team = [t for t, _ in team]
+
     def __repr__(self):
         team_size = len(self.team)
         return "{}: {} player{}".format(
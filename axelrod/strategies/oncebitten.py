@@ -50,6 +50,15 @@ class OnceBitten(Player):
             return D
         return C
 
+    def state_key(self):
+        """The grudge and the opponent's last two moves."""
+        return (
+            min(len(self.history), 2),
+            self.grudged,
+            self.grudge_memory,
+            tuple(self.history.coplays[-2:]),
+        )
+
 
 class FoolMeOnce(Player):
     """
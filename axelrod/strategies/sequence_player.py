@@ -38,6 +38,21 @@ class SequencePlayer(Player):
         for s in self.sequence_generator:
             return self.meta_strategy(s)
 
+    def _snapshot_shared(self):
+        # Generators cannot be copied so restore rebuilds the sequence instead
+        return super()._snapshot_shared() + [self.sequence_generator]
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        del snapshot["sequence_generator"]
+        return snapshot
+
+    def restore(self, snapshot):
+        super().restore(snapshot)
+        self.sequence_generator = self.clone().sequence_generator
+        for _ in self.history:
+            next(self.sequence_generator)
+
     def __getstate__(self):
         """Generator attributes are not pickleable so we remove and rebuild."""
         return_dict = self.__dict__.copy()
@@ -132,11 +132,15 @@ def StrategyTransformerFactory(
             if strategy_wrapper == dual_wrapper:
 
                 def dual_inner_strategy(self, opponent):
-                    """The dual wrapper requires flipping the history. It may be more efficient
-                    to use a custom History class that tracks a flipped history and swaps labels."""
-                    self._history = self.history.flip_plays()
-                    proposed_action = inner_strategy(self, opponent)
-                    self._history = self.history.flip_plays()
+                    """The dual wrapper requires flipping the history. A view of the
+                    history that flips plays as they are read is used, so that this
+                    does not copy the history."""
+                    history = self._history
+                    self._history = history.flipped()
+                    try:
+                        proposed_action = inner_strategy(self, opponent)
+                    finally:
+                        self._history = history
                     return proposed_action
 
                 outer_strategy = dual_inner_strategy
@@ -70,6 +70,18 @@ class TestDarwin(TestPlayer):
         self.assertEqual(len(p1.history), 0)
         self.assertEqual(p1.genome, [C, C, C, C, D])
 
+    def test_snapshot_and_restore(self):
+        # Overwrite this method because the genome is shared by all instances
+        # and is not part of a snapshot
+        p1 = self.player()
+        snapshot = p1.snapshot()
+        self.versus_test(
+            axl.Defector(), expected_actions=[(C, D)] + [(D, D)] * 4
+        )
+        p1.restore(snapshot)
+        self.assertEqual(len(p1.history), 0)
+        self.assertEqual(p1.genome, [D, C, C, C, D])
+
     def test_all_darwin_instances_share_one_genome(self):
         p1 = self.player()
         p2 = self.player()
@@ -121,6 +121,10 @@ class TestHumanClass(TestPlayer):
         """Overwrite the reset method for this strategy."""
         pass
 
+    def test_snapshot_and_restore(self):
+        """Overwrite the snapshot method for this strategy."""
+        pass
+
     def test_repr(self):
         human = Human()
         self.assertEqual(human.__repr__(), "Human: human")
@@ -3,7 +3,7 @@ import unittest
 
 import axelrod as axl
 from axelrod import Match
-from axelrod.strategies.hunter import detect_cycle
+from axelrod._strategy_utils import detect_cycle
 
 from .test_player import TestPlayer
 
@@ -6,6 +6,7 @@ import unittest
 import axelrod as axl
 from axelrod.action import str_to_actions
 from axelrod.evolvable_player import InsufficientParametersError
+from axelrod.history import encode_actions
 from axelrod.strategies.lookerup import (
     EvolvableLookerUp,
     LookupTable,
@@ -86,6 +87,19 @@ class TestLookupTable(unittest.TestCase):
             LookupTable.from_pattern(just_right, 2, 2, 0), LookupTable
         )
 
+    def test_get_from_codes(self):
+        pattern = tuple(random.choice((C, D)) for _ in range(32))
+        table = LookupTable.from_pattern(pattern, 2, 2, 1)
+        for key in create_lookup_table_keys(2, 2, 1):
+            self.assertEqual(
+                table.get_from_codes(
+                    encode_actions(key.self_plays),
+                    encode_actions(key.op_plays),
+                    encode_actions(key.op_openings),
+                ),
+                table.get(*key),
+            )
+
     def test_dictionary_property_returns_new_dict_object(self):
         table = LookupTable(lookup_dict=self.lookup_dict)
         self.assertIsNot(table.dictionary, table.dictionary)
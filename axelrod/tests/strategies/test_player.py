@@ -6,6 +6,7 @@ import warnings
 
 import axelrod as axl
 import numpy as np
+from axelrod.strategies.lookerup import Plays
 from axelrod.tests.property import strategy_lists
 from hypothesis import given, settings
 from hypothesis.strategies import integers, sampled_from
@@ -145,6 +146,56 @@ class TestPlayerClass(unittest.TestCase):
             self.assertEqual(len(player1.history), turns)
             self.assertEqual(player1.history, player2.history)
 
+    def test_fingerprint_key(self):
+        key = axl.Cycler("CCD").fingerprint_key()
+        self.assertEqual(len(key), 64)
+        self.assertEqual(key, axl.Cycler("CCD").fingerprint_key())
+        self.assertEqual(key, axl.Cycler("CCD").clone().fingerprint_key())
+        self.assertNotEqual(key, axl.Cycler("CD").fingerprint_key())
+        self.assertNotEqual(
+            axl.TitForTat().fingerprint_key(),
+            axl.Cooperator().fingerprint_key(),
+        )
+
+        # The state of the player is not part of the key
+        player = axl.Cycler("CCD")
+        axl.Match((player, axl.Defector()), turns=5).play()
+        self.assertEqual(key, player.fingerprint_key())
+
+        # Transformers and their arguments are part of the key
+        flipped = axl.strategy_transformers.FlipTransformer()
+        noisy = axl.strategy_transformers.NoisyTransformer
+        keys = {
+            player.fingerprint_key()
+            for player in [
+                axl.TitForTat(),
+                flipped(axl.TitForTat)(),
+                noisy(0.1)(axl.TitForTat)(),
+                noisy(0.2)(axl.TitForTat)(),
+                noisy(0.1)(flipped(axl.TitForTat))(),
+            ]
+        }
+        self.assertEqual(len(keys), 5)
+        self.assertEqual(
+            flipped(axl.TitForTat)().fingerprint_key(),
+            flipped(axl.TitForTat)().fingerprint_key(),
+        )
+
+    def test_fingerprint_key_match_attributes(self):
+        player = axl.TitForTat()
+        key = player.fingerprint_key()
+        player.set_match_attributes(game=axl.Game(r=4, s=0, t=5, p=1))
+        self.assertNotEqual(key, player.fingerprint_key())
+
+        player = axl.TitForTat()
+        player.set_match_attributes(length=10, noise=0.1)
+        self.assertEqual(key, player.fingerprint_key())
+
+        player = axl.BackStabber()
+        key = player.fingerprint_key()
+        player.set_match_attributes(length=10)
+        self.assertNotEqual(key, player.fingerprint_key())
+
     def test_equality(self):
         """Test the equality method for some bespoke cases"""
         # Check repr
@@ -285,6 +336,49 @@ class TestPlayerClass(unittest.TestCase):
         p3.player = axl.Cooperator()
         self.assertNotEqual(p1, p3)
 
+    def test_state_key(self):
+        player = axl.TitFor2Tats()
+        self.assertEqual(player.state_key(), (0, (), ()))
+        player.update_history(C, D)
+        player.update_history(D, D)
+        player.update_history(D, C)
+        self.assertEqual(player.state_key(), (2, (D, D), (D, C)))
+
+        self.assertEqual(axl.Cooperator().state_key(), ())
+        self.assertIsNone(axl.Grudger().state_key())
+
+    def test_snapshot_and_restore(self):
+        player = axl.Random()
+        player.set_seed(0)
+        player.update_history(C, D)
+        snapshot = player.snapshot()
+        actions = [player.strategy(None) for _ in range(10)]
+        player.update_history(D, D)
+        player.grudged = True
+
+        player.restore(snapshot)
+        self.assertEqual(player.history, [C])
+        self.assertEqual(player.history.coplays, [D])
+        self.assertFalse(hasattr(player, "grudged"))
+        self.assertEqual([player.strategy(None) for _ in range(10)], actions)
+
+        # The snapshot is not modified by play
+        player.update_history(C, C)
+        player.restore(snapshot)
+        self.assertEqual(player.history, [C])
+        self.assertIsNot(player.history, snapshot["_history"])
+
+    def test_snapshot_shares_parameters(self):
+        player = axl.EvolvedFSM16()
+        snapshot = player.snapshot()
+        self.assertIs(
+            snapshot["fsm"]._state_transitions, player.fsm._state_transitions
+        )
+        self.assertIsNot(snapshot["fsm"], player.fsm)
+
+        player = axl.EvolvedLookerUp2_2_2()
+        self.assertIs(player.snapshot()["_lookup"], player._lookup)
+
     def test_init_params(self):
         """Tests player correct parameters signature detection."""
         self.assertEqual(self.player.init_params(), {})
@@ -347,6 +441,82 @@ class TestPlayerClass(unittest.TestCase):
             TypeError, ParameterisedTestPlayer, "other", "other", "other"
         )
 
+    def test_init_signature_is_cached(self):
+        sig, names, defaults = ParameterisedTestPlayer._init_signature()
+        self.assertIs(
+            ParameterisedTestPlayer._init_signature()[0],
+            sig,
+        )
+        self.assertEqual(names, ("arg_test1", "arg_test2"))
+        self.assertEqual(
+            defaults, {"arg_test1": "testing1", "arg_test2": "testing2"}
+        )
+        # The cache of a parent class is not used by its subclasses
+        self.assertEqual(axl.Player._init_signature()[1], ())
+        # Classes with variable arguments always bind them
+        class VariablePlayer(axl.Player):
+            def __init__(self, *args, **kwargs):
+                super().__init__()
+
+        self.assertIsNone(VariablePlayer._init_signature()[1])
+        self.assertEqual(VariablePlayer("a").init_kwargs["args"], ("a",))
+        self.assertEqual(
+            VariablePlayer().init_kwargs, {"args": (), "kwargs": {}}
+        )
+
+    def test_fast_reset(self):
+        self.assertTrue(axl.TitForTat._has_fast_reset())
+        self.assertTrue(axl.EvolvedLookerUp2_2_2._has_fast_reset())
+        self.assertTrue(axl.Gambler._has_fast_reset())
+        # Strategies defining their own __init__ must declare their state
+        self.assertFalse(ParameterisedTestPlayer._has_fast_reset())
+        self.assertFalse(axl.Cycler._has_fast_reset())
+        self.assertFalse(axl.EvolvableLookerUp._has_fast_reset())
+        # Families declaring that their subclasses only pass on parameters
+        self.assertTrue(axl.PSOGamblerMem1._has_fast_reset())
+        self.assertTrue(axl.EvolvedANN5._has_fast_reset())
+        # Evolvable players are seeded by __init__
+        self.assertFalse(axl.EvolvableGambler._has_fast_reset())
+        self.assertFalse(axl.EvolvableANN._has_fast_reset())
+        # Transformed strategies inherit the reset of the original class
+        transformer = axl.strategy_transformers.FlipTransformer()
+        self.assertTrue(transformer(axl.TitForTat)._has_fast_reset())
+        self.assertFalse(transformer(axl.Cycler)._has_fast_reset())
+
+        class CountingPlayer(axl.Player):
+            _reset_attributes = {"count": 0, "seen": []}
+
+            def __init__(self):
+                super().__init__()
+                self.count = 0
+                self.seen = []
+
+            def strategy(self, opponent):
+                self.count += 1
+                self.seen.append(opponent.history[-1:])
+                return C
+
+        self.assertTrue(CountingPlayer._has_fast_reset())
+        player = CountingPlayer()
+        player.set_match_attributes(length=5)
+        axl.Match((player, axl.Defector()), turns=5, reset=False).play()
+        history = player.history
+        player.reset()
+        self.assertEqual(player, CountingPlayer())
+        self.assertEqual(len(history), 5)
+        self.assertEqual(player.match_attributes["length"], -1)
+        self.assertIsNot(player.seen, CountingPlayer._reset_attributes["seen"])
+
+    def test_fast_reset_keeps_classifier(self):
+        player = axl.LookerUp(parameters=Plays(1, 2, 0), pattern="CD" * 4)
+        classifier = player.classifier
+        self.assertEqual(classifier["memory_depth"], 2)
+        axl.Match((player, axl.Defector()), turns=5).play()
+        player.reset()
+        self.assertEqual(player.classifier, classifier)
+        self.assertIsNot(player.classifier, axl.LookerUp.classifier)
+        self.assertEqual(player.classifier, player.clone().classifier)
+
 
 class TestOpponent(axl.Player):
     """A player who only exists so we have something to test against"""
@@ -535,6 +705,68 @@ class TestPlayer(unittest.TestCase):
                     ),
                 )
 
+    @given(
+        strategies=strategy_lists(
+            max_size=5, strategies=short_run_time_short_mem
+        ),
+    )
+    @settings(max_examples=1, deadline=None)
+    def test_state_key(self, strategies):
+        """
+        Test that detecting cycles using the state key gives the same play as
+        playing every turn.
+        """
+        player = self.player()
+        if axl.Classifiers["stochastic"](player):
+            return
+        for strategy in strategies:
+            opponent = strategy()
+            if axl.Classifiers["stochastic"](opponent):
+                continue
+            match = axl.Match((player, opponent), turns=60)
+            cyclic_match = axl.Match(
+                (player.clone(), opponent.clone()),
+                turns=60,
+                detect_cycles=True,
+            )
+            self.assertEqual(
+                match.play(),
+                cyclic_match.play(),
+                msg="{} failed against opponent={}".format(
+                    player.name, opponent
+                ),
+            )
+
+    @given(seed=integers(min_value=1, max_value=1000))
+    @settings(max_examples=1, deadline=None)
+    def test_snapshot_and_restore(self, seed):
+        """
+        Test that restoring a snapshot of a player taken during a match gives
+        the same subsequent play, any number of times.
+        """
+        player = self.player()
+        opponent = axl.Random()
+        player.set_seed(seed)
+        opponent.set_seed(seed + 1)
+        match = axl.Match((player, opponent), turns=30, reset=False)
+        for p in (player, opponent):
+            p.set_match_attributes(**match.match_attributes)
+        for _ in range(10):
+            match.simultaneous_play(player, opponent)
+        snapshots = player.snapshot(), opponent.snapshot()
+
+        results = []
+        for _ in range(2):
+            player.restore(snapshots[0])
+            opponent.restore(snapshots[1])
+            results.append(
+                [match.simultaneous_play(player, opponent) for _ in range(20)]
+            )
+        self.assertEqual(
+            results[0], results[1], msg="{} failed".format(player.name)
+        )
+        self.assertEqual(len(player.history), 30)
+
     def versus_test(
         self,
         opponent,
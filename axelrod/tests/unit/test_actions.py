@@ -1,4 +1,6 @@
+import pickle
 import unittest
+from collections import Counter
 
 import axelrod as axl
 from axelrod.action import UnknownActionError, actions_to_str, str_to_actions
@@ -33,6 +35,16 @@ class TestAction(unittest.TestCase):
         self.assertEqual(C.flip(), D)
         self.assertEqual(D.flip(), C)
 
+    def test_hash(self):
+        self.assertEqual(len({C, D, C}), 2)
+        counter = pickle.loads(pickle.dumps(Counter([C, D, D])))
+        self.assertEqual(counter[C], 1)
+        self.assertEqual(counter[D], 2)
+        self.assertEqual({(C, D): 1}[(C, D)], 1)
+        # Hashes do not depend on the run
+        self.assertEqual(hash(C), 0)
+        self.assertEqual(hash(D), 1)
+
     def test_from_char(self):
         self.assertEqual(axl.Action.from_char("C"), C)
         self.assertEqual(axl.Action.from_char("D"), D)
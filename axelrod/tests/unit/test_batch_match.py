@@ -0,0 +1,125 @@
+"""Tests for the batch memory-one engine."""
+
+import unittest
+
+import axelrod as axl
+import numpy as np
+from axelrod.batch_match import (
+    batch_to_interactions,
+    is_batchable,
+    memory_one_parameters,
+    play_memory_one_batch,
+)
+from axelrod.random_ import RandomGenerator
+from axelrod.strategy_transformers import DualTransformer
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestMemoryOneParameters(unittest.TestCase):
+    def test_memory_one_player(self):
+        player = axl.MemoryOnePlayer((1, 0.5, 0.25, 0), initial=D)
+        four_vector, initial = memory_one_parameters(player)
+        self.assertTrue(np.array_equal(four_vector, [1, 0.5, 0.25, 0]))
+        self.assertEqual(initial, D)
+
+    def test_win_stay_lose_shift(self):
+        four_vector, initial = memory_one_parameters(axl.WinStayLoseShift())
+        self.assertTrue(np.array_equal(four_vector, [1, 0, 0, 1]))
+        self.assertEqual(initial, C)
+
+    def test_zero_determinant_uses_game(self):
+        player = axl.ZDExtort2()
+        player.set_match_attributes(game=axl.Game(r=3, s=0, t=5, p=1))
+        four_vector, _ = memory_one_parameters(player)
+        self.assertTrue(np.allclose(four_vector, [8 / 9, 1 / 2, 1 / 3, 0]))
+
+    def test_unsupported_players(self):
+        self.assertIsNone(memory_one_parameters(axl.TitForTat()))
+        self.assertIsNone(memory_one_parameters(axl.ALLCorALLD()))
+        self.assertIsNone(memory_one_parameters(DualTransformer()(axl.GTFT)()))
+        self.assertFalse(is_batchable((axl.GTFT(), axl.TitForTat())))
+        self.assertTrue(is_batchable((axl.GTFT(), axl.WinStayLoseShift())))
+
+
+class TestPlayMemoryOneBatch(unittest.TestCase):
+    def test_deterministic_matches_sequential_play(self):
+        players = (
+            axl.WinStayLoseShift(),
+            axl.MemoryOnePlayer((0, 0, 1, 1), initial=C),
+        )
+        plays, coplays = play_memory_one_batch(players, turns=10, repetitions=3)
+        self.assertEqual(plays.shape, (3, 10))
+        expected = axl.Match(players, turns=10).play()
+        for interactions in batch_to_interactions(plays, coplays):
+            self.assertEqual(interactions, expected)
+
+    def test_noise_flips_actions(self):
+        players = (
+            axl.MemoryOnePlayer((1, 1, 1, 1)),
+            axl.MemoryOnePlayer((1, 1, 1, 1)),
+        )
+        plays, coplays = play_memory_one_batch(
+            players, turns=5, repetitions=2, noise=1, random=RandomGenerator(0)
+        )
+        self.assertTrue(np.all(plays == 1))
+        self.assertTrue(np.all(coplays == 1))
+
+    def test_stochastic_rates(self):
+        players = (axl.GTFT(p=0.5), axl.MemoryOnePlayer((0, 0, 0, 0), D))
+        for player in players:
+            player.set_match_attributes()
+        plays, coplays = play_memory_one_batch(
+            players, turns=200, repetitions=200, random=RandomGenerator(1)
+        )
+        self.assertTrue(np.all(coplays == 1))
+        self.assertEqual(plays[0, 0], 0)
+        self.assertAlmostEqual(plays[:, 1:].mean(), 0.5, places=1)
+
+    def test_default_random_generator(self):
+        players = (axl.GTFT(p=0.5), axl.MemoryOnePlayer((0, 0, 0, 0), D))
+        for player in players:
+            player.set_match_attributes()
+        plays, coplays = play_memory_one_batch(
+            players, turns=10, repetitions=3, noise=0.1
+        )
+        self.assertEqual(plays.shape, (3, 10))
+        self.assertEqual(coplays.shape, (3, 10))
+        self.assertTrue(np.all((plays == 0) | (plays == 1)))
+
+    def test_reproducible(self):
+        players = (axl.GTFT(), axl.ZDExtort2())
+        for player in players:
+            player.set_match_attributes()
+        outputs = [
+            play_memory_one_batch(
+                players,
+                turns=20,
+                repetitions=5,
+                noise=0.1,
+                random=RandomGenerator(seed),
+            )
+            for seed in (3, 3, 4)
+        ]
+        self.assertTrue(np.array_equal(outputs[0][0], outputs[1][0]))
+        self.assertTrue(np.array_equal(outputs[0][1], outputs[1][1]))
+        self.assertFalse(np.array_equal(outputs[0][0], outputs[2][0]))
+
+    def test_zero_turns(self):
+        players = (axl.GTFT(), axl.WinStayLoseShift())
+        plays, coplays = play_memory_one_batch(players, turns=0, repetitions=4)
+        self.assertEqual(plays.shape, (4, 0))
+
+    def test_unsupported_players_raise(self):
+        with self.assertRaises(ValueError):
+            play_memory_one_batch(
+                (axl.TitForTat(), axl.GTFT()), turns=5, repetitions=2
+            )
+
+    def test_batch_to_interactions(self):
+        plays = np.array([[0, 1], [1, 1]])
+        coplays = np.array([[1, 0], [0, 0]])
+        self.assertEqual(
+            batch_to_interactions(plays, coplays),
+            [[(C, D), (D, C)], [(D, C), (D, C)]],
+        )
@@ -0,0 +1,174 @@
+import os
+import tempfile
+import unittest
+
+import axelrod as axl
+import numpy as np
+import pandas as pd
+from axelrod.columnar import (
+    ColumnarWriter,
+    ColumnStore,
+    column_file_name,
+    is_columnar,
+    read_columns,
+    read_interactions,
+    read_position,
+)
+from axelrod.interaction_utils import read_interactions_from_file
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestColumnar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.players = [
+            axl.TitForTat(),
+            axl.Random(0.3),
+            axl.Defector(),
+            axl.Alternator(),
+        ]
+        cls.tournament = axl.Tournament(
+            players=cls.players, turns=10, repetitions=3, seed=4
+        )
+        cls.chunks = list(cls.tournament.match_generator.build_match_chunks())
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.directory.name, "interactions.csv")
+        self.npy_directory = os.path.join(self.directory.name, "interactions")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, build_results=True):
+        """Writes the chunks of the tournament in both formats."""
+        tournament = self.tournament
+        tournament.setup_output(self.csv_file)
+        out_file, csv_writer = tournament._get_file_objects(build_results)
+        writer = ColumnarWriter(self.npy_directory, build_results)
+        tournament.num_interactions = 0
+        for chunk in self.chunks:
+            results = tournament._play_matches(chunk, build_results)
+            tournament._write_interactions_to_file(results, csv_writer)
+            self.assertEqual(
+                writer.write_interactions(results, writer.rows // 2),
+                tournament.repetitions,
+            )
+        out_file.close()
+        writer.close()
+
+    def test_is_columnar(self):
+        self.write()
+        self.assertTrue(is_columnar(self.npy_directory))
+        self.assertFalse(is_columnar(self.csv_file))
+        self.assertFalse(is_columnar(self.directory.name))
+
+    def test_columns_match_csv(self):
+        self.write()
+        expected = pd.read_csv(self.csv_file)
+        df = read_columns(self.npy_directory)
+        self.assertEqual(len(df), 2 * 10 * 3)
+        for column in df.columns:
+            if column.startswith("Actions"):
+                continue
+            np.testing.assert_array_equal(
+                df[column].values, expected[column].values, err_msg=column
+            )
+        self.assertEqual(
+            len(df.columns), len(expected.columns) - 3 + 2
+        )  # No names or actions, but their offsets and lengths
+
+    def test_columns_without_results(self):
+        self.write(build_results=False)
+        df = read_columns(self.npy_directory)
+        self.assertEqual(
+            list(df.columns),
+            [
+                "Interaction index",
+                "Player index",
+                "Opponent index",
+                "Repetition",
+                "Actions offset",
+                "Actions length",
+            ],
+        )
+        self.assertEqual(list(df["Interaction index"][:4]), [0, 0, 1, 1])
+        self.assertEqual(list(df["Repetition"][:6]), [0, 0, 1, 1, 2, 2])
+
+    def test_npy_files(self):
+        self.write()
+        score = np.load(
+            os.path.join(self.npy_directory, column_file_name("Score"))
+        )
+        self.assertEqual(score.dtype, np.float64)
+        self.assertEqual(score.shape, (60,))
+        initial_cooperation = np.load(
+            os.path.join(
+                self.npy_directory, column_file_name("Initial cooperation")
+            )
+        )
+        self.assertEqual(initial_cooperation.dtype, np.bool_)
+
+    def test_read_interactions(self):
+        self.write()
+        expected = read_interactions_from_file(
+            self.csv_file, progress_bar=False
+        )
+        interactions = read_interactions(self.npy_directory)
+        self.assertEqual(dict(interactions), dict(expected))
+        self.assertEqual(
+            read_interactions_from_file(self.npy_directory), interactions
+        )
+        self.assertEqual(interactions[(2, 3)][0][:2], [(D, C), (D, D)])
+
+    def test_column_store(self):
+        self.write()
+        store = ColumnStore()
+        interactions = 0
+        for chunk in self.chunks:
+            results = self.tournament._play_matches(
+                chunk, keep_interactions=False
+            )
+            interactions += store.write_interactions(results, interactions)
+        self.assertEqual(interactions, 30)
+        expected = read_columns(self.npy_directory).drop(
+            columns=["Actions offset", "Actions length"]
+        )
+        pd.testing.assert_frame_equal(store.to_dataframe(), expected)
+
+    def test_append_from_position(self):
+        self.write()
+        results = [
+            self.tournament._play_matches(chunk) for chunk in self.chunks
+        ]
+        directory = os.path.join(self.directory.name, "appended")
+        writer = ColumnarWriter(directory)
+        for chunk_results in results[:4]:
+            writer.write_interactions(chunk_results, writer.rows // 2)
+        position = writer.position()
+        self.assertEqual(position, [2 * 4 * 3, writer.actions_size])
+        writer.close()
+        self.assertEqual(read_position(directory), position)
+        writer = ColumnarWriter(directory, position=position)
+        # Rows written after the position are discarded
+        writer.write_interactions(results[4], writer.rows // 2)
+        writer.close()
+
+        writer = ColumnarWriter(directory, position=position)
+        for chunk_results in results[4:]:
+            writer.write_interactions(chunk_results, writer.rows // 2)
+        writer.close()
+        pd.testing.assert_frame_equal(
+            read_columns(directory), read_columns(self.npy_directory)
+        )
+        self.assertEqual(
+            read_interactions(directory), read_interactions(self.npy_directory)
+        )
+
+    def test_empty(self):
+        writer = ColumnarWriter(self.npy_directory)
+        writer.close()
+        self.assertEqual(len(read_columns(self.npy_directory)), 0)
+        self.assertEqual(read_interactions(self.npy_directory), {})
+        self.assertEqual(len(ColumnStore().to_dataframe()), 0)
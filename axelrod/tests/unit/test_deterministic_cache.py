@@ -4,7 +4,9 @@ import pickle
 import unittest
 
 import axelrod as axl
+from axelrod.deterministic_cache import CyclicInteractions
 from axelrod.load_data_ import axl_filename
+from axelrod.packed_interactions import PackedInteractions
 
 C, D = axl.Action.C, axl.Action.D
 
@@ -77,6 +79,16 @@ class TestDeterministicCache(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.cache[invalid_key] = self.test_value
 
+    def test_keys_use_parameters(self):
+        self.cache[(axl.Cycler("CCD"), axl.TitForTat())] = self.test_value
+        self.assertIn((axl.Cycler("CCD"), axl.TitForTat()), self.cache)
+        self.assertNotIn((axl.Cycler("CD"), axl.TitForTat()), self.cache)
+
+    def test_setitem_packed_value(self):
+        value = PackedInteractions.from_interactions(self.test_value)
+        self.cache[self.test_key] = value
+        self.assertEqual(self.cache[self.test_key], value)
+
     def test_setitem_invalid_value_not_list(self):
         with self.assertRaises(ValueError):
             self.cache[self.test_key] = 5
@@ -91,7 +103,31 @@ class TestDeterministicCache(unittest.TestCase):
         self.cache.save(self.test_save_file)
         with open(self.test_save_file, "rb") as f:
             text = f.read()
-        self.assertEqual(text, self.test_pickle)
+        expected_pickle = pickle.dumps(
+            {
+                (
+                    "Tit For Tat",
+                    "Defector",
+                ): PackedInteractions.from_interactions(self.test_value)
+            }
+        )
+        self.assertEqual(text, expected_pickle)
+
+    def test_save_is_compact(self):
+        self.cache[self.test_key] = [(C, D) for _ in range(1000)]
+        self.cache.save(self.test_save_file)
+        packed_size = os.path.getsize(self.test_save_file)
+        with open(self.test_save_file, "wb") as f:
+            pickle.dump(dict(self.cache.data), f)
+        unpacked_size = os.path.getsize(self.test_save_file)
+        self.assertLess(10 * packed_size, unpacked_size)
+
+    def test_save_and_load(self):
+        self.cache[self.test_key] = self.test_value
+        self.cache.save(self.test_save_file)
+        cache = axl.DeterministicCache(file_name=self.test_save_file)
+        self.assertEqual(cache[self.test_key], self.test_value)
+        self.assertIsInstance(cache[self.test_key], list)
 
     def test_load(self):
         self.cache.load(self.test_load_file)
@@ -106,8 +142,143 @@ class TestDeterministicCache(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.cache.load(filename)
 
+    def test_snapshots(self):
+        self.assertIsNone(self.cache.get_snapshots(self.test_key))
+        with self.assertRaises(KeyError):
+            self.cache.set_snapshots(self.test_key, ({}, {}))
+
+        self.cache[self.test_key] = self.test_value
+        snapshots = tuple(player.snapshot() for player in self.test_key)
+        self.cache.set_snapshots(self.test_key, snapshots)
+        self.assertEqual(self.cache.get_snapshots(self.test_key), snapshots)
+
+        # Snapshots are discarded when the entry changes
+        self.cache[self.test_key] = self.test_value
+        self.assertIsNone(self.cache.get_snapshots(self.test_key))
+        self.cache.set_snapshots(self.test_key, snapshots)
+        del self.cache[self.test_key]
+        self.assertIsNone(self.cache.get_snapshots(self.test_key))
+
+    def test_snapshots_with_immutable_cache(self):
+        self.cache[self.test_key] = self.test_value
+        self.cache.mutable = False
+        with self.assertRaises(ValueError):
+            self.cache.set_snapshots(self.test_key, ({}, {}))
+
+    def test_snapshots_not_saved(self):
+        self.cache[self.test_key] = self.test_value
+        snapshots = tuple(player.snapshot() for player in self.test_key)
+        self.cache.set_snapshots(self.test_key, snapshots)
+        self.cache.save(self.test_save_file)
+        cache = axl.DeterministicCache(file_name=self.test_save_file)
+        self.assertIsNone(cache.get_snapshots(self.test_key))
+
     def test_del_item(self):
         self.cache[self.test_key] = self.test_value
         self.assertTrue(self.test_key in self.cache)
         del self.cache[self.test_key]
         self.assertFalse(self.test_key in self.cache)
+
+
+class TestSharedCache(unittest.TestCase):
+    def setUp(self):
+        self.key = (axl.TitForTat(), axl.Defector())
+        self.value = [(C, D), (D, D), (D, D)]
+
+    def test_setitem_packs_values(self):
+        cache = axl.SharedCache()
+        cache[self.key] = self.value
+        self.assertIsInstance(
+            cache.data[("Tit For Tat", "Defector")], PackedInteractions
+        )
+        self.assertEqual(cache[self.key], self.value)
+        with self.assertRaises(ValueError):
+            cache[(axl.Random(), axl.Defector())] = self.value
+
+    def test_getitem_unpacks_values(self):
+        data = {
+            ("Tit For Tat", "Defector"): PackedInteractions.from_interactions(
+                self.value
+            )
+        }
+        cache = axl.SharedCache(data)
+        self.assertIn(self.key, cache)
+        self.assertNotIn((axl.Defector(), axl.TitForTat()), cache)
+        self.assertIsInstance(cache[self.key], list)
+        self.assertEqual(cache[self.key], self.value)
+
+    def test_clear_local(self):
+        data = {}
+        cache = axl.SharedCache(data)
+        cache[self.key] = self.value
+        cache.set_snapshots(self.key, [p.snapshot() for p in self.key])
+        cache.clear_local()
+        self.assertIsNone(cache.get_snapshots(self.key))
+        self.assertEqual(cache._local, {})
+        self.assertEqual(cache[self.key], self.value)
+        self.assertEqual(len(data), 1)
+
+    def test_del_item(self):
+        cache = axl.SharedCache()
+        cache[self.key] = self.value
+        del cache[self.key]
+        self.assertNotIn(self.key, cache)
+
+    def test_shared_between_caches(self):
+        data = {}
+        cache = axl.SharedCache(data)
+        cache[self.key] = self.value
+        other_cache = axl.SharedCache(data)
+        self.assertEqual(other_cache[self.key], self.value)
+
+
+class TestCyclicInteractions(unittest.TestCase):
+    def setUp(self):
+        self.interactions = CyclicInteractions(
+            prefix=[(C, C)], cycle=[(C, D), (D, C)]
+        )
+
+    def test_expand(self):
+        self.assertEqual(self.interactions.expand(0), [])
+        self.assertEqual(self.interactions.expand(1), [(C, C)])
+        self.assertEqual(
+            self.interactions.expand(4), [(C, C), (C, D), (D, C), (C, D)]
+        )
+        self.assertEqual(len(self.interactions.expand(10 ** 6)), 10 ** 6)
+
+    def test_getitem(self):
+        self.assertEqual(self.interactions[0], (C, C))
+        self.assertEqual(self.interactions[2], (D, C))
+        self.assertEqual(self.interactions[1001], (C, D))
+        self.assertEqual(self.interactions[:3], [(C, C), (C, D), (D, C)])
+        self.assertEqual(self.interactions[1:3], [(C, D), (D, C)])
+        with self.assertRaises(IndexError):
+            self.interactions[-1]
+        with self.assertRaises(ValueError):
+            self.interactions[1:]
+
+    def test_empty_cycle(self):
+        with self.assertRaises(ValueError):
+            CyclicInteractions(prefix=[(C, C)], cycle=[])
+
+    def test_equality(self):
+        self.assertEqual(
+            self.interactions,
+            CyclicInteractions(prefix=[(C, C)], cycle=[(C, D), (D, C)]),
+        )
+        self.assertNotEqual(
+            self.interactions,
+            CyclicInteractions(prefix=[], cycle=[(C, D), (D, C)]),
+        )
+        self.assertNotEqual(self.interactions, [(C, C)])
+
+    def test_cache_value(self):
+        cache = axl.DeterministicCache()
+        key = (axl.TitForTat(), axl.Alternator())
+        cache[key] = self.interactions
+        self.assertEqual(cache[key], self.interactions)
+
+    def test_pickle(self):
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.interactions)), self.interactions
+        )
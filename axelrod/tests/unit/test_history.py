@@ -1,8 +1,15 @@
 import unittest
 from collections import Counter
+from itertools import product
 
 import axelrod as axl
-from axelrod.history import History, LimitedHistory
+from axelrod.history import (
+    CODE_DEPTH,
+    FlippedHistory,
+    History,
+    LimitedHistory,
+    encode_actions,
+)
 
 C, D = axl.Action.C, axl.Action.D
 
@@ -46,6 +53,22 @@ class TestHistory(unittest.TestCase):
         h = History([C, D, C], [C, C, C])
         h2 = h.copy()
         self.assertEqual(h, h2)
+        h2.append(D, D)
+        self.assertEqual(h, [C, D, C])
+        self.assertEqual(h.defections, 1)
+        self.assertEqual(h2.defections, 2)
+
+    def test_state_distribution(self):
+        h = History([C, D, D], [C, C, D])
+        self.assertEqual(
+            h.state_distribution, Counter({(C, C): 1, (D, C): 1, (D, D): 1})
+        )
+        h.append(D, D)
+        self.assertEqual(
+            h.state_distribution, Counter({(C, C): 1, (D, C): 1, (D, D): 2})
+        )
+        h.reset()
+        self.assertEqual(h.state_distribution, Counter())
 
     def test_eq(self):
         h = History([C, D, C], [C, C, C])
@@ -91,6 +114,49 @@ class TestHistory(unittest.TestCase):
         self.assertEqual(flipped_flipped_history.cooperations, 3)
         self.assertEqual(flipped_flipped_history.defections, 2)
 
+    def test_encode_actions(self):
+        self.assertEqual(encode_actions([]), 0)
+        self.assertEqual(encode_actions([D, C, D, D]), 0b1011)
+        codes = [encode_actions(plays) for plays in product((C, D), repeat=3)]
+        self.assertEqual(codes, list(range(8)))
+
+    def test_codes(self):
+        for plays in product((C, D), repeat=5):
+            h = History()
+            for turn, play in enumerate(plays, start=1):
+                h.append(play, C)
+                for depth in range(7):
+                    self.assertEqual(
+                        h.recent_code(depth),
+                        encode_actions(plays[:turn][-depth:] if depth else []),
+                    )
+                    self.assertEqual(
+                        h.opening_code(depth),
+                        encode_actions(plays[:depth][:turn]),
+                    )
+            self.assertEqual(
+                h.recent_code(3), History(plays, [C] * 5).recent_code(3)
+            )
+            self.assertEqual(
+                h.opening_code(3), History(plays, [C] * 5).opening_code(3)
+            )
+            h.reset()
+            self.assertEqual(h.recent_code(3), 0)
+            self.assertEqual(h.opening_code(3), 0)
+
+    def test_codes_of_long_history(self):
+        plays = [C, D, D] * CODE_DEPTH
+        h = History()
+        for play in plays:
+            h.append(play, C)
+        for depth in (1, 10, CODE_DEPTH, CODE_DEPTH + 1, 2 * CODE_DEPTH):
+            self.assertEqual(
+                h.recent_code(depth), encode_actions(plays[-depth:])
+            )
+            self.assertEqual(
+                h.opening_code(depth), encode_actions(plays[:depth])
+            )
+
 
 class TestLimitedHistory(unittest.TestCase):
     def test_memory_depth(self):
@@ -108,11 +174,144 @@ class TestLimitedHistory(unittest.TestCase):
         )
         h.append(D, C)
         self.assertEqual(len(h), 3)
-        self.assertEqual(h._plays, [D, C, D])
-        self.assertEqual(h._coplays, [D, D, C])
+        self.assertEqual(list(h), [D, C, D])
+        self.assertEqual(h.coplays, [D, D, C])
+        self.assertEqual(h[0], D)
+        self.assertEqual(h[-1], D)
+        self.assertEqual(h[-2:], [C, D])
+        self.assertEqual(str(h), "DCD")
         self.assertEqual(h.cooperations, 1)
         self.assertEqual(h.defections, 2)
         self.assertEqual(
             h.state_distribution,
             Counter({(D, D): 1, (C, D): 1, (D, C): 1, (C, C): 0}),
         )
+        # Dropped states are kept with a count of zero, and compare as such
+        # on any version of Python
+        self.assertEqual(
+            dict(h.state_distribution),
+            {(D, D): 1, (C, D): 1, (D, C): 1, (C, C): 0},
+        )
+        h.reset()
+        self.assertEqual(dict(h.state_distribution), {})
+
+    def test_copy(self):
+        h = LimitedHistory(3, [C, D, C], [C, C, C])
+        h2 = h.copy()
+        self.assertEqual(h, h2)
+        self.assertEqual(h2.memory_depth, 3)
+        h2.append(D, D)
+        self.assertEqual(h, [C, D, C])
+        self.assertEqual(h2, [D, C, D])
+        self.assertEqual(h.state_distribution, Counter({(C, C): 2, (D, C): 1}))
+
+    def test_ring_buffer(self):
+        h = LimitedHistory(memory_depth=2)
+        plays = [C, D, D, C, D]
+        coplays = [D, D, C, C, D]
+        for turn, (play, coplay) in enumerate(zip(plays, coplays), start=1):
+            h.append(play, coplay)
+            self.assertEqual(list(h), plays[max(0, turn - 2) : turn])
+            self.assertEqual(h.coplays, coplays[max(0, turn - 2) : turn])
+            self.assertEqual(
+                h.state_distribution,
+                Counter(zip(h, h.coplays)),
+            )
+        with self.assertRaises(IndexError):
+            h[2]
+        h.reset()
+        self.assertEqual(list(h), [])
+        self.assertEqual(h.defections, 0)
+
+    def test_init_keeps_last_rounds(self):
+        h = LimitedHistory(2, [C, D, D], [C, C, D])
+        self.assertEqual(list(h), [D, D])
+        self.assertEqual(h.coplays, [C, D])
+
+    def test_zero_memory_depth(self):
+        h = LimitedHistory(0)
+        h.append(C, D)
+        self.assertEqual(len(h), 0)
+        self.assertEqual(h.cooperations, 0)
+
+    def test_flip_plays(self):
+        h = LimitedHistory(2, [C, D, C], [D, D, C])
+        flipped = h.flip_plays()
+        self.assertEqual(flipped.memory_depth, 2)
+        self.assertEqual(list(flipped), [C, D])
+        self.assertEqual(flipped.coplays, [D, C])
+
+    def test_codes(self):
+        h = LimitedHistory(3)
+        for play in [D, C, C, D, C]:
+            h.append(play, C)
+        self.assertEqual(h.recent_code(2), 0b10)
+        self.assertEqual(h.recent_code(5), 0b010)
+        self.assertEqual(h.opening_code(2), 0b01)
+
+
+class TestFlippedHistory(unittest.TestCase):
+    def setUp(self):
+        self.history = History([C, D, C, C], [D, D, C, D])
+        self.flipped = self.history.flipped()
+
+    def test_view(self):
+        self.assertIsInstance(self.flipped, FlippedHistory)
+        self.assertEqual(list(self.flipped), [D, C, D, D])
+        self.assertEqual(self.flipped[0], D)
+        self.assertEqual(self.flipped[-1], D)
+        self.assertEqual(self.flipped[1:3], [C, D])
+        self.assertEqual(len(self.flipped), 4)
+        self.assertEqual(str(self.flipped), "DCDD")
+        self.assertEqual(self.flipped.coplays, [D, D, C, D])
+        self.assertEqual(self.flipped.cooperations, 1)
+        self.assertEqual(self.flipped.defections, 3)
+        self.assertEqual(self.flipped, self.history.flip_plays())
+        self.assertEqual(
+            self.flipped.state_distribution,
+            self.history.flip_plays().state_distribution,
+        )
+
+    def test_shares_storage(self):
+        self.history.append(D, C)
+        self.assertEqual(self.flipped[-1], C)
+        self.assertEqual(len(self.flipped), 5)
+        self.assertEqual(self.flipped.cooperations, 2)
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.flipped.append(C, C)
+        with self.assertRaises(TypeError):
+            self.flipped.extend([C], [C])
+        with self.assertRaises(TypeError):
+            self.flipped.reset()
+
+    def test_flip(self):
+        self.assertIs(self.flipped.flipped(), self.history)
+        self.assertEqual(self.flipped.flip_plays(), self.history)
+        self.assertIsNot(self.flipped.flip_plays(), self.history)
+
+    def test_copy(self):
+        copy = self.flipped.copy()
+        self.assertNotIsInstance(copy, FlippedHistory)
+        self.assertEqual(copy, [D, C, D, D])
+        self.history.append(C, C)
+        self.assertEqual(len(copy), 4)
+
+    def test_limited_history(self):
+        history = LimitedHistory(2, [C, D, D], [C, C, D])
+        flipped = history.flipped()
+        self.assertEqual(list(flipped), [C, C])
+        self.assertEqual(flipped[0], C)
+        self.assertEqual(flipped.coplays, [C, D])
+
+    def test_codes(self):
+        for depth in range(6):
+            self.assertEqual(
+                self.flipped.recent_code(depth),
+                encode_actions(list(self.flipped)[-depth:] if depth else []),
+            )
+            self.assertEqual(
+                self.flipped.opening_code(depth),
+                encode_actions(self.flipped[:depth]),
+            )
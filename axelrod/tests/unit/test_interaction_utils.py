@@ -161,6 +161,43 @@ class TestMatch(unittest.TestCase):
             ),
         )
 
+    def test_packed_interactions(self):
+        functions = [
+            (axl.interaction_utils.compute_scores, self.scores),
+            (axl.interaction_utils.compute_final_score, self.final_scores),
+            (
+                axl.interaction_utils.compute_final_score_per_turn,
+                self.final_score_per_turn,
+            ),
+            (axl.interaction_utils.compute_winner_index, self.winners),
+            (axl.interaction_utils.compute_cooperations, self.cooperations),
+            (
+                axl.interaction_utils.compute_normalised_cooperation,
+                self.normalised_cooperations,
+            ),
+            (
+                axl.interaction_utils.compute_state_distribution,
+                self.state_distribution,
+            ),
+            (
+                axl.interaction_utils.compute_normalised_state_distribution,
+                self.normalised_state_distribution,
+            ),
+            (
+                axl.interaction_utils.compute_state_to_action_distribution,
+                self.state_to_action_distribution,
+            ),
+            (
+                axl.interaction_utils.compute_normalised_state_to_action_distribution,
+                self.normalised_state_to_action_distribution,
+            ),
+            (axl.interaction_utils.compute_sparklines, self.sparklines),
+        ]
+        for function, expected in functions:
+            for inter, expected_value in zip(self.interactions, expected):
+                packed = axl.PackedInteractions.from_interactions(inter)
+                self.assertEqual(expected_value, function(packed))
+
     def test_compute_sparklines(self):
         for inter, spark in zip(self.interactions, self.sparklines):
             self.assertEqual(
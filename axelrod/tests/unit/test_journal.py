@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+import axelrod as axl
+from axelrod.journal import TournamentJournal, group_entry, journal_file_name
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "out.csv.journal")
+        tournament = axl.Tournament(
+            [axl.TitForTat(), axl.Defector()],
+            turns=5,
+            repetitions=5,
+            seed=1,
+            max_repetitions=2,
+        )
+        self.groups = list(
+            tournament.match_generator.build_match_chunk_groups()
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_journal_file_name(self):
+        self.assertEqual(journal_file_name("out.csv"), "out.csv.journal")
+        self.assertEqual(
+            journal_file_name(os.path.join("out", "")), "out.journal"
+        )
+
+    def test_group_entry(self):
+        edge, seeds = group_entry(self.groups[1])
+        self.assertEqual(edge, (0, 1))
+        self.assertEqual(len(seeds), 3)
+        self.assertIsInstance(seeds[0], int)
+
+    def test_record_and_load(self):
+        journal = TournamentJournal(self.file_name, "key")
+        self.assertIsNone(journal.position)
+        self.assertFalse(journal.is_completed(self.groups[0]))
+        journal.record(self.groups[0], 5, 100)
+        journal.record(self.groups[1], 10, 200)
+        journal.close()
+
+        with open(self.file_name) as io:
+            lines = [json.loads(line) for line in io]
+        self.assertEqual(lines[0], {"tournament": "key"})
+        self.assertEqual(lines[2]["edge"], [0, 1])
+        self.assertEqual(
+            [chunk[:2] for chunk in lines[2]["chunks"]],
+            [[0, 2], [2, 2], [4, 1]],
+        )
+
+        journal = TournamentJournal(self.file_name, "key")
+        self.assertTrue(journal.is_completed(self.groups[0]))
+        self.assertTrue(journal.is_completed(self.groups[1]))
+        self.assertFalse(journal.is_completed(self.groups[2]))
+        self.assertEqual(journal.interactions, 10)
+        self.assertEqual(journal.position, 200)
+
+    def test_incomplete_last_line(self):
+        journal = TournamentJournal(self.file_name, "key")
+        journal.record(self.groups[0], 5, 100)
+        journal.close()
+        with open(self.file_name, "a") as io:
+            io.write('{"edge": [0, 1], "chu')
+
+        journal = TournamentJournal(self.file_name, "key")
+        self.assertEqual(len(journal.completed), 1)
+        self.assertEqual(journal.position, 100)
+        journal.record(self.groups[1], 10, 200)
+        journal.close()
+        journal = TournamentJournal(self.file_name, "key")
+        self.assertEqual(len(journal.completed), 2)
+        self.assertEqual(journal.position, 200)
+
+    def test_other_tournament(self):
+        journal = TournamentJournal(self.file_name, "key")
+        journal.record(self.groups[0], 5, 100)
+        journal.close()
+        with self.assertRaises(ValueError):
+            TournamentJournal(self.file_name, "other key")
+
+    def test_reset(self):
+        journal = TournamentJournal(self.file_name, "key")
+        journal.record(self.groups[0], 5, 100)
+        journal.close()
+        journal = TournamentJournal(self.file_name, "key")
+        journal.reset()
+        self.assertFalse(os.path.exists(self.file_name))
+        self.assertEqual(journal.completed, set())
+        self.assertIsNone(journal.position)
+        self.assertEqual(journal.interactions, 0)
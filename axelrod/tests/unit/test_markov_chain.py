@@ -0,0 +1,117 @@
+"""Tests for the exact Markov chain expected outcomes."""
+
+import unittest
+
+import axelrod as axl
+import numpy as np
+from axelrod.markov_chain import (
+    _geometric_sum,
+    expected_outcome,
+    is_analytic,
+)
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestGeometricSum(unittest.TestCase):
+    def test_geometric_sum(self):
+        matrix = np.array([[0.5, 0.5], [0.2, 0.8]])
+        for n in range(7):
+            expected = sum(
+                (np.linalg.matrix_power(matrix, i) for i in range(n)),
+                np.zeros((2, 2)),
+            )
+            self.assertTrue(np.allclose(_geometric_sum(matrix, n), expected))
+
+
+class TestIsAnalytic(unittest.TestCase):
+    def test_is_analytic(self):
+        self.assertTrue(is_analytic((axl.GTFT(), axl.WinStayLoseShift())))
+        self.assertTrue(is_analytic((axl.AON2(), axl.ZDExtort2())))
+        self.assertFalse(is_analytic((axl.GTFT(), axl.TitForTat())))
+        self.assertFalse(is_analytic((axl.Random(), axl.AON2())))
+
+
+class TestExpectedOutcome(unittest.TestCase):
+    def test_deterministic_matches_play(self):
+        players = (
+            axl.WinStayLoseShift(),
+            axl.MemoryOnePlayer((0, 0, 1, 1), initial=C),
+        )
+        match = axl.Match(players, turns=7)
+        match.play()
+        outcome = expected_outcome(players, turns=7)
+        self.assertAlmostEqual(outcome.length, 7)
+        for expected, actual in zip(
+            match.final_score_per_turn(), outcome.score_per_turn
+        ):
+            self.assertAlmostEqual(expected, actual)
+        for expected, actual in zip(
+            match.normalised_cooperation(), outcome.cooperation
+        ):
+            self.assertAlmostEqual(expected, actual)
+        for state, value in match.normalised_state_distribution().items():
+            self.assertAlmostEqual(outcome.state_distribution[state], value)
+
+    def test_memory_two_initial_moves(self):
+        players = (
+            axl.MemoryTwoPlayer(tuple([1] * 16), initial=(D, C)),
+            axl.MemoryTwoPlayer(tuple([0] * 16), initial=(C, C)),
+        )
+        outcome = expected_outcome(players, turns=4)
+        # Plays: D C C C against C C D D
+        self.assertAlmostEqual(outcome.cooperation[0], 3 / 4)
+        self.assertAlmostEqual(outcome.cooperation[1], 2 / 4)
+        self.assertAlmostEqual(outcome.state_distribution[(D, C)], 1 / 4)
+        self.assertAlmostEqual(outcome.state_distribution[(C, C)], 1 / 4)
+        self.assertAlmostEqual(outcome.state_distribution[(C, D)], 2 / 4)
+
+    def test_noise(self):
+        players = (
+            axl.MemoryOnePlayer((1, 1, 1, 1)),
+            axl.MemoryOnePlayer((1, 1, 1, 1)),
+        )
+        outcome = expected_outcome(players, turns=10, noise=0.1)
+        self.assertAlmostEqual(outcome.cooperation[0], 0.9)
+        self.assertAlmostEqual(outcome.state_distribution[(D, D)], 0.01)
+
+    def test_prob_end(self):
+        players = (
+            axl.MemoryOnePlayer((1, 1, 1, 1)),
+            axl.MemoryOnePlayer((0, 0, 0, 0), initial=D),
+        )
+        outcome = expected_outcome(players, prob_end=0.25)
+        self.assertAlmostEqual(outcome.length, 4)
+        self.assertAlmostEqual(outcome.score_per_turn[0], 0)
+        self.assertAlmostEqual(outcome.score_per_turn[1], 5)
+
+        outcome = expected_outcome(players, turns=2, prob_end=0.5)
+        self.assertAlmostEqual(outcome.length, 1.5)
+
+    def test_game(self):
+        players = (
+            axl.MemoryOnePlayer((1, 1, 1, 1)),
+            axl.MemoryOnePlayer((1, 1, 1, 1)),
+        )
+        game = axl.Game(r=4, s=0, t=5, p=1)
+        outcome = expected_outcome(players, turns=3, game=game)
+        self.assertEqual(outcome.score_per_turn, (4, 4))
+
+    def test_stochastic_close_to_sampling(self):
+        players = (axl.GTFT(), axl.AON2())
+        match = axl.Match(players, turns=20, noise=0.05, seed=0)
+        outcome = match.expected_outcome()
+        cooperations = []
+        for _ in range(500):
+            match.play()
+            cooperations.append(match.normalised_cooperation())
+        cooperation = np.mean(cooperations, axis=0)
+        self.assertTrue(
+            np.allclose(cooperation, outcome.cooperation, atol=0.05)
+        )
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            expected_outcome((axl.TitForTat(), axl.GTFT()), turns=5)
+        with self.assertRaises(ValueError):
+            expected_outcome((axl.GTFT(), axl.GTFT()))
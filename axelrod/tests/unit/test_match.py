@@ -2,10 +2,11 @@ import unittest
 from collections import Counter
 
 import axelrod as axl
-from axelrod.deterministic_cache import DeterministicCache
+from axelrod.deterministic_cache import CyclicInteractions, DeterministicCache
+from axelrod.match_summary import MatchSummary
 from axelrod.random_ import RandomGenerator
 from axelrod.tests.property import games
-from hypothesis import example, given
+from hypothesis import example, given, settings
 from hypothesis.strategies import floats, integers
 
 C, D = axl.Action.C, axl.Action.D
@@ -170,6 +171,60 @@ class TestMatch(unittest.TestCase):
         match = axl.Match(players, 3, deterministic_cache=cache)
         self.assertEqual(match.play(), expected_result[:3])
 
+    def test_play_uses_reversed_key(self):
+        cache = DeterministicCache()
+        # a deliberately incorrect result so we can tell it came from the cache
+        cache[(axl.Defector(), axl.Cooperator())] = [(C, C), (D, C), (D, D)]
+        players = (axl.Cooperator(), axl.Defector())
+        match = axl.Match(players, 2, deterministic_cache=cache)
+        self.assertEqual(match.play(), [(C, C), (C, D)])
+        self.assertNotIn(players, cache)
+
+        # The reversed entry is not used if it is too short
+        match = axl.Match(players, 4, deterministic_cache=cache)
+        self.assertEqual(match.play(), [(C, D)] * 4)
+        self.assertIn(players, cache)
+
+    def test_is_order_independent(self):
+        self.assertTrue(
+            axl.match.is_order_independent((axl.TitForTat(), axl.Defector()))
+        )
+        self.assertFalse(
+            axl.match.is_order_independent((axl.TitForTat(), axl.Darwin()))
+        )
+
+    def test_summary(self):
+        match = axl.Match((axl.Cooperator(), axl.Defector()), 3)
+        self.assertEqual(len(match.summary), 0)
+        match.play()
+        self.assertEqual(match.summary.final_score(), (0, 15))
+        self.assertEqual(match.summary.cooperations(), (3, 0))
+
+    @given(turns=integers(min_value=1, max_value=50), seed=integers(0, 100))
+    @settings(max_examples=5, deadline=None)
+    def test_summary_matches_result(self, turns, seed):
+        cache = DeterministicCache()
+        for players in [
+            (axl.Cycler("CCD"), axl.TitForTat()),
+            (axl.TitForTat(), axl.Cycler("CCD")),
+            (axl.Grudger(), axl.Random()),
+            (axl.EvolvedFSM16(), axl.EvolvedLookerUp2_2_2()),
+        ]:
+            for match_turns in [turns, 2 * turns, turns]:
+                match = axl.Match(
+                    players, match_turns, deterministic_cache=cache, seed=seed
+                )
+                match.play()
+                self.assertEqual(
+                    match.summary, MatchSummary.from_interactions(match.result)
+                )
+
+        match = axl.Match((axl.Grudger(), axl.Random()), turns, seed=seed)
+        for _ in match.play_iter():
+            self.assertEqual(
+                match.summary, MatchSummary.from_interactions(match.result)
+            )
+
     def test_cache_grows(self):
         """
         We want to make sure that if we try to use the cache for more turns than
@@ -189,6 +244,76 @@ class TestMatch(unittest.TestCase):
             cache[(axl.Cooperator(), axl.Defector())], expected_result_5_turn
         )
 
+    def test_cache_extends_prefix(self):
+        cache = DeterministicCache()
+        players = (axl.TitForTat(), axl.Alternator())
+        match = axl.Match(players, 3, deterministic_cache=cache)
+        match.play()
+        self.assertIsNotNone(cache.get_snapshots(players))
+
+        # a deliberately incorrect prefix so we can tell it came from the cache
+        snapshots = cache.get_snapshots(players)
+        cache[players] = [(D, D), (D, D), (D, D)]
+        cache.set_snapshots(players, snapshots)
+        match = axl.Match(players, 6, deterministic_cache=cache)
+        expected_result = [(D, D)] * 3 + [(C, D), (D, C), (C, D)]
+        self.assertEqual(match.play(), expected_result)
+        self.assertEqual(cache[players], expected_result)
+        self.assertEqual(len(players[0].history), 6)
+        # The players keep the attributes of the longer match
+        for player in players:
+            self.assertEqual(player.match_attributes["length"], 6)
+
+    @given(
+        turns=integers(min_value=1, max_value=40),
+        extra_turns=integers(min_value=1, max_value=40),
+    )
+    @settings(max_examples=10, deadline=None)
+    def test_cache_extends_prefix_matches_play(self, turns, extra_turns):
+        for players in [
+            (axl.EvolvedFSM16(), axl.EvolvedLookerUp2_2_2()),
+            (axl.Stalker(), axl.OnceBitten()),
+            (axl.MetaHunter(), axl.Cycler("CCDDC")),
+        ]:
+            cache = DeterministicCache()
+            axl.Match(players, turns, deterministic_cache=cache).play()
+            match = axl.Match(
+                players, turns + extra_turns, deterministic_cache=cache
+            )
+            self.assertEqual(
+                match.play(),
+                axl.Match(players, turns + extra_turns).play(),
+            )
+            self.assertEqual(
+                match.summary, MatchSummary.from_interactions(match.result)
+            )
+
+    def test_cache_does_not_extend_prefix(self):
+        # Players making use of the length of the match
+        cache = DeterministicCache()
+        players = (axl.BackStabber(), axl.Cooperator())
+        axl.Match(players, 3, deterministic_cache=cache).play()
+        self.assertIsNone(axl.Match(players, 5)._cached_prefix(players))
+        match = axl.Match(players, 5, deterministic_cache=cache)
+        self.assertIsNone(match._cached_prefix(players))
+
+        # A different game
+        players = (axl.TitForTat(), axl.Alternator())
+        axl.Match(players, 3, deterministic_cache=cache).play()
+        match = axl.Match(players, 5, deterministic_cache=cache)
+        self.assertIsNotNone(match._cached_prefix(players))
+        game = axl.Game(r=4, s=0, t=5, p=1)
+        match = axl.Match(players, 5, deterministic_cache=cache, game=game)
+        self.assertIsNone(match._cached_prefix(players))
+
+        # Players that are not reset
+        match = axl.Match(players, 5, deterministic_cache=cache, reset=False)
+        self.assertIsNone(match._cached_prefix(players))
+
+        # Noisy matches
+        match = axl.Match(players, 5, deterministic_cache=cache, noise=0.1)
+        self.assertIsNone(match._cached_prefix(players))
+
     def test_cache_doesnt_shrink(self):
         """
         We want to make sure that when we access the cache looking for fewer
@@ -208,6 +333,64 @@ class TestMatch(unittest.TestCase):
             cache[(axl.Cooperator(), axl.Defector())], expected_result_5_turn
         )
 
+    def test_detect_cycles(self):
+        cache = DeterministicCache()
+        players = (axl.TitForTat(), axl.Alternator())
+        match = axl.Match(
+            players, 10 ** 6, deterministic_cache=cache, detect_cycles=True
+        )
+        result = match.play()
+        self.assertEqual(len(result), 10 ** 6)
+        self.assertEqual(result[:4], [(C, C), (C, D), (D, C), (C, D)])
+        self.assertEqual(result[-2:], [(D, C), (C, D)])
+        # Only the turns up to the repeated state were played
+        self.assertEqual(len(players[0].history), 4)
+        self.assertEqual(
+            cache[players],
+            CyclicInteractions(prefix=[(C, C), (C, D)], cycle=[(D, C), (C, D)]),
+        )
+
+        # The cached cycle gives results of any length
+        match = axl.Match(players, 7, deterministic_cache=cache)
+        expected = axl.Match((axl.TitForTat(), axl.Alternator()), 7).play()
+        self.assertEqual(match.play(), expected)
+
+    def test_detect_cycles_matches_play(self):
+        for players in [
+            (axl.Fortress3(), axl.EvolvedLookerUp2_2_2()),
+            (axl.CyclerCCD(), axl.WinStayLoseShift()),
+            (axl.OnceBitten(), axl.Cycler("CCDDD")),
+            (axl.ForgetfulGrudger(), axl.Cycler("CCCD")),
+        ]:
+            expected = axl.Match(players, 100).play()
+            clones = [p.clone() for p in players]
+            match = axl.Match(clones, 100, detect_cycles=True)
+            self.assertEqual(match.play(), expected)
+
+    def test_detect_cycles_not_used(self):
+        # Grudger has no state key
+        players = (axl.Grudger(), axl.Alternator())
+        match = axl.Match(players, 20, detect_cycles=True)
+        match.play()
+        self.assertEqual(len(players[0].history), 20)
+        self.assertIsInstance(match._cache[players], list)
+
+        # Noisy matches are not deterministic
+        players = (axl.TitForTat(), axl.Alternator())
+        match = axl.Match(players, 20, noise=0.1, detect_cycles=True, seed=0)
+        match.play()
+        self.assertEqual(len(players[0].history), 20)
+
+    def test_state_key_function(self):
+        self.assertIsNotNone(axl.match.state_key_function(axl.TitForTat()))
+        self.assertIsNotNone(axl.match.state_key_function(axl.Fortress3()))
+        self.assertIsNone(axl.match.state_key_function(axl.Random()))
+        # Uses the length of the match
+        self.assertIsNone(axl.match.state_key_function(axl.BackStabber()))
+        # Transformed players may hold extra state
+        player = axl.strategy_transformers.FlipTransformer()(axl.TitForTat)()
+        self.assertIsNone(axl.match.state_key_function(player))
+
     def test_scores(self):
         player1 = axl.TitForTat()
         player2 = axl.Defector()
@@ -354,6 +537,131 @@ class TestMatch(unittest.TestCase):
         expected_sparklines = "XXXX\nXYXY"
         self.assertEqual(match.sparklines("X", "Y"), expected_sparklines)
 
+    @given(
+        turns=integers(min_value=1, max_value=20),
+        prob_end=floats(min_value=0, max_value=1),
+        seed=integers(min_value=0, max_value=1000),
+    )
+    def test_play_iter_matches_play(self, turns, prob_end, seed):
+        players = (axl.Random(), axl.TitForTat())
+        match = axl.Match(players, turns=turns, prob_end=prob_end, seed=seed)
+        expected = match.play()
+        match = axl.Match(players, turns=turns, prob_end=prob_end, seed=seed)
+        self.assertEqual(list(match.play_iter()), expected)
+        self.assertEqual(match.result, expected)
+
+    def test_play_iter_is_lazy(self):
+        players = (axl.Cooperator(), axl.TitForTat())
+        match = axl.Match(players, turns=10)
+        turns = match.play_iter()
+        self.assertEqual(next(turns), (C, C))
+        self.assertEqual(next(turns), (C, C))
+        self.assertEqual(len(players[0].history), 2)
+        self.assertEqual(match.result, [(C, C), (C, C)])
+
+    def test_play_iter_stop(self):
+        players = (axl.Alternator(), axl.TitForTat())
+        match = axl.Match(players, turns=10)
+        stop = lambda interactions: len(interactions) == 3
+        self.assertEqual(
+            list(match.play_iter(stop=stop)), [(C, C), (D, C), (C, D)]
+        )
+        self.assertEqual(len(players[0].history), 3)
+
+    def test_play_iter_infinite_turns(self):
+        players = (axl.Cooperator(), axl.Grudger())
+        match = axl.Match(players, turns=float("inf"))
+        stop = lambda interactions: len(interactions) == 50
+        self.assertEqual(len(list(match.play_iter(stop=stop))), 50)
+        with self.assertRaises(ValueError):
+            list(match.play_iter())
+
+    def test_play_iter_cache(self):
+        cache = DeterministicCache()
+        players = (axl.Cooperator(), axl.Defector())
+        match = axl.Match(players, 3, deterministic_cache=cache)
+        stop = lambda interactions: len(interactions) == 2
+        self.assertEqual(list(match.play_iter(stop=stop)), [(C, D), (C, D)])
+        # Matches that are stopped early are not cached
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(list(match.play_iter()), [(C, D)] * 3)
+        self.assertEqual(cache[players], [(C, D)] * 3)
+
+        # a deliberately incorrect result so we can tell it came from the cache
+        cache[players] = [(C, C), (D, D), (D, C), (C, C)]
+        match = axl.Match(players, 3, deterministic_cache=cache)
+        self.assertEqual(list(match.play_iter()), [(C, C), (D, D), (D, C)])
+        self.assertEqual(list(match.play_iter(stop=stop)), [(C, C), (D, D)])
+
+    def test_mutual_defection_stop(self):
+        stop = axl.match.mutual_defection_stop(2)
+        self.assertFalse(stop([]))
+        self.assertFalse(stop([(D, D)]))
+        self.assertFalse(stop([(D, D), (C, D)]))
+        self.assertTrue(stop([(C, D), (D, D), (D, D)]))
+
+        players = (axl.TitForTat(), axl.Alternator())
+        match = axl.Match(players, turns=100, noise=0.2, seed=3)
+        result = list(match.play_iter(stop=stop))
+        self.assertLess(len(result), 100)
+        self.assertEqual(result[-2:], [(D, D), (D, D)])
+        self.assertFalse(
+            any(
+                result[i : i + 2] == [(D, D)] * 2
+                for i in range(len(result) - 2)
+            )
+        )
+
+    def test_score_stop(self):
+        stop = axl.match.score_stop(10)
+        players = (axl.Cooperator(), axl.Defector())
+        match = axl.Match(players, turns=100)
+        self.assertEqual(list(match.play_iter(stop=stop)), [(C, D)] * 2)
+        # The totals are reset for a new match
+        self.assertEqual(list(match.play_iter(stop=stop)), [(C, D)] * 2)
+
+        game = axl.Game(r=1, s=0, t=2, p=0)
+        stop = axl.match.score_stop(4, game=game)
+        players = (axl.Cooperator(), axl.Cooperator())
+        match = axl.Match(players, turns=100, game=game)
+        self.assertEqual(len(list(match.play_iter(stop=stop))), 4)
+
+    def test_play_batch(self):
+        players = (axl.GTFT(), axl.WinStayLoseShift())
+        match = axl.Match(players, turns=7, noise=0.1, seed=0)
+        plays, coplays = match.play_batch(4)
+        self.assertEqual(plays.shape, (4, 7))
+        self.assertEqual(coplays.shape, (4, 7))
+
+        match = axl.Match(players, turns=7, noise=0.1, seed=0)
+        repeated_plays, repeated_coplays = match.play_batch(4)
+        self.assertTrue((plays == repeated_plays).all())
+        self.assertTrue((coplays == repeated_coplays).all())
+
+    def test_play_batch_errors(self):
+        match = axl.Match((axl.GTFT(), axl.TitForTat()), turns=5)
+        with self.assertRaises(ValueError):
+            match.play_batch(2)
+
+        match = axl.Match((axl.GTFT(), axl.GTFT()), prob_end=0.5)
+        with self.assertRaises(ValueError):
+            match.play_batch(2)
+
+    def test_expected_outcome(self):
+        players = (axl.GTFT(p=0), axl.MemoryOnePlayer((0, 0, 0, 0), D))
+        match = axl.Match(players, turns=5)
+        outcome = match.expected_outcome()
+        match.play()
+        self.assertAlmostEqual(outcome.length, 5)
+        self.assertEqual(outcome.cooperation, match.normalised_cooperation())
+        self.assertEqual(
+            outcome.state_distribution, match.normalised_state_distribution()
+        )
+
+        match = axl.Match((axl.GTFT(), axl.TitForTat()), turns=5)
+        with self.assertRaises(ValueError):
+            match.expected_outcome()
+
 
 class TestSampleLength(unittest.TestCase):
     def test_sample_length(self):
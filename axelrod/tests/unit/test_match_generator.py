@@ -272,8 +272,144 @@ class TestMatchGenerator(unittest.TestCase):
                 noise=0,
             )
 
+    def test_build_match_chunk_groups(self):
+        rr = axl.MatchGenerator(
+            players=self.players, turns=test_turns, repetitions=7, seed=1
+        )
+        split = axl.MatchGenerator(
+            players=self.players,
+            turns=test_turns,
+            repetitions=7,
+            seed=1,
+            max_repetitions=3,
+        )
+        self.assertEqual(len(split), len(rr))
+        groups = list(split.build_match_chunk_groups())
+        chunks = list(rr.build_match_chunks())
+        self.assertEqual(len(groups), len(chunks))
+        for group, (index_pair, _, _, seed) in zip(groups, chunks):
+            self.assertEqual([chunk[0] for chunk in group], [index_pair] * 3)
+            self.assertEqual([chunk[2] for chunk in group], [3, 2, 2])
+            self.assertEqual(
+                [chunk[3] for chunk in group], axl.derive_seeds(seed, 3)
+            )
+        # Every chunk has its own match parameters
+        self.assertIsNot(groups[0][0][1], groups[0][1][1])
+
+        split = axl.MatchGenerator(
+            players=self.players,
+            turns=test_turns,
+            repetitions=7,
+            seed=1,
+            max_repetitions=7,
+        )
+        self.assertEqual(
+            [chunk[3] for chunk in split.build_match_chunks()],
+            [chunk[3] for chunk in chunks],
+        )
+
+    def test_expected_length(self):
+        rr = axl.MatchGenerator(players=self.players, repetitions=1, turns=5)
+        self.assertEqual(rr.expected_length(), 5)
+        rr = axl.MatchGenerator(
+            players=self.players, repetitions=1, prob_end=0.5
+        )
+        self.assertEqual(rr.expected_length(), 2)
+        rr = axl.MatchGenerator(
+            players=self.players, repetitions=1, turns=5, prob_end=0.1
+        )
+        self.assertEqual(rr.expected_length(), 5)
+        rr = axl.MatchGenerator(
+            players=self.players, repetitions=1, turns=5, prob_end=0
+        )
+        self.assertEqual(rr.expected_length(), 5)
+
+    def test_player_costs(self):
+        players = self.players + [axl.MetaMajority()]
+        rr = axl.MatchGenerator(players=players, repetitions=1, turns=5)
+        self.assertEqual(
+            rr.player_costs(), [1] * 5 + [axl.LONG_RUN_TIME_FACTOR]
+        )
+
+        rr.record_timing((0, 1), seconds=2, turns=10)
+        rr.record_timing((1, 1), seconds=8, turns=20)
+        self.assertEqual(
+            rr.timings,
+            {players[0].name: (1, 10), players[1].name: (9, 50)},
+        )
+        self.assertEqual(
+            rr.player_costs(), [0.1, 0.18] + [0.14] * 3 + [0.14 * 100]
+        )
+
+        rr.record_timing((0, 5), seconds=3, turns=10)
+        self.assertEqual(rr.player_costs()[5], 0.15)
+
+    def test_timings_are_kept_by_strategy(self):
+        timings = {}
+        rr = axl.MatchGenerator(
+            players=[axl.Random(0.1), axl.MetaMajority()],
+            repetitions=1,
+            turns=5,
+            timings=timings,
+        )
+        rr.record_timing((0, 1), seconds=4, turns=10)
+        self.assertEqual(timings, {"Random": (2, 10), "Meta Majority": (2, 10)})
+
+        # Another generator uses the timings of the same strategies, whatever
+        # their indices and parameters
+        rr = axl.MatchGenerator(
+            players=[axl.MetaMajority(), axl.Cooperator(), axl.Random(0.9)],
+            repetitions=1,
+            turns=5,
+            timings=timings,
+        )
+        self.assertEqual(rr.player_costs(), [0.2, 0.2, 0.2])
+        rr.record_timing((1, 1), seconds=1, turns=10)
+        self.assertEqual(timings["Cooperator"], (1, 20))
+
+    def test_estimate_costs(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.MetaMajority()]
+        rr = axl.MatchGenerator(
+            players=players, repetitions=3, turns=5, edges=[(0, 1), (0, 2)]
+        )
+        chunks = list(rr.build_match_chunks())
+        self.assertEqual(rr.estimate_costs(chunks), [30, 101 * 5 * 3])
+
 
 class TestUtilityFunctions(unittest.TestCase):
+    def test_split_repetitions(self):
+        self.assertEqual(axl.split_repetitions(10), [10])
+        self.assertEqual(axl.split_repetitions(10, 10), [10])
+        self.assertEqual(axl.split_repetitions(10, 4), [4, 3, 3])
+        self.assertEqual(axl.split_repetitions(10, 1), [1] * 10)
+
+    @given(
+        repetitions=integers(min_value=1, max_value=100),
+        max_repetitions=integers(min_value=1, max_value=100),
+    )
+    @settings(max_examples=20)
+    def test_split_repetitions_sizes(self, repetitions, max_repetitions):
+        sizes = axl.split_repetitions(repetitions, max_repetitions)
+        self.assertEqual(sum(sizes), repetitions)
+        self.assertLessEqual(max(sizes), max_repetitions)
+        self.assertLessEqual(max(sizes) - min(sizes), 1)
+        self.assertEqual(len(sizes), -(-repetitions // max_repetitions))
+
+    def test_derive_seeds(self):
+        seeds = axl.derive_seeds(5, 4)
+        self.assertEqual(len(set(seeds)), 4)
+        self.assertEqual(seeds, axl.derive_seeds(5, 4))
+        self.assertEqual(seeds[:2], axl.derive_seeds(5, 2))
+        self.assertNotEqual(seeds, axl.derive_seeds(6, 4))
+
+    def test_extension_seed(self):
+        seed = axl.extension_seed(5, 10)
+        self.assertIsInstance(seed, int)
+        self.assertLess(seed, 2 ** 32)
+        self.assertEqual(seed, axl.extension_seed(5, 10))
+        self.assertNotEqual(seed, axl.extension_seed(5, 11))
+        self.assertNotEqual(seed, axl.extension_seed(6, 10))
+
     def test_connected_graph(self):
         edges = [(0, 0), (0, 1), (1, 1)]
         players = ["Cooperator", "Defector"]
@@ -0,0 +1,127 @@
+import unittest
+from collections import Counter
+
+import axelrod as axl
+import axelrod.interaction_utils as iu
+from axelrod.match_summary import MatchSummary
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, sampled_from
+
+C, D = axl.Action.C, axl.Action.D
+
+interaction_lists = lists(
+    sampled_from([(C, C), (C, D), (D, C), (D, D)]), min_size=1, max_size=50
+)
+
+
+class TestMatchSummary(unittest.TestCase):
+    def setUp(self):
+        self.interactions = [(C, D), (D, C), (D, D), (C, C), (C, D)]
+        self.summary = MatchSummary.from_interactions(self.interactions)
+
+    def test_init(self):
+        summary = MatchSummary()
+        self.assertEqual(len(summary), 0)
+        self.assertIsNone(summary.first_state)
+        self.assertIsNone(summary.final_score())
+        self.assertIsNone(summary.final_score_per_turn())
+        self.assertIsNone(summary.winner_index())
+        self.assertIsNone(summary.cooperations())
+        self.assertIsNone(summary.initial_cooperation())
+        self.assertIsNone(summary.state_distribution())
+        self.assertIsNone(summary.state_to_action_distribution())
+
+    def test_counts(self):
+        self.assertEqual(len(self.summary), 5)
+        self.assertEqual(self.summary.first_state, 1)
+        self.assertEqual(self.summary.last_state, 1)
+        self.assertEqual(self.summary.state_counts, [1, 2, 1, 1])
+        self.assertEqual(sum(self.summary.transition_counts), 4)
+        self.assertEqual(self.summary.transition_counts[4 * 1 + 2], 1)
+
+    def test_statistics(self):
+        self.assertEqual(self.summary.final_score(), (9, 14))
+        self.assertEqual(self.summary.final_score_per_turn(), (9 / 5, 14 / 5))
+        self.assertEqual(self.summary.winner_index(), 1)
+        self.assertEqual(self.summary.cooperations(), (3, 2))
+        self.assertEqual(self.summary.initial_cooperation(), (True, False))
+        self.assertEqual(
+            self.summary.state_distribution(),
+            Counter({(C, D): 2, (D, C): 1, (D, D): 1, (C, C): 1}),
+        )
+        self.assertEqual(
+            self.summary.state_to_action_distribution(),
+            [
+                Counter(
+                    {
+                        ((C, D), D): 1,
+                        ((D, C), D): 1,
+                        ((D, D), C): 1,
+                        ((C, C), C): 1,
+                    }
+                ),
+                Counter(
+                    {
+                        ((C, D), C): 1,
+                        ((D, C), D): 1,
+                        ((D, D), C): 1,
+                        ((C, C), D): 1,
+                    }
+                ),
+            ],
+        )
+
+    def test_game(self):
+        game = axl.Game(r=4, s=0, t=5, p=1)
+        self.assertEqual(
+            self.summary.final_score(game),
+            iu.compute_final_score(self.interactions, game),
+        )
+
+    def test_no_winner(self):
+        summary = MatchSummary.from_interactions([(C, C), (D, D)])
+        self.assertIs(summary.winner_index(), False)
+
+    @given(interactions=interaction_lists)
+    @settings(max_examples=20)
+    def test_matches_interaction_utils(self, interactions):
+        summary = MatchSummary.from_interactions(interactions)
+        self.assertEqual(
+            summary.final_score(), iu.compute_final_score(interactions)
+        )
+        self.assertEqual(
+            summary.final_score_per_turn(),
+            iu.compute_final_score_per_turn(interactions),
+        )
+        self.assertEqual(
+            summary.winner_index(), iu.compute_winner_index(interactions)
+        )
+        self.assertEqual(
+            summary.cooperations(), iu.compute_cooperations(interactions)
+        )
+        self.assertEqual(
+            summary.state_distribution(),
+            iu.compute_state_distribution(interactions),
+        )
+        self.assertEqual(
+            summary.state_to_action_distribution(),
+            iu.compute_state_to_action_distribution(interactions),
+        )
+
+    @given(interactions=interaction_lists, split=integers(0, 50))
+    @settings(max_examples=20)
+    def test_extend_packed(self, interactions, split):
+        summary = MatchSummary.from_interactions(interactions[:split])
+        summary.extend(
+            axl.PackedInteractions.from_interactions(interactions[split:])
+        )
+        self.assertEqual(summary, MatchSummary.from_interactions(interactions))
+
+    def test_equality(self):
+        self.assertEqual(
+            self.summary, MatchSummary.from_interactions(self.interactions)
+        )
+        self.assertNotEqual(
+            self.summary, MatchSummary.from_interactions(self.interactions[1:])
+        )
+        self.assertNotEqual(self.summary, self.interactions)
@@ -1,6 +1,7 @@
 import itertools
 import unittest
 from collections import Counter
+from unittest.mock import patch
 
 import axelrod as axl
 import matplotlib.pyplot as plt
@@ -406,7 +407,7 @@ class TestMoranProcess(unittest.TestCase):
             next(mp)
         self.assertEqual(
             list(sorted(mp.populations[-1].items()))[0][0],
-            "EvolvableFSMPlayer: ((0, C, 0, C), (0, D, 1, C), (1, C, 1, D), (1, D, 1, D)), 0, D, 2, 0.1, 2240802643",
+            "EvolvableFSMPlayer: ((0, C, 0, C), (0, D, 1, D), (1, C, 1, C), (1, D, 1, D)), 0, D, 2, 0.1, 1407878363",
         )
         self.assertEqual(len(mp.populations), 11)
         self.assertFalse(mp.fixated)
@@ -445,6 +446,30 @@ class TestMoranProcess(unittest.TestCase):
             for _ in range(10):
                 next(mp)
 
+    def test_score_all_reuses_identical_matches(self):
+        players = [axl.TitForTat() for _ in range(3)] + [
+            axl.Defector() for _ in range(2)
+        ]
+        expected = MoranProcess(players, turns=10, seed=1).score_all()
+        with patch("axelrod.moran.Match", wraps=axl.Match) as match:
+            mp = MoranProcess(players, turns=10, seed=1)
+            self.assertEqual(mp.score_all(), expected)
+        # TitForTat against TitForTat, TitForTat against Defector and
+        # Defector against Defector
+        self.assertEqual(match.call_count, 3)
+        for score, expected_score in zip(expected, [7.8, 7.8, 7.8, 5.2, 5.2]):
+            self.assertAlmostEqual(score, expected_score)
+
+    def test_score_all_plays_every_stochastic_match(self):
+        players = [axl.Random() for _ in range(3)]
+        with patch("axelrod.moran.Match", wraps=axl.Match) as match:
+            MoranProcess(players, turns=10, seed=1).score_all()
+        self.assertEqual(match.call_count, 3)
+        players = [axl.TitForTat() for _ in range(3)]
+        with patch("axelrod.moran.Match", wraps=axl.Match) as match:
+            MoranProcess(players, turns=10, noise=0.1, seed=1).score_all()
+        self.assertEqual(match.call_count, 3)
+
 
 class GraphMoranProcess(unittest.TestCase):
     def test_complete(self):
@@ -0,0 +1,91 @@
+import pickle
+import unittest
+
+import axelrod as axl
+import numpy as np
+from axelrod.packed_interactions import PackedInteractions
+from hypothesis import given, settings
+from hypothesis.strategies import lists, sampled_from
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestPackedInteractions(unittest.TestCase):
+    def setUp(self):
+        self.interactions = [(C, D), (D, C), (D, D), (C, C), (C, D)]
+        self.packed = PackedInteractions.from_interactions(self.interactions)
+
+    def test_init(self):
+        packed = PackedInteractions([0, 1, 1, 0, 0], [1, 0, 1, 0, 1])
+        self.assertEqual(packed, self.packed)
+
+    def test_init_error(self):
+        with self.assertRaises(ValueError):
+            PackedInteractions([0, 1], [1])
+
+    def test_from_interactions(self):
+        self.assertEqual(len(self.packed), 5)
+        self.assertEqual(self.packed.to_list(), self.interactions)
+        self.assertIs(
+            PackedInteractions.from_interactions(self.packed), self.packed
+        )
+
+    def test_empty(self):
+        packed = PackedInteractions.from_interactions([])
+        self.assertEqual(len(packed), 0)
+        self.assertEqual(packed.to_list(), [])
+        self.assertEqual(packed.actions_to_str(0), "")
+
+    @given(
+        interactions=lists(
+            sampled_from([(C, C), (C, D), (D, C), (D, D)]), max_size=100
+        )
+    )
+    @settings(max_examples=20)
+    def test_round_trip(self, interactions):
+        packed = PackedInteractions.from_interactions(interactions)
+        self.assertEqual(packed.to_list(), interactions)
+        self.assertEqual(list(packed), interactions)
+        self.assertEqual(packed.nbytes, (2 * len(interactions) + 7) // 8)
+
+    def test_arrays(self):
+        self.assertTrue(np.array_equal(self.packed.plays, [0, 1, 1, 0, 0]))
+        self.assertTrue(np.array_equal(self.packed.coplays, [1, 0, 1, 0, 1]))
+        self.assertTrue(np.array_equal(self.packed.states, [1, 2, 3, 0, 1]))
+        self.assertFalse(self.packed.array.flags.writeable)
+
+    def test_actions_to_str(self):
+        self.assertEqual(self.packed.actions_to_str(0), "CDDCC")
+        self.assertEqual(self.packed.actions_to_str(1), "DCDCD")
+
+    def test_getitem(self):
+        self.assertEqual(self.packed[0], (C, D))
+        self.assertEqual(self.packed[-1], (C, D))
+        self.assertEqual(self.packed[2], (D, D))
+
+    def test_slice(self):
+        self.assertIsInstance(self.packed[:3], PackedInteractions)
+        self.assertEqual(self.packed[:3], self.interactions[:3])
+        self.assertEqual(self.packed[1:10], self.interactions[1:])
+
+    def test_equality(self):
+        self.assertEqual(self.packed, self.interactions)
+        self.assertEqual(
+            self.packed, PackedInteractions.from_interactions(self.interactions)
+        )
+        self.assertNotEqual(self.packed, self.interactions[:-1])
+        self.assertNotEqual(self.packed, self.packed[:-1])
+        self.assertNotEqual(self.packed, "CDDCC")
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(self.packed[:2]),
+            "PackedInteractions([(C, D), (D, C)])",
+        )
+
+    def test_pickle(self):
+        interactions = [(C, D) if i % 3 else (D, D) for i in range(1000)]
+        packed = PackedInteractions.from_interactions(interactions)
+        pickled = pickle.dumps(packed)
+        self.assertEqual(pickle.loads(pickled), interactions)
+        self.assertLess(10 * len(pickled), len(pickle.dumps(interactions)))
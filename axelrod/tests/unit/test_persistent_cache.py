@@ -0,0 +1,236 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import axelrod as axl
+from axelrod.deterministic_cache import CyclicInteractions
+from axelrod.persistent_cache import content_key
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestContentKey(unittest.TestCase):
+    def test_parameters(self):
+        key = content_key((axl.Cycler("CCD"), axl.TitForTat()))
+        self.assertEqual(len(key), 64)
+        self.assertEqual(key, content_key((axl.Cycler("CCD"), axl.TitForTat())))
+        self.assertNotEqual(
+            key, content_key((axl.Cycler("CD"), axl.TitForTat()))
+        )
+        self.assertNotEqual(
+            key, content_key((axl.TitForTat(), axl.Cycler("CCD")))
+        )
+
+    def test_game(self):
+        players = (axl.TitForTat(), axl.Defector())
+        key = content_key(players)
+        players[0].set_match_attributes(game=axl.Game(r=4, s=0, t=5, p=1))
+        self.assertNotEqual(key, content_key(players))
+
+    def test_length(self):
+        players = (axl.TitForTat(), axl.Defector())
+        key = content_key(players)
+        players[0].set_match_attributes(length=10)
+        self.assertEqual(key, content_key(players))
+
+        players = (axl.BackStabber(), axl.Defector())
+        key = content_key(players)
+        players[0].set_match_attributes(length=10)
+        self.assertNotEqual(key, content_key(players))
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "test.cache")
+        self.key = (axl.TitForTat(), axl.Defector())
+        self.value = [(C, D), (D, D), (D, D)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_init(self):
+        cache = axl.PersistentCache(self.file_name)
+        self.assertEqual(len(cache), 0)
+        self.assertTrue(cache.mutable)
+        self.assertFalse(os.path.exists(self.file_name))
+
+    def test_setitem_and_getitem(self):
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        self.assertIn(self.key, cache)
+        self.assertEqual(cache[self.key], self.value)
+        self.assertNotIn((axl.TitForTat(), axl.Cooperator()), cache)
+        with self.assertRaises(KeyError):
+            cache[(axl.TitForTat(), axl.Cooperator())]
+        with self.assertRaises(ValueError):
+            cache[(axl.Random(), axl.Defector())] = self.value
+
+    def test_flush_and_load(self):
+        cycler_key = (axl.Cycler("CCD"), axl.TitForTat())
+        cyclic_value = CyclicInteractions([(C, C)], [(C, D), (D, C)])
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        cache[cycler_key] = cyclic_value
+        cache.flush()
+        self.assertEqual(cache[self.key], self.value)
+
+        cache = axl.PersistentCache(self.file_name)
+        self.assertEqual(len(cache), 2)
+        self.assertIsInstance(cache[self.key], axl.PackedInteractions)
+        self.assertEqual(cache[self.key], self.value)
+        self.assertEqual(cache[cycler_key], cyclic_value)
+        self.assertNotIn((axl.Cycler("CD"), axl.TitForTat()), cache)
+
+    def test_unflushed_entries_are_not_saved(self):
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        cache.flush()
+        cache[(axl.TitForTat(), axl.Cooperator())] = [(C, C)]
+        self.assertEqual(len(axl.PersistentCache(self.file_name)), 1)
+
+    def test_save_to_other_file(self):
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        other_file_name = os.path.join(self.directory.name, "other.cache")
+        cache.save(other_file_name)
+        self.assertFalse(os.path.exists(self.file_name))
+        self.assertEqual(
+            axl.PersistentCache(other_file_name)[self.key], self.value
+        )
+
+    def test_save_over_mapped_file(self):
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        cache.flush()
+        self.assertIsNotNone(cache._mmap)
+        other_key = (axl.TitForTat(), axl.Cooperator())
+        cache[other_key] = [(C, C)]
+        cache.save()
+        # Entries of the file are not read into memory
+        self.assertIsNotNone(cache._mmap)
+        self.assertEqual(len(cache.data), 1)
+        self.assertEqual(cache[self.key], self.value)
+        self.assertEqual(cache[other_key], [(C, C)])
+        self.assertEqual(len(axl.PersistentCache(self.file_name)), 2)
+
+        other_file_name = os.path.join(self.directory.name, "other.cache")
+        cache.save(other_file_name)
+        self.assertEqual(len(cache.data), 1)
+        other_cache = axl.PersistentCache(other_file_name)
+        self.assertEqual(other_cache[self.key], self.value)
+        self.assertEqual(other_cache[other_key], [(C, C)])
+
+    def test_failed_save_removes_temporary_file(self):
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        cache.flush()
+        cache[(axl.TitForTat(), axl.Cooperator())] = [(C, C)]
+        with patch(
+            "axelrod.persistent_cache.pickle.dumps", side_effect=OSError
+        ):
+            with self.assertRaises(OSError):
+                cache.save()
+        self.assertEqual(os.listdir(self.directory.name), ["test.cache"])
+        self.assertEqual(len(axl.PersistentCache(self.file_name)), 1)
+        self.assertEqual(cache[self.key], self.value)
+
+    def test_delitem(self):
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        cache.flush()
+        del cache[self.key]
+        self.assertNotIn(self.key, cache)
+        with self.assertRaises(KeyError):
+            del cache[self.key]
+        cache.flush()
+        self.assertEqual(len(axl.PersistentCache(self.file_name)), 0)
+
+    def test_read_only(self):
+        cache = axl.PersistentCache(self.file_name)
+        cache[self.key] = self.value
+        cache.flush()
+
+        cache = axl.PersistentCache(self.file_name, read_only=True)
+        self.assertFalse(cache.mutable)
+        self.assertEqual(cache[self.key], self.value)
+        with self.assertRaises(ValueError):
+            cache[self.key] = self.value
+        with self.assertRaises(ValueError):
+            del cache[self.key]
+        with self.assertRaises(ValueError):
+            cache.flush()
+
+    def test_eviction(self):
+        keys = [(axl.Cycler("C" * n), axl.TitForTat()) for n in range(1, 5)]
+        # Each value of 8 turns takes 2 bytes
+        value = [(C, C)] * 8
+        cache = axl.PersistentCache(self.file_name, max_size=6)
+        for key in keys[:3]:
+            cache[key] = value
+        self.assertEqual(len(cache), 3)
+
+        # Using an entry makes it the most recently used
+        cache[keys[0]]
+        cache[keys[3]] = value
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn(keys[1], cache)
+        self.assertIn(keys[0], cache)
+
+        cache.flush()
+        self.assertEqual(list(cache), list(axl.PersistentCache(self.file_name)))
+        cache = axl.PersistentCache(self.file_name, max_size=4)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(keys[2], cache)
+
+    def test_eviction_keeps_newest_entry(self):
+        cache = axl.PersistentCache(self.file_name, max_size=1)
+        cache[self.key] = [(C, C)] * 100
+        self.assertIn(self.key, cache)
+
+    def test_load_error_for_incorrect_format(self):
+        with open(self.file_name, "wb") as io:
+            pickle.dump(range(5), io)
+        with self.assertRaises(ValueError):
+            axl.PersistentCache(self.file_name)
+
+    def test_pickle(self):
+        cache = axl.PersistentCache(self.file_name, read_only=False)
+        cache[self.key] = self.value
+        cache.flush()
+        other_key = (axl.TitForTat(), axl.Cooperator())
+        cache[other_key] = [(C, C)]
+
+        unpickled = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(unpickled.file_name, self.file_name)
+        self.assertEqual(unpickled[self.key], self.value)
+        self.assertEqual(unpickled[other_key], [(C, C)])
+
+    def test_match(self):
+        cache = axl.PersistentCache(self.file_name)
+        players = (axl.Cycler("CCD"), axl.TitForTat())
+        expected = axl.Match(players, turns=20).play()
+        match = axl.Match(players, turns=20, deterministic_cache=cache)
+        self.assertEqual(match.play(), expected)
+        cache.flush()
+
+        cache = axl.PersistentCache(self.file_name, read_only=True)
+        # a deliberately incorrect value so we can tell it came from the cache
+        cache.data[content_key(players)] = [(D, D)] * 20
+        match = axl.Match(players, turns=10, deterministic_cache=cache)
+        self.assertEqual(match.play(), [(D, D)] * 10)
+
+        # Players with other parameters or another game are not confused
+        other_players = (axl.Cycler("CD"), axl.TitForTat())
+        match = axl.Match(other_players, turns=20, deterministic_cache=cache)
+        self.assertEqual(
+            match.play(), axl.Match(other_players, turns=20).play()
+        )
+        game = axl.Game(r=4, s=0, t=5, p=1)
+        match = axl.Match(
+            players, turns=20, game=game, deterministic_cache=cache
+        )
+        self.assertNotIn(tuple(match.players), cache)
+        self.assertEqual(match.play(), expected)
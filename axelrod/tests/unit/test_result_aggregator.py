@@ -0,0 +1,189 @@
+import unittest
+
+import axelrod as axl
+import numpy as np
+from axelrod.result_aggregator import ResultAggregator
+from axelrod.tests.property import tournaments
+from hypothesis import given, settings
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestResultAggregator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.players = [axl.Random(0.4), axl.TitForTat(), axl.Defector()]
+        cls.tournament = axl.Tournament(
+            players=cls.players, turns=10, repetitions=4, seed=1
+        )
+        cls.results = [
+            cls.tournament._play_matches(chunk, keep_interactions=False)
+            for chunk in cls.tournament.match_generator.build_match_chunks()
+        ]
+
+    def aggregate(self, results):
+        aggregator = ResultAggregator(len(self.players), 4)
+        interactions = 0
+        for chunk_results in results:
+            interactions += aggregator.write_interactions(
+                chunk_results, interactions
+            )
+        self.assertEqual(interactions, 6 * 4)
+        return aggregator
+
+    def test_write_interactions(self):
+        aggregator = self.aggregate(self.results)
+        np.testing.assert_array_equal(aggregator.count, [4] * 9)
+        np.testing.assert_array_equal(aggregator.interactions, [8, 8, 8])
+        self.assertEqual(
+            aggregator.sum_matrix("Turns")[0].tolist(), [80, 40, 40]
+        )
+        self.assertEqual(
+            aggregator.mean_matrix("Turns"), [[10.0] * 3 for _ in range(3)]
+        )
+        self.assertEqual(aggregator.wins.reshape(3, 4)[2].tolist(), [2] * 4)
+
+    def test_means_and_standard_deviations(self):
+        aggregator = self.aggregate(self.results)
+        payoffs = [
+            [match_results[3][0] for _, match_results in chunk_results[(0, 2)]]
+            for chunk_results in self.results
+            if (0, 2) in chunk_results
+        ][0]
+        self.assertAlmostEqual(
+            aggregator.mean_matrix("Score per turn")[0][2], np.mean(payoffs)
+        )
+        self.assertAlmostEqual(
+            aggregator.std_matrix("Score per turn")[0][2], np.std(payoffs)
+        )
+
+        # Self interactions count the mean of both players once
+        payoffs = [
+            np.mean(match_results[3])
+            for chunk_results in self.results
+            if (0, 0) in chunk_results
+            for _, match_results in chunk_results[(0, 0)]
+        ]
+        self.assertAlmostEqual(
+            aggregator.mean_matrix("Score per turn")[0][0], np.mean(payoffs)
+        )
+
+    def test_repetitions_in_several_batches(self):
+        results = []
+        for chunk_results in self.results:
+            for index_pair, repetitions in chunk_results.items():
+                results.append({index_pair: repetitions[:1]})
+                results.append({index_pair: repetitions[1:]})
+        aggregator = self.aggregate(self.results)
+        batched = ResultAggregator(len(self.players), 4)
+        for chunk_results in results:
+            batched.write_interactions(chunk_results, 0)
+        np.testing.assert_allclose(batched.means, aggregator.means)
+        np.testing.assert_allclose(
+            batched.squared_deviations,
+            aggregator.squared_deviations,
+            atol=1e-12,
+        )
+        np.testing.assert_array_equal(batched.sums, aggregator.sums)
+
+    def test_pairs_that_have_not_played(self):
+        aggregator = ResultAggregator(2, 3)
+        self.assertEqual(aggregator.mean_matrix("Turns"), [[0, 0], [0, 0]])
+        self.assertEqual(
+            aggregator.std_matrix("Score per turn"), [[0, 0], [0, 0]]
+        )
+        self.assertEqual(aggregator.write_interactions({}, 0), 0)
+
+
+class TestStreamingResultSet(unittest.TestCase):
+    exact_attributes = [
+        "wins",
+        "scores",
+        "ranked_names",
+        "cooperation",
+        "normalised_cooperation",
+        "cooperating_rating",
+        "good_partner_matrix",
+        "good_partner_rating",
+        "state_distribution",
+        "normalised_state_distribution",
+        "state_to_action_distribution",
+        "normalised_state_to_action_distribution",
+        "initial_cooperation_count",
+        "initial_cooperation_rate",
+    ]
+    approximate_attributes = [
+        "normalised_scores",
+        "payoff_matrix",
+        "payoff_stddevs",
+        "payoff_diffs_means",
+        "vengeful_cooperation",
+    ]
+
+    def assert_matches(self, result_set, streaming_result_set):
+        self.assertIsNone(streaming_result_set.payoffs)
+        self.assertIsNone(streaming_result_set.score_diffs)
+        self.assertIsNone(streaming_result_set.match_lengths)
+        for attribute in self.exact_attributes:
+            self.assertEqual(
+                getattr(result_set, attribute),
+                getattr(streaming_result_set, attribute),
+                msg=attribute,
+            )
+        for attribute in self.approximate_attributes:
+            np.testing.assert_allclose(
+                getattr(result_set, attribute),
+                getattr(streaming_result_set, attribute),
+                atol=1e-12,
+                err_msg=attribute,
+            )
+
+    def test_matches_result_set(self):
+        players = [
+            axl.Random(0.3),
+            axl.TitForTat(),
+            axl.Defector(),
+            axl.Alternator(),
+            axl.Grudger(),
+        ]
+        for kwargs in [
+            {"turns": 20, "repetitions": 5},
+            {"prob_end": 0.1, "repetitions": 4, "noise": 0.1},
+            {
+                "turns": 10,
+                "repetitions": 3,
+                "edges": [(0, 1), (1, 2), (2, 2), (3, 0), (4, 2)],
+            },
+        ]:
+            result_set = axl.Tournament(players, seed=3, **kwargs).play(
+                progress_bar=False
+            )
+            streaming_result_set = axl.Tournament(
+                players, seed=3, **kwargs
+            ).play(progress_bar=False, streaming=True)
+            self.assertIsInstance(streaming_result_set, axl.StreamingResultSet)
+            self.assert_matches(result_set, streaming_result_set)
+
+    @given(tournament=tournaments(max_size=4, max_turns=10, max_repetitions=3))
+    @settings(max_examples=5, deadline=None)
+    def test_matches_result_set_for_any_tournament(self, tournament):
+        # Seeding the matches the same way plays the same matches twice
+        tournament.match_generator.random_generator = axl.BulkRandomGenerator(1)
+        result_set = tournament.play(progress_bar=False)
+        tournament.match_generator.random_generator = axl.BulkRandomGenerator(1)
+        streaming_result_set = tournament.play(
+            progress_bar=False, streaming=True
+        )
+        self.assert_matches(result_set, streaming_result_set)
+
+    def test_summarise(self):
+        players = [axl.Cooperator(), axl.TitForTat(), axl.Defector()]
+        result_set = axl.Tournament(players, turns=5, repetitions=2).play(
+            progress_bar=False
+        )
+        streaming_result_set = axl.Tournament(
+            players, turns=5, repetitions=2
+        ).play(progress_bar=False, streaming=True)
+        self.assertEqual(
+            result_set.summarise(), streaming_result_set.summarise()
+        )
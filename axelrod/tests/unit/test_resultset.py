@@ -227,6 +227,25 @@ class TestResultSet(unittest.TestCase):
         self.assertEqual(rs.players, self.players)
         self.assertEqual(rs.num_players, len(self.players))
 
+    def test_from_dataframe(self):
+        df = pd.read_csv(self.filename).drop(
+            columns=["Player name", "Opponent name", "Actions"]
+        )
+        rs = axl.ResultSet.from_dataframe(
+            df, self.players, self.repetitions, progress_bar=False
+        )
+        self.assertIsNone(rs.filename)
+        self.assertEqual(rs.num_players, len(self.players))
+        self.assertEqual(
+            rs,
+            axl.ResultSet(
+                self.filename,
+                self.players,
+                self.repetitions,
+                progress_bar=False,
+            ),
+        )
+
     def _clear_matrix(self, matrix):
         for i, row in enumerate(matrix):
             for j, _ in enumerate(row):
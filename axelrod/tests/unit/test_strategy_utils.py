@@ -3,6 +3,7 @@ import unittest
 
 import axelrod as axl
 from axelrod._strategy_utils import (
+    CycleDetector,
     detect_cycle,
     recursive_thue_morse,
     thue_morse_generator,
@@ -63,6 +64,52 @@ class TestDetectCycle(unittest.TestCase):
         self.assertIsNone(detect_cycle([C, C, D] * 2, min_size=1, max_size=2))
 
 
+class TestCycleDetector(unittest.TestCase):
+    @given(
+        history=lists(sampled_from([C, D]), max_size=40),
+        min_size=integers(min_value=1, max_value=5),
+        max_size=integers(min_value=0, max_value=12),
+        offset=integers(min_value=0, max_value=10),
+    )
+    @settings(max_examples=50)
+    def test_matches_detect_cycle(self, history, min_size, max_size, offset):
+        detector = CycleDetector(max_size=max_size, offset=offset)
+        for turn in range(len(history) + 1):
+            detector.update(history[:turn])
+            self.assertEqual(
+                detector.cycle(min_size=min_size),
+                detect_cycle(
+                    history[:turn],
+                    min_size=min_size,
+                    max_size=max_size,
+                    offset=offset,
+                ),
+            )
+
+    def test_update_with_skipped_elements(self):
+        detector = CycleDetector()
+        detector.update([C, D, D])
+        self.assertIsNone(detector.cycle())
+        detector.update([C, D, D, C, D, D])
+        self.assertEqual(detector.cycle(), (C, D, D))
+
+    def test_reset_when_history_shrinks(self):
+        detector = CycleDetector()
+        detector.update([C, D, C, D])
+        self.assertEqual(detector.cycle(), (C, D))
+        detector.update([D, D])
+        self.assertEqual(detector.cycle(), (D,))
+        detector.reset()
+        self.assertIsNone(detector.cycle())
+
+    def test_keeps_bounded_history(self):
+        detector = CycleDetector(max_size=3)
+        detector.update([C, D] * 50)
+        self.assertEqual(detector.cycle(), (C, D))
+        self.assertEqual(len(detector._head), 3)
+        self.assertEqual(len(detector._tail), 3)
+
+
 class TestRecursiveThueMorse(unittest.TestCase):
     def test_initial_values(self):
         self.assertEqual(recursive_thue_morse(0), 0)
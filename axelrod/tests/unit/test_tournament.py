@@ -4,6 +4,7 @@ import logging
 import os
 import pathlib
 import pickle
+import tempfile
 import unittest
 import warnings
 from multiprocessing import Queue, cpu_count
@@ -63,6 +64,18 @@ class RecordedTQDM(tqdm):
         cls.record = []
 
 
+class RaisingPlayer(axl.Player):
+    """A player raising an error against Defector while `fail` is set."""
+
+    name = "Raising Player"
+    fail = True
+
+    def strategy(self, opponent):
+        if self.fail and opponent.name == "Defector":
+            raise ValueError("Raised against Defector")
+        return C
+
+
 class TestTournament(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -205,6 +218,418 @@ class TestTournament(unittest.TestCase):
 
         self.assertFalse(os.path.isfile(self.test_tournament.filename))
 
+    def test_play_temp_directory_removed(self):
+        self.test_tournament.play(
+            filename=None, progress_bar=False, output_format="npy"
+        )
+        self.assertIsNone(self.test_tournament._temp_file_descriptor)
+        self.assertFalse(os.path.exists(self.test_tournament.filename))
+
+    def test_setup_output_with_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.test_tournament.setup_output(output_format="json")
+
+    def test_play_npy_output(self):
+        expected = self.test_tournament.play(progress_bar=False)
+        with tempfile.TemporaryDirectory() as directory:
+            results = self.test_tournament.play(
+                progress_bar=False, filename=directory, output_format="npy"
+            )
+            self.assertTrue(os.path.isfile(os.path.join(directory, "win.npy")))
+            self.assertEqual(self.test_tournament.num_interactions, 15)
+            self.assertEqual(
+                len(
+                    axl.interaction_utils.read_interactions_from_file(directory)
+                ),
+                15,
+            )
+        self.assertEqual(results, expected)
+
+        results = self.test_tournament.play(
+            progress_bar=False, processes=2, output_format="npy"
+        )
+        self.test_tournament.close()
+        self.assertEqual(results, expected)
+
+    def play_interrupted(self, tournament, groups, **kwargs):
+        """Plays a resumable tournament which is interrupted once the
+        interactions of a number of pairs of players have been written."""
+        write = axl.Tournament._write_interactions_to_file
+        calls = []
+
+        def interrupted_write(self, *args, **kwargs):
+            calls.append(None)
+            if len(calls) > groups:
+                raise KeyboardInterrupt
+            return write(self, *args, **kwargs)
+
+        with patch.object(
+            axl.Tournament, "_write_interactions_to_file", interrupted_write
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                tournament.play(progress_bar=False, resume=True, **kwargs)
+        tournament.close()
+
+    def test_play_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for output_format in ["csv", "npy"]:
+                for processes in [None, 2]:
+                    tournament = axl.Tournament(
+                        players=self.players,
+                        turns=20,
+                        repetitions=4,
+                        seed=3,
+                        max_repetitions=3,
+                    )
+                    filename = os.path.join(
+                        directory,
+                        "expected{}{}".format(output_format, processes),
+                    )
+                    expected = tournament.play(
+                        progress_bar=False,
+                        filename=filename,
+                        processes=processes,
+                        output_format=output_format,
+                    )
+                    tournament.close()
+
+                    filename = os.path.join(
+                        directory, "{}{}".format(output_format, processes)
+                    )
+                    tournament = axl.Tournament(
+                        players=self.players,
+                        turns=20,
+                        repetitions=4,
+                        seed=3,
+                        max_repetitions=3,
+                    )
+                    self.play_interrupted(
+                        tournament,
+                        6,
+                        filename=filename,
+                        processes=processes,
+                        output_format=output_format,
+                    )
+                    journal = axl.journal.TournamentJournal(
+                        filename + ".journal",
+                        tournament._journal_key(),
+                    )
+                    self.assertEqual(len(journal.completed), 6)
+
+                    tournament = axl.Tournament(
+                        players=self.players,
+                        turns=20,
+                        repetitions=4,
+                        seed=3,
+                        max_repetitions=3,
+                    )
+                    with patch.object(
+                        tournament,
+                        "_play_matches",
+                        wraps=tournament._play_matches,
+                    ) as play_matches:
+                        results = tournament.play(
+                            progress_bar=False,
+                            filename=filename,
+                            output_format=output_format,
+                            resume=True,
+                        )
+                    # The 6 pairs of the journal are not played again
+                    self.assertEqual(play_matches.call_count, 2 * (15 - 6))
+                    self.assertEqual(results, expected)
+                    self.assertEqual(tournament.num_interactions, 60)
+                    self.assertEqual(
+                        len(
+                            axl.interaction_utils.read_interactions_from_file(
+                                filename, progress_bar=False
+                            )
+                        ),
+                        15,
+                    )
+
+                    # Resuming a completed tournament plays no matches
+                    with patch.object(
+                        tournament, "_play_matches"
+                    ) as play_matches:
+                        results = tournament.play(
+                            progress_bar=False,
+                            filename=filename,
+                            output_format=output_format,
+                            resume=True,
+                        )
+                    play_matches.assert_not_called()
+                    self.assertEqual(results, expected)
+
+    def test_play_resume_writes_same_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            expected_filename = os.path.join(directory, "expected.csv")
+            filename = os.path.join(directory, "resumed.csv")
+            axl.Tournament(players=self.players, turns=5, seed=1).play(
+                progress_bar=False, filename=expected_filename
+            )
+            tournament = axl.Tournament(players=self.players, turns=5, seed=1)
+            self.play_interrupted(tournament, 4, filename=filename)
+            # Rows written after the last pair of the journal are discarded
+            with open(filename, "a") as io:
+                io.write("4,0,1,0,Cooperator,Tit")
+            tournament = axl.Tournament(players=self.players, turns=5, seed=1)
+            tournament.play(progress_bar=False, filename=filename, resume=True)
+            with open(expected_filename) as expected, open(filename) as io:
+                self.assertEqual(io.read(), expected.read())
+
+    def test_play_resume_with_removed_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "out.csv")
+            tournament = axl.Tournament(players=self.players, turns=5, seed=1)
+            self.play_interrupted(tournament, 4, filename=filename)
+            os.remove(filename)
+            tournament.play(progress_bar=False, filename=filename, resume=True)
+            self.assertEqual(tournament.num_interactions, 150)
+
+    def test_play_resume_errors(self):
+        with self.assertRaises(ValueError):
+            self.test_tournament.play(progress_bar=False, resume=True)
+        with self.assertRaises(ValueError):
+            self.test_tournament.play(
+                progress_bar=False, filename=self.filename, resume=True
+            )
+        tournament = axl.Tournament(players=self.players, turns=5, seed=1)
+        with self.assertRaises(ValueError):
+            tournament.play(
+                progress_bar=False,
+                filename=self.filename,
+                resume=True,
+                in_memory=True,
+            )
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "out.csv")
+            tournament.play(progress_bar=False, filename=filename, resume=True)
+            # The journal was written by a tournament with other parameters
+            tournament = axl.Tournament(players=self.players, turns=6, seed=1)
+            with self.assertRaises(ValueError):
+                tournament.play(
+                    progress_bar=False, filename=filename, resume=True
+                )
+
+    def test_extend(self):
+        players = [axl.Random(0.3), axl.TitForTat(), axl.Defector()]
+        new_players = [axl.Alternator(), axl.Random(0.6)]
+        with tempfile.TemporaryDirectory() as directory:
+            for output_format in ["csv", "npy"]:
+                filename = os.path.join(directory, output_format)
+                tournament = axl.Tournament(
+                    players=players, turns=10, repetitions=3, seed=2
+                )
+                tournament.play(
+                    progress_bar=False,
+                    filename=filename,
+                    output_format=output_format,
+                )
+                interactions = (
+                    axl.interaction_utils.read_interactions_from_file(
+                        filename, progress_bar=False
+                    )
+                )
+
+                with patch.object(
+                    tournament,
+                    "_play_matches",
+                    wraps=tournament._play_matches,
+                ) as play_matches:
+                    results = tournament.extend(new_players, progress_bar=False)
+                # Only the pairs including a new player are played
+                self.assertEqual(
+                    sorted(
+                        call[0][0][0] for call in play_matches.call_args_list
+                    ),
+                    [(0, 3), (0, 4), (1, 3), (1, 4), (2, 3), (2, 4)]
+                    + [(3, 3), (3, 4), (4, 4)],
+                )
+                self.assertEqual(tournament.num_interactions, 15 * 3)
+                self.assertEqual(
+                    results.players, [str(p) for p in players + new_players]
+                )
+                self.assertEqual(len(results.wins), 5)
+
+                extended_interactions = (
+                    axl.interaction_utils.read_interactions_from_file(
+                        filename, progress_bar=False
+                    )
+                )
+                self.assertEqual(len(extended_interactions), 15)
+                for index_pair, pair_interactions in interactions.items():
+                    self.assertEqual(
+                        extended_interactions[index_pair], pair_interactions
+                    )
+
+                # The players given to the tournament are not modified
+                self.assertEqual(len(players), 3)
+                self.assertEqual(len(tournament.players), 5)
+                # Later plays are of all the players
+                self.assertEqual(tournament.match_generator.size, 15)
+                self.assertIsNone(tournament.match_generator.edges)
+
+                # Extending a tournament with a seed is reproducible
+                tournament = axl.Tournament(
+                    players=players, turns=10, repetitions=3, seed=2
+                )
+                filename = os.path.join(directory, output_format + "2")
+                tournament.play(
+                    progress_bar=False,
+                    filename=filename,
+                    output_format=output_format,
+                )
+                self.assertEqual(
+                    tournament.extend(new_players, progress_bar=False),
+                    results,
+                )
+
+    def test_extend_without_results(self):
+        players = [axl.Random(0.3), axl.Defector()]
+        with tempfile.TemporaryDirectory() as directory:
+            for output_format in ["csv", "npy"]:
+                filenames = []
+                for build_results in [True, False]:
+                    filename = os.path.join(
+                        directory, output_format + str(build_results)
+                    )
+                    tournament = axl.Tournament(
+                        players=players, turns=5, repetitions=2, seed=1
+                    )
+                    tournament.play(
+                        build_results=build_results,
+                        progress_bar=False,
+                        filename=filename,
+                        output_format=output_format,
+                    )
+                    results = tournament.extend(
+                        [axl.TitForTat()], progress_bar=False
+                    )
+                    self.assertEqual(results is None, not build_results)
+                    filenames.append(filename)
+
+                if output_format == "csv":
+                    # The new rows have the columns of the previous rows
+                    df = pd.read_csv(filenames[1])
+                    self.assertEqual(len(df.columns), 7)
+                    self.assertEqual(len(df), 2 * 6 * 2)
+                    self.assertFalse(df.isnull().values.any())
+                self.assertEqual(
+                    axl.interaction_utils.read_interactions_from_file(
+                        filenames[1], progress_bar=False
+                    ),
+                    axl.interaction_utils.read_interactions_from_file(
+                        filenames[0], progress_bar=False
+                    ),
+                )
+
+    def test_extend_in_parallel(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "out.csv")
+            tournament = axl.Tournament(
+                players=self.players[:3], turns=5, repetitions=2, seed=1
+            )
+            tournament.play(progress_bar=False, filename=filename)
+            results = tournament.extend(
+                self.players[3:], filename=filename, progress_bar=False
+            )
+            tournament = axl.Tournament(
+                players=self.players[:3], turns=5, repetitions=2, seed=1
+            )
+            tournament.play(progress_bar=False, filename=filename)
+            self.assertEqual(
+                tournament.extend(
+                    self.players[3:],
+                    filename=filename,
+                    processes=2,
+                    progress_bar=False,
+                ),
+                results,
+            )
+            tournament.close()
+
+    def test_extend_errors(self):
+        tournament = axl.Tournament(players=self.players, turns=5)
+        with self.assertRaises(ValueError):
+            tournament.extend([axl.Cooperator()])
+        tournament.play(progress_bar=False)
+        # The temporary output of the play has been removed
+        with self.assertRaises(ValueError):
+            tournament.extend([axl.Cooperator()])
+        # The tournament is left unchanged
+        self.assertEqual(len(tournament.players), len(self.players))
+        self.assertEqual(tournament.match_generator.size, 15)
+        with self.assertRaises(ValueError):
+            tournament.extend([], filename=self.filename)
+
+        tournament = axl.Tournament(
+            players=self.players[:2], turns=5, edges=[(0, 1)]
+        )
+        with self.assertRaises(ValueError):
+            tournament.extend([axl.Cooperator()], filename=self.filename)
+
+    def test_play_in_memory(self):
+        expected = self.test_tournament.play(progress_bar=False)
+        results = self.test_tournament.play(progress_bar=False, in_memory=True)
+        self.assertIsNone(self.test_tournament.filename)
+        self.assertIsNone(self.test_tournament._temp_file_descriptor)
+        self.assertIsNone(self.test_tournament._result_store)
+        self.assertEqual(self.test_tournament.num_interactions, 15)
+        self.assertEqual(results, expected)
+
+        # The interactions are only written to a file if asked to
+        results = self.test_tournament.play(
+            progress_bar=False, in_memory=True, filename=self.filename
+        )
+        self.assertEqual(results, expected)
+        self.assertEqual(
+            len(
+                axl.interaction_utils.read_interactions_from_file(self.filename)
+            ),
+            15,
+        )
+
+        results = self.test_tournament.play(
+            progress_bar=False, in_memory=True, processes=2
+        )
+        self.test_tournament.close()
+        self.assertEqual(results, expected)
+
+    def test_play_streaming(self):
+        results = self.test_tournament.play(progress_bar=False, streaming=True)
+        self.assertIsInstance(results, axl.StreamingResultSet)
+        self.assertIsNone(self.test_tournament.filename)
+        self.assertIsNone(self.test_tournament._temp_file_descriptor)
+        self.assertIsNone(self.test_tournament._result_store)
+        self.assertEqual(self.test_tournament.num_interactions, 15)
+        self.assertEqual(len(results.wins), len(self.players))
+
+        results = self.test_tournament.play(
+            progress_bar=False, streaming=True, processes=2
+        )
+        self.test_tournament.close()
+        self.assertIsInstance(results, axl.StreamingResultSet)
+        self.assertEqual(self.test_tournament.num_interactions, 15)
+
+    def test_play_in_memory_without_results(self):
+        with warnings.catch_warnings(record=True) as w:
+            results = self.test_tournament.play(
+                progress_bar=False, in_memory=True, build_results=False
+            )
+            self.assertEqual(len(w), 1)
+        self.assertIsNone(results)
+        self.assertEqual(self.test_tournament.num_interactions, 15)
+
+    def test_play_matches_without_interactions(self):
+        chunk = next(self.test_tournament.match_generator.build_match_chunks())
+        results = self.test_tournament._play_matches(
+            chunk, keep_interactions=False
+        )
+        for interaction, match_results in results[(0, 0)]:
+            self.assertIsNone(interaction)
+            self.assertEqual(len(match_results), 10)
+
     def test_play_resets_filename_and_temp_file_descriptor_each_time(self):
         self.test_tournament.play(progress_bar=False)
         self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
@@ -573,17 +998,22 @@ class TestTournament(unittest.TestCase):
             turns=axl.DEFAULT_TURNS,
             repetitions=self.test_repetitions,
         )
-        chunks = tournament.match_generator.build_match_chunks()
-        for chunk in chunks:
-            work_queue.put(chunk)
-        tournament._start_workers(workers, work_queue, done_queue)
+        chunks = list(
+            enumerate(tournament.match_generator.build_match_chunks())
+        )
+        work_queue.put((chunks[:10], True, True))
+        work_queue.put((chunks[10:], True, True))
+        processes = tournament._start_workers(workers, work_queue, done_queue)
+        self.assertEqual(len(processes), workers)
 
-        stops = 0
-        while stops < workers:
-            payoffs = done_queue.get()
-            if payoffs == "STOP":
-                stops += 1
-        self.assertEqual(stops, workers)
+        results = [done_queue.get() for _ in range(2)]
+        self.assertEqual(sorted(len(r) for r in results), [5, 10])
+        for _ in range(workers):
+            work_queue.put("STOP")
+        stops = [done_queue.get() for _ in range(workers)]
+        self.assertEqual(stops, ["STOP"] * workers)
+        for process in processes:
+            process.join()
 
     def test_worker(self):
         tournament = axl.Tournament(
@@ -595,23 +1025,217 @@ class TestTournament(unittest.TestCase):
         )
 
         work_queue = Queue()
-        chunks = tournament.match_generator.build_match_chunks()
-        count = 0
-        for chunk in chunks:
-            work_queue.put(chunk)
-            count += 1
+        chunks = list(
+            enumerate(tournament.match_generator.build_match_chunks())
+        )
+        work_queue.put((chunks[:1], True, True))
+        work_queue.put((chunks[1:], False, True))
         work_queue.put("STOP")
 
         done_queue = Queue()
         tournament._worker(work_queue, done_queue)
-        for r in range(count):
+        for batch, build_results in ((chunks[:1], True), (chunks[1:], False)):
             new_matches = done_queue.get()
-            for index_pair, matches in new_matches.items():
-                self.assertIsInstance(index_pair, tuple)
+            self.assertEqual(len(new_matches), len(batch))
+            for (key, interactions, seconds), (expected_key, chunk) in zip(
+                new_matches, batch
+            ):
+                self.assertEqual(key, expected_key)
+                self.assertGreaterEqual(seconds, 0)
+                index_pair, matches = list(interactions.items())[0]
+                self.assertEqual(index_pair, chunk[0])
                 self.assertEqual(len(matches), self.test_repetitions)
+                for _, results in matches:
+                    self.assertEqual(results is not None, build_results)
         queue_stop = done_queue.get()
         self.assertEqual(queue_stop, "STOP")
 
+    def test_worker_error(self):
+        players = [RaisingPlayer(), axl.Defector()]
+        tournament = axl.Tournament(players=players, turns=5, repetitions=2)
+        work_queue = Queue()
+        chunks = list(
+            enumerate(tournament.match_generator.build_match_chunks())
+        )
+        work_queue.put((chunks, True, True))
+        work_queue.put("STOP")
+
+        done_queue = Queue()
+        tournament._worker(work_queue, done_queue)
+        error = done_queue.get()
+        self.assertIsInstance(error, str)
+        self.assertIn("ValueError: Raised against Defector", error)
+        self.assertEqual(done_queue.get(), "STOP")
+
+    def test_worker_pool_is_closed_after_an_error(self):
+        players = [
+            RaisingPlayer(),
+            axl.Cooperator(),
+            axl.TitForTat(),
+            axl.Random(),
+            axl.Defector(),
+        ]
+        tournament = axl.Tournament(
+            players=players, turns=20, repetitions=3, seed=1
+        )
+        with self.assertRaises(RuntimeError) as context:
+            tournament.play(processes=2, progress_bar=False)
+        self.assertIn("Raised against Defector", str(context.exception))
+        self.assertIsNone(tournament._pool)
+
+        # The results of the batches played after the error are not read by
+        # the next play
+        RaisingPlayer.fail = False
+        try:
+            tournament.match_generator.random_generator = (
+                axl.BulkRandomGenerator(1)
+            )
+            results = tournament.play(processes=2, progress_bar=False)
+            expected = axl.Tournament(
+                players=players, turns=20, repetitions=3, seed=1
+            ).play(processes=2, progress_bar=False)
+            self.assertEqual(results.scores, expected.scores)
+            tournament.close()
+        finally:
+            RaisingPlayer.fail = True
+
+    def test_worker_pool_is_reused(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=axl.DEFAULT_TURNS,
+            repetitions=self.test_repetitions,
+        )
+        expected = tournament.play(progress_bar=False)
+        results = tournament.play(processes=2, progress_bar=False)
+        self.assertEqual(results.scores, expected.scores)
+        pool = tournament._pool
+        self.assertTrue(pool.is_alive())
+        processes = pool.processes
+
+        results = tournament.play(processes=2, progress_bar=False)
+        self.assertEqual(results.scores, expected.scores)
+        self.assertIs(tournament._pool, pool)
+        self.assertEqual(tournament.num_interactions, 75)
+
+        # A pool is not pickled
+        self.assertIsNone(pickle.loads(pickle.dumps(tournament))._pool)
+
+        # Another game needs new workers
+        tournament.game = axl.Game(r=4, s=0, t=5, p=1)
+        tournament.play(processes=2, progress_bar=False)
+        self.assertIsNot(tournament._pool, pool)
+        self.assertFalse(pool.is_alive())
+        for process in processes:
+            self.assertFalse(process.is_alive())
+
+        tournament.close()
+        self.assertIsNone(tournament._pool)
+        tournament.close()
+
+    def test_build_batches(self):
+        players = [axl.MetaMajority()] + [s() for s in test_strategies]
+        tournament = axl.Tournament(players=players, turns=10, seed=1)
+        groups = list(tournament.match_generator.build_match_chunk_groups())
+        batches = tournament._build_batches(groups, workers=2)
+
+        # Every chunk is scheduled once, with the key of its group
+        keyed_chunks = [entry for batch in batches for entry in batch]
+        self.assertEqual(
+            sorted(keyed_chunks, key=lambda entry: entry[0]),
+            [((group, 0), chunks[0]) for group, chunks in enumerate(groups)],
+        )
+        # The matches of the long run time player come first, on their own
+        self.assertEqual(batches[0], [((0, 0), groups[0][0])])
+        chunks = [chunk for _, chunk in keyed_chunks]
+        self.assertEqual(
+            {chunk[0] for chunk in chunks[:6]},
+            {(0, index) for index in range(6)},
+        )
+        self.assertLess(len(batches), len(chunks))
+        self.assertGreater(len(batches[-1]), 1)
+
+    def test_build_batches_with_split_repetitions(self):
+        tournament = axl.Tournament(
+            players=self.players, turns=10, repetitions=5, max_repetitions=2
+        )
+        groups = list(tournament.match_generator.build_match_chunk_groups())
+        batches = tournament._build_batches(groups, workers=2)
+        keys = sorted(key for batch in batches for key, _ in batch)
+        self.assertEqual(
+            keys,
+            [(group, part) for group in range(15) for part in range(3)],
+        )
+
+    def test_max_repetitions(self):
+        players = [axl.Random(0.3), axl.TitForTat(), axl.Random(0.8)]
+        expected = axl.Tournament(
+            players=players, turns=5, repetitions=7, seed=3
+        ).play(progress_bar=False)
+        self.assertEqual(
+            axl.Tournament(
+                players=players,
+                turns=5,
+                repetitions=7,
+                seed=3,
+                max_repetitions=7,
+            )
+            .play(progress_bar=False)
+            .scores,
+            expected.scores,
+        )
+
+        tournament = axl.Tournament(
+            players=players, turns=5, repetitions=7, seed=3, max_repetitions=3
+        )
+        serial = tournament.play(progress_bar=False)
+        self.assertEqual(serial.repetitions, 7)
+        self.assertEqual(tournament.num_interactions, 6 * 7)
+        self.assertNotEqual(serial.scores, expected.scores)
+
+        tournament = axl.Tournament(
+            players=players, turns=5, repetitions=7, seed=3, max_repetitions=3
+        )
+        with tempfile.NamedTemporaryFile() as tmp:
+            parallel = tournament.play(
+                processes=2, progress_bar=False, filename=tmp.name
+            )
+            df = pd.read_csv(tmp.name)
+        tournament.close()
+        self.assertEqual(parallel.scores, serial.scores)
+        self.assertEqual(parallel.cooperation, serial.cooperation)
+        # The repetitions of each pair are written together and in order
+        self.assertEqual(list(df["Repetition"][::2]), list(range(7)) * 6)
+
+    def test_timings_are_recorded(self):
+        tournament = axl.Tournament(
+            players=self.players, turns=10, repetitions=2
+        )
+        tournament.play(progress_bar=False)
+        timings = tournament.match_generator.timings
+        self.assertEqual(
+            sorted(timings), sorted(player.name for player in self.players)
+        )
+        for seconds, turns in timings.values():
+            self.assertGreater(seconds, 0)
+            # Each player plays 4 opponents, and is both players against itself
+            self.assertEqual(turns, 6 * 2 * 10)
+
+        tournament.play(processes=2, progress_bar=False)
+        for seconds, turns in tournament.match_generator.timings.values():
+            self.assertEqual(turns, 2 * 6 * 2 * 10)
+        tournament.close()
+
+        # Another tournament can use and add to the timings
+        other = axl.Tournament(
+            players=self.players[:2], turns=10, repetitions=2, timings=timings
+        )
+        self.assertIs(other.match_generator.timings, timings)
+        other.play(progress_bar=False)
+        seconds, turns = timings[self.players[0].name]
+        self.assertEqual(turns, 2 * 6 * 2 * 10 + 3 * 2 * 10)
+
     def test_build_result_set(self):
         tournament = axl.Tournament(
             name=self.test_name,
@@ -682,12 +1306,54 @@ class TestTournament(unittest.TestCase):
                 self.assertEqual(len(plays), self.test_repetitions)
                 for repetition in plays:
                     actions, results = repetition
+                    self.assertIsInstance(actions, axl.PackedInteractions)
                     self.assertEqual(len(actions), turns)
                     self.assertEqual(len(results), 10)
 
         # Check that matches no longer exist
         self.assertEqual((len(list(chunk_generator))), 0)
 
+    def test_play_matches_uses_shared_cache(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.Cooperator()]
+        tournament = axl.Tournament(players=players, turns=3, repetitions=2)
+        tournament._deterministic_cache = axl.SharedCache()
+        # a deliberately incorrect result so we can tell it came from the cache
+        tournament._deterministic_cache[(axl.Defector(), axl.Cooperator())] = [
+            (D, D)
+        ] * 3
+        match_params = {"turns": 3, "game": axl.Game()}
+        results = tournament._play_matches(
+            ((1, 2), match_params, 2, 0), build_results=False
+        )
+        for interactions, _ in results[(1, 2)]:
+            self.assertEqual(interactions, [(D, D)] * 3)
+
+        # Duplicate players use the entry in the other order
+        results = tournament._play_matches(
+            ((0, 1), match_params, 2, 0), build_results=False
+        )
+        for interactions, _ in results[(0, 1)]:
+            self.assertEqual(interactions, [(D, D)] * 3)
+        self.assertEqual(tournament._deterministic_cache._snapshots, {})
+        self.assertEqual(tournament._deterministic_cache._local, {})
+
+    def test_shared_cache_with_duplicate_players(self):
+        players = [
+            axl.TitForTat(),
+            axl.Cycler("CCD"),
+            axl.Grudger(),
+            axl.Cycler("CCD"),
+            axl.TitForTat(),
+        ]
+        tournament = axl.Tournament(players=players, turns=20, repetitions=2)
+        serial_results = tournament.play(progress_bar=False)
+        self.assertIsNone(tournament._deterministic_cache)
+        parallel_results = tournament.play(progress_bar=False, processes=2)
+        self.assertIsNone(tournament._deterministic_cache)
+        self.assertEqual(serial_results.scores, parallel_results.scores)
+        self.assertEqual(serial_results.scores[0], serial_results.scores[4])
+        self.assertEqual(serial_results.scores[1], serial_results.scores[3])
+
     def test_write_interactions(self):
         tournament = axl.Tournament(
             name=self.test_name,
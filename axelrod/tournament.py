@@ -1,25 +1,48 @@
+import copy
 import csv
+import hashlib
 import logging
 import os
+import shutil
+import time
+import traceback
 import warnings
+import weakref
 from collections import defaultdict
-from multiprocessing import Process, Queue, cpu_count
-from tempfile import mkstemp
-from typing import List, Optional, Tuple
+from multiprocessing import Manager, Process, Queue, cpu_count
+from tempfile import mkdtemp, mkstemp
+from typing import Dict, List, Optional, Tuple, Union
 
-import axelrod.interaction_utils as iu
+import pandas as pd
 import tqdm
 from axelrod import DEFAULT_TURNS
-from axelrod.action import Action, actions_to_str
+from axelrod.action import Action
 from axelrod.player import Player
-
+from axelrod.random_ import BulkRandomGenerator
+
+from .columnar import (
+    ColumnarWriter,
+    ColumnStore,
+    has_results,
+    is_columnar,
+    read_position,
+)
+from .deterministic_cache import SharedCache
 from .game import Game
+from .journal import TournamentJournal, journal_file_name
 from .match import Match
-from .match_generator import MatchGenerator
+from .match_generator import MatchGenerator, extension_seed
+from .packed_interactions import PackedInteractions
+from .result_aggregator import ResultAggregator, StreamingResultSet
 from .result_set import ResultSet
 
 C, D = Action.C, Action.D
 
+OUTPUT_FORMATS = ("csv", "npy")
+
+# The stores of the results of a tournament played in memory
+ResultStore = Union[ColumnStore, ResultAggregator]
+
 
 class Tournament(object):
     def __init__(
@@ -34,6 +57,8 @@ class Tournament(object):
         edges: List[Tuple] = None,
         match_attributes: dict = None,
         seed: int = None,
+        max_repetitions: int = None,
+        timings: dict = None,
     ) -> None:
         """
         Parameters
@@ -61,6 +86,16 @@ class Tournament(object):
         seed : integer
             The seed for random numbers that will be generated for this
             tournament, thus allowing future runs to exactly reproduce results.
+        max_repetitions : integer
+            The maximum number of repetitions of a pair of players played
+            together. Pairs with more repetitions are split into chunks, each
+            with its own seed derived from the seed of the pair, which can be
+            played by different processes.
+        timings : dict
+            The time taken by each strategy, as recorded by another
+            tournament in `tournament.match_generator.timings`, used to
+            schedule the matches of parallel plays. The timings recorded by
+            this tournament are added to it.
         """
         if game is None:
             self.game = Game()
@@ -89,22 +124,44 @@ class Tournament(object):
             edges=edges,
             match_attributes=match_attributes,
             seed=self.seed,
+            max_repetitions=max_repetitions,
+            timings=timings,
         )
         self._logger = logging.getLogger(__name__)
 
         self.use_progress_bar = True
         self.filename = None  # type: Optional[str]
+        self.output_format = "csv"
         self._temp_file_descriptor = None  # type: Optional[int]
-
-    def setup_output(self, filename=None):
+        self._temp_directory = False
+        self._result_store = None  # type: Optional[ResultStore]
+        self._journal = None  # type: Optional[TournamentJournal]
+        self._output_position = None  # type: Optional[object]
+        self._deterministic_cache = None  # type: Optional[SharedCache]
+        self._pool = None  # type: Optional[_WorkerPool]
+
+    def setup_output(self, filename=None, output_format="csv", in_memory=False):
         """assign/create `filename` to `self`. If file should be deleted once
-        `play` is finished, assign a file descriptor."""
+        `play` is finished, assign a file descriptor (or, for the "npy"
+        format, mark the temporary directory for deletion). No file is
+        created if `in_memory` is True and no filename is given."""
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                "The output format must be one of {}.".format(OUTPUT_FORMATS)
+            )
         temp_file_descriptor = None
-        if filename is None:
-            temp_file_descriptor, filename = mkstemp()
+        temp_directory = False
+        if filename is None and not in_memory:
+            if output_format == "npy":
+                filename = mkdtemp()
+                temp_directory = True
+            else:
+                temp_file_descriptor, filename = mkstemp()
 
         self.filename = filename
+        self.output_format = output_format
         self._temp_file_descriptor = temp_file_descriptor
+        self._temp_directory = temp_directory
 
     def play(
         self,
@@ -112,6 +169,10 @@ class Tournament(object):
         filename: str = None,
         processes: int = None,
         progress_bar: bool = True,
+        output_format: str = "csv",
+        in_memory: bool = False,
+        streaming: bool = False,
+        resume: bool = False,
     ) -> ResultSet:
         """
         Plays the tournament and passes the results to the ResultSet class
@@ -126,16 +187,65 @@ class Tournament(object):
             The number of processes to be used for parallel processing
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
+        output_format : string
+            The format of the output: "csv" for a CSV file, or "npy" for a
+            directory of NumPy column files (see `axelrod.columnar`), which
+            is faster to write and to read for large tournaments
+        in_memory : bool
+            Whether to build the results set from results kept in memory,
+            rather than by writing the interactions to a file and reading
+            them back. The interactions are then only written if a filename
+            is given.
+        streaming : bool
+            Whether to build the results set from running statistics of the
+            results, updated as the matches are played, rather than from the
+            results of every interaction. This keeps the memory used
+            independent of the number of turns, but the results set is a
+            `StreamingResultSet`, without the values of the individual
+            repetitions. The interactions are then only written if a
+            filename is given.
+        resume : bool
+            Whether to keep a journal of the pairs of players whose
+            interactions have been written, next to the output file, and to
+            resume the tournament from the journal if it exists. The pairs of
+            the journal are not played again, and the results are those of
+            an uninterrupted first play of the tournament. This requires a
+            filename and the tournament to have a seed.
 
         Returns
         -------
         axelrod.ResultSet
         """
+        if resume and (filename is None or self.seed is None):
+            raise ValueError(
+                "A filename and a seed are needed to resume a tournament."
+            )
+        if resume and (in_memory or streaming):
+            raise ValueError("A tournament kept in memory cannot be resumed.")
+
         self.num_interactions = 0
 
         self.use_progress_bar = progress_bar
 
-        self.setup_output(filename)
+        self.setup_output(
+            filename,
+            output_format=output_format,
+            in_memory=in_memory or streaming,
+        )
+        if streaming and build_results:
+            self._result_store = ResultAggregator(
+                len(self.players), self.repetitions
+            )
+        elif in_memory and build_results:
+            self._result_store = ColumnStore()
+        if resume:
+            # The matches are seeded as in the first play of the tournament
+            self.match_generator.random_generator = BulkRandomGenerator(
+                self.seed
+            )
+            self._journal = self._open_journal(build_results)
+            self.num_interactions = self._journal.interactions
+            self._output_position = self._journal.position
 
         if not build_results and not filename:
             warnings.warn(
@@ -143,13 +253,36 @@ class Tournament(object):
                 "build_results=False and no filename was supplied."
             )
 
-        if processes is None:
-            self._run_serial(build_results=build_results)
-        else:
-            self._run_parallel(build_results=build_results, processes=processes)
+        try:
+            if processes is None:
+                self._run_serial(build_results=build_results)
+            else:
+                self._run_parallel(
+                    build_results=build_results, processes=processes
+                )
+        finally:
+            self._output_position = None
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
 
         result_set = None
-        if build_results:
+        if isinstance(self._result_store, ResultAggregator):
+            result_set = StreamingResultSet(
+                self._result_store,
+                players=[str(p) for p in self.players],
+                progress_bar=progress_bar,
+            )
+            self._result_store = None
+        elif self._result_store is not None:
+            result_set = ResultSet.from_dataframe(
+                self._result_store.to_dataframe(),
+                players=[str(p) for p in self.players],
+                repetitions=self.repetitions,
+                progress_bar=progress_bar,
+            )
+            self._result_store = None
+        elif build_results:
             result_set = ResultSet(
                 filename=self.filename,
                 players=[str(p) for p in self.players],
@@ -161,33 +294,243 @@ class Tournament(object):
             assert self.filename is not None
             os.close(self._temp_file_descriptor)
             os.remove(self.filename)
+        elif self._temp_directory:
+            shutil.rmtree(self.filename)
 
         return result_set
 
+    def extend(
+        self,
+        players: List[Player],
+        filename: str = None,
+        processes: int = None,
+        progress_bar: bool = True,
+    ) -> Optional[ResultSet]:
+        """
+        Adds players to a round robin tournament which has been played,
+        playing only the matches of the pairs of players including one of
+        the new players.
+
+        The interactions of the other pairs are read from the output of the
+        previous play, which must have been written to a file, and the
+        interactions of the new pairs are appended to it. The matches of the
+        new pairs are seeded from the seed of the tournament and its number
+        of players before the extension, so that the results of the existing
+        pairs are kept and extending a tournament with a seed always gives
+        the same results. The new pairs are played with or without building
+        their results, like the pairs of the previous output.
+
+        Parameters
+        ----------
+        players : list
+            The axelrod.Player objects to add
+        filename : string
+            The output of the previous play of the tournament, in either
+            format. Defaults to the output of the last call to `play` or
+            `extend`.
+        processes : integer
+            The number of processes to be used for parallel processing
+        progress_bar : bool
+            Whether or not to create a progress bar which will be updated
+
+        Returns
+        -------
+        axelrod.ResultSet
+            The results of all the pairs, or None if the previous output was
+            played with build_results=False
+        """
+        if self.edges is not None:
+            raise ValueError("Only round robin tournaments can be extended.")
+        if not players:
+            raise ValueError("There are no players to add.")
+        if filename is None:
+            filename = self.filename
+        if filename is None or not os.path.exists(filename):
+            raise ValueError(
+                "The output of a previous play of the tournament is needed "
+                "to extend it."
+            )
+
+        if is_columnar(filename):
+            output_format = "npy"
+            build_results = has_results(filename)
+            position = read_position(filename)
+            num_interactions = position[0] // 2
+        else:
+            output_format = "csv"
+            header = pd.read_csv(filename, nrows=0).columns
+            build_results = "Score" in header
+            position = os.path.getsize(filename)
+            interaction_index = pd.read_csv(
+                filename, usecols=["Interaction index"]
+            )["Interaction index"]
+            num_interactions = 0
+            if len(interaction_index):
+                num_interactions = int(interaction_index.max()) + 1
+
+        num_players = len(self.players)
+        self.players = self.players + list(players)
+        edges = [
+            (player1_index, player2_index)
+            for player2_index in range(num_players, len(self.players))
+            for player1_index in range(player2_index + 1)
+        ]
+        seed = None
+        if self.seed is not None:
+            seed = extension_seed(self.seed, num_players)
+        match_generator = self._build_match_generator(seed=self.seed)
+        self.match_generator = self._build_match_generator(edges, seed)
+
+        self.num_interactions = num_interactions
+        self.use_progress_bar = progress_bar
+        self.filename = filename
+        self.output_format = output_format
+        self._output_position = position
+        self._temp_file_descriptor = None
+        self._temp_directory = False
+
+        try:
+            if processes is None:
+                self._run_serial(build_results=build_results)
+            else:
+                self._run_parallel(
+                    processes=processes, build_results=build_results
+                )
+        finally:
+            self._output_position = None
+            self.match_generator = match_generator
+
+        if not build_results:
+            return None
+        return ResultSet(
+            filename=self.filename,
+            players=[str(p) for p in self.players],
+            repetitions=self.repetitions,
+            processes=processes,
+            progress_bar=progress_bar,
+        )
+
+    def _build_match_generator(self, edges=None, seed=None) -> MatchGenerator:
+        """Returns a match generator with the parameters of the current match
+        generator for all the players of the tournament. The timings
+        recorded by the current match generator are kept."""
+        match_generator = MatchGenerator(
+            players=self.players,
+            turns=self.match_generator.turns,
+            game=self.game,
+            repetitions=self.repetitions,
+            prob_end=self.prob_end,
+            noise=self.noise,
+            edges=edges,
+            match_attributes=self.match_generator.match_attributes,
+            seed=seed,
+            max_repetitions=self.match_generator.max_repetitions,
+            timings=self.match_generator.timings,
+        )
+        return match_generator
+
     def _run_serial(self, build_results: bool = True) -> bool:
-        """Run all matches in serial."""
+        """Run all matches in serial, sharing a deterministic cache between
+        all chunks."""
 
-        chunks = self.match_generator.build_match_chunks()
+        groups = self._build_match_chunk_groups()
+        keep_interactions = self._keep_interactions(build_results)
+        self._deterministic_cache = SharedCache()
 
         out_file, writer = self._get_file_objects(build_results)
         progress_bar = self._get_progress_bar()
 
-        for chunk in chunks:
-            results = self._play_matches(chunk, build_results=build_results)
-            self._write_interactions_to_file(results, writer=writer)
+        for chunks in groups:
+            parts = []
+            for chunk in chunks:
+                start = time.perf_counter()
+                results = self._play_matches(
+                    chunk, build_results, keep_interactions
+                )
+                self._record_timing(results, time.perf_counter() - start)
+                parts.append(results)
+            self._write_interactions_to_file(
+                _merge_results(parts), writer=writer
+            )
+            self._checkpoint(chunks, out_file)
 
             if self.use_progress_bar:
                 progress_bar.update(1)
 
         _close_objects(out_file, progress_bar)
+        self._deterministic_cache = None
 
         return True
 
+    def _build_match_chunk_groups(self):
+        """Returns the groups of chunks of the match generator, without those
+        of the pairs of players recorded in the journal."""
+        groups = self.match_generator.build_match_chunk_groups()
+        if self._journal is None:
+            return groups
+        journal = self._journal
+        return (chunks for chunks in groups if not journal.is_completed(chunks))
+
+    def _journal_key(self, build_results: bool = True) -> str:
+        """Identifies the parameters of the tournament which determine the
+        contents of its output."""
+        parameters = (
+            self._pool_key(),
+            self.match_generator.turns,
+            self.prob_end,
+            self.noise,
+            self.repetitions,
+            self.match_generator.max_repetitions,
+            self.edges,
+            self.match_generator.match_attributes,
+            self.seed,
+            build_results,
+            self.output_format,
+        )
+        return hashlib.sha256(repr(parameters).encode()).hexdigest()
+
+    def _open_journal(self, build_results: bool = True) -> TournamentJournal:
+        """Opens the journal of the output file. A journal whose output file
+        no longer exists is reset."""
+        journal = TournamentJournal(
+            journal_file_name(self.filename), self._journal_key(build_results)
+        )
+        if journal.position is not None and not os.path.exists(self.filename):
+            journal.reset()
+        return journal
+
+    def _checkpoint(self, chunks, out_file) -> None:
+        """Records in the journal, if there is one, that the interactions of
+        the chunks of a pair of players have been written."""
+        if self._journal is None:
+            return
+        if isinstance(out_file, ColumnarWriter):
+            position = out_file.position()
+        else:
+            out_file.flush()
+            position = out_file.tell()
+        self._journal.record(chunks, self.num_interactions, position)
+
     def _get_file_objects(self, build_results=True):
         """Returns the file object and writer for writing results or
-        (None, None) if self.filename is None"""
+        (None, None) if self.filename is None. For the "npy" output format,
+        both are the same ColumnarWriter. When resuming from a journal or
+        extending the tournament, the output is truncated to
+        `_output_position` and appended to."""
         file_obj = None
         writer = None
+        position = self._output_position
+        if self.filename is not None and self.output_format == "npy":
+            writer = ColumnarWriter(
+                self.filename, build_results=build_results, position=position
+            )
+            return writer, writer
+        if self.filename is not None and position is not None:
+            file_obj = open(self.filename, "r+")
+            file_obj.truncate(position)
+            file_obj.seek(position)
+            writer = csv.writer(file_obj, lineterminator="\n")
+            return file_obj, writer
         if self.filename is not None:
             file_obj = open(self.filename, "w")
             writer = csv.writer(file_obj, lineterminator="\n")
@@ -233,13 +576,31 @@ class Tournament(object):
 
     def _get_progress_bar(self):
         if self.use_progress_bar:
+            initial = 0
+            if self._journal is not None:
+                initial = len(self._journal.completed)
             return tqdm.tqdm(
-                total=self.match_generator.size, desc="Playing matches"
+                total=self.match_generator.size,
+                desc="Playing matches",
+                initial=initial,
             )
         return None
 
     def _write_interactions_to_file(self, results, writer):
-        """Write the interactions to csv."""
+        """Write the interactions to csv, or to the columns of a
+        ColumnarWriter, and to the store of results kept in memory."""
+        if self._result_store is not None:
+            self._result_store.write_interactions(
+                results, self.num_interactions
+            )
+        if writer is None:
+            self.num_interactions += sum(map(len, results.values()))
+            return
+        if isinstance(writer, ColumnarWriter):
+            self.num_interactions += writer.write_interactions(
+                results, self.num_interactions
+            )
+            return
         for index_pair, interactions in results.items():
             repetition = 0
             for interaction, results in interactions:
@@ -267,8 +628,7 @@ class Tournament(object):
                         str(self.players[player_index]),
                         str(self.players[opponent_index]),
                     ]
-                    history = actions_to_str([i[index] for i in interaction])
-                    row.append(history)
+                    row.append(interaction.actions_to_str(index))
 
                     if results is not None:
                         row.append(scores[index])
@@ -307,6 +667,16 @@ class Tournament(object):
         """
         Run all matches in parallel
 
+        The matches are played by a `_WorkerPool`, which is kept between calls
+        to `play` for as long as the players and game of the tournament do
+        not change (see `close`). The chunks of matches are sent to the
+        workers in batches, so that tournaments made of many short matches
+        are not slowed down by the cost of communicating with the workers.
+
+        The worker processes share a deterministic cache held by a
+        `multiprocessing.Manager`, so that each distinct pairing of
+        deterministic players is played once for the whole tournament.
+
         Parameters
         ----------
         build_results : bool
@@ -314,21 +684,33 @@ class Tournament(object):
         processes : int
             How many processes to use.
         """
-        # At first sight, it might seem simpler to use the multiprocessing Pool
-        # Class rather than Processes and Queues. However, this way is faster.
-        work_queue = Queue()  # type: Queue
-        done_queue = Queue()  # type: Queue
         workers = self._n_workers(processes=processes)
-
-        chunks = self.match_generator.build_match_chunks()
-        for chunk in chunks:
-            work_queue.put(chunk)
-
-        self._start_workers(workers, work_queue, done_queue, build_results)
-        self._process_done_queue(workers, done_queue, build_results)
-
+        pool = self._get_pool(workers)
+        pool.cache.clear()
+
+        groups = list(self._build_match_chunk_groups())
+        batches = self._build_batches(groups, workers)
+        keep_interactions = self._keep_interactions(build_results)
+        try:
+            for batch in batches:
+                pool.work_queue.put((batch, build_results, keep_interactions))
+
+            self._process_done_queue(
+                len(batches), pool.done_queue, build_results, groups=groups
+            )
+        except BaseException:
+            # The workers may still be playing the other batches, whose
+            # results would be read by the next play, so the pool is stopped
+            self.close()
+            raise
         return True
 
+    def _keep_interactions(self, build_results: bool = True) -> bool:
+        """Whether the interactions of the matches are needed: they are
+        only dropped when the results are kept in memory and no file is
+        written."""
+        return self.filename is not None or not build_results
+
     def _n_workers(self, processes: int = 2) -> int:
         """
         Determines the number of parallel processes to use.
@@ -343,13 +725,122 @@ class Tournament(object):
             n_workers = cpu_count()
         return n_workers
 
+    def _build_batches(
+        self, groups: List[List[Tuple]], workers: int
+    ) -> List[List[Tuple]]:
+        """
+        Splits the chunks of the tournament into batches to be sent to the
+        workers, longest first. Each chunk is sent with its key: the indices
+        of its group and of the chunk within the group.
+
+        The chunks are sorted by the cost estimated by the match generator,
+        so that the most expensive matches are not left until the end while
+        other workers are idle. They are then grouped into batches of about
+        a quarter of a worker's share of the total cost: expensive chunks are
+        sent on their own and cheap chunks are sent together.
+
+        Parameters
+        ----------
+        groups : list
+            The lists of chunks of each pair of players, as built by
+            `MatchGenerator.build_match_chunk_groups`
+        workers : integer
+            The number of sub-processes
+
+        Returns
+        -------
+        list
+            Lists of (key, chunk) pairs
+        """
+        keys = [
+            (group, part)
+            for group, chunks in enumerate(groups)
+            for part in range(len(chunks))
+        ]
+        chunks = [chunk for chunks in groups for chunk in chunks]
+        costs = self.match_generator.estimate_costs(chunks)
+        order = sorted(range(len(chunks)), key=lambda i: costs[i], reverse=True)
+        target = sum(costs) / (4 * workers)
+
+        batches = []
+        batch = []  # type: List[Tuple]
+        batch_cost = 0
+        for i in order:
+            batch.append((keys[i], chunks[i]))
+            batch_cost += costs[i]
+            if batch_cost >= target:
+                batches.append(batch)
+                batch = []
+                batch_cost = 0
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _record_timing(self, results, seconds: float) -> None:
+        """Records the time taken to play the matches of a chunk, to improve
+        the estimated costs used to schedule later tournaments."""
+        for index_pair, interactions in results.items():
+            turns = sum(
+                len(interaction)
+                if interaction is not None
+                else match_results[2]
+                for interaction, match_results in interactions
+            )
+            self.match_generator.record_timing(index_pair, seconds, turns)
+
+    def _pool_key(self) -> Tuple:
+        """The players and game used by the workers of a pool."""
+        return (
+            tuple(player.fingerprint_key() for player in self.players),
+            self.game.RPST(),
+        )
+
+    def _get_pool(self, workers: int) -> "_WorkerPool":
+        """
+        Returns a pool of workers for the tournament, reusing the pool of a
+        previous call to `play` if the number of workers, the players and the
+        game are unchanged.
+
+        Parameters
+        ----------
+        workers : integer
+            The number of sub-processes in the pool
+        """
+        key = self._pool_key()
+        pool = self._pool
+        if (
+            pool is not None
+            and pool.workers == workers
+            and pool.key == key
+            and pool.is_alive()
+        ):
+            return pool
+        self.close()
+        self._pool = _WorkerPool(self, workers, key)
+        return self._pool
+
+    def close(self) -> None:
+        """Stops the worker processes kept by a parallel tournament. They are
+        also stopped when the tournament is garbage collected."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __getstate__(self):
+        """Used for pickling: the worker pool and the journal are not
+        copied."""
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_journal"] = None
+        return state
+
     def _start_workers(
         self,
         workers: int,
         work_queue: Queue,
         done_queue: Queue,
-        build_results: bool = True,
-    ) -> bool:
+        cache_data=None,
+    ) -> List[Process]:
         """
         Initiates the sub-processes to carry out parallel processing.
 
@@ -358,75 +849,126 @@ class Tournament(object):
         workers : integer
             The number of sub-processes to create
         work_queue : multiprocessing.Queue
-            A queue containing an entry for each round robin to be processed
+            A queue containing batches of chunks of matches to be processed
         done_queue : multiprocessing.Queue
-            A queue containing the output dictionaries from each round robin
-        build_results : bool
-            whether or not to build a results set
+            A queue containing the output dictionaries of each batch
+        cache_data : dict
+            The data of the deterministic cache shared by the workers
+
+        Returns
+        -------
+        list
+            The started processes
         """
+        processes = []
         for worker in range(workers):
             process = Process(
                 target=self._worker,
-                args=(work_queue, done_queue, build_results),
+                args=(work_queue, done_queue, cache_data),
+                daemon=True,
             )
-            work_queue.put("STOP")
             process.start()
-        return True
+            processes.append(process)
+        return processes
 
     def _process_done_queue(
-        self, workers: int, done_queue: Queue, build_results: bool = True
+        self,
+        batches: int,
+        done_queue: Queue,
+        build_results: bool = True,
+        groups: List[List[Tuple]] = None,
     ):
         """
         Retrieves the matches from the parallel sub-processes
 
+        The results of the chunks of a pair of players are written together,
+        in the order of their repetitions, once all of them have been played.
+
         Parameters
         ----------
-        workers : integer
-            The number of sub-processes in existence
+        batches : integer
+            The number of batches sent to the sub-processes
         done_queue : multiprocessing.Queue
-            A queue containing the output dictionaries from each round robin
+            A queue containing the output dictionaries of each batch
         build_results : bool
             whether or not to build a results set
+        groups : list
+            The chunks of each pair of players, as sent to the workers.
+            Defaults to a single chunk for every pair.
         """
         out_file, writer = self._get_file_objects(build_results)
         progress_bar = self._get_progress_bar()
 
-        stops = 0
-        while stops < workers:
-            results = done_queue.get()
-            if results == "STOP":
-                stops += 1
-            else:
-                self._write_interactions_to_file(results, writer)
-
-                if self.use_progress_bar:
-                    progress_bar.update(1)
-
-        _close_objects(out_file, progress_bar)
+        pending = {}  # type: Dict[int, List]
+        try:
+            for _ in range(batches):
+                batch_results = done_queue.get()
+                if isinstance(batch_results, str):
+                    raise RuntimeError(
+                        "A worker process raised an error:\n" + batch_results
+                    )
+                for (group, part), results, seconds in batch_results:
+                    self._record_timing(results, seconds)
+                    n_parts = 1 if groups is None else len(groups[group])
+                    group_results = pending.setdefault(group, [None] * n_parts)
+                    group_results[part] = results
+                    if any(r is None for r in group_results):
+                        continue
+                    del pending[group]
+                    self._write_interactions_to_file(
+                        _merge_results(group_results), writer
+                    )
+                    if groups is not None:
+                        self._checkpoint(groups[group], out_file)
+                    if self.use_progress_bar:
+                        progress_bar.update(1)
+        finally:
+            _close_objects(out_file, progress_bar)
         return True
 
-    def _worker(
-        self, work_queue: Queue, done_queue: Queue, build_results: bool = True
-    ):
+    def _worker(self, work_queue: Queue, done_queue: Queue, cache_data=None):
         """
         The work for each parallel sub-process to execute.
 
+        Each entry of the work queue is a batch of (key, chunk) pairs, whether
+        or not to build results and whether or not to keep the interactions
+        of the matches. The key and output dictionary of each chunk of a
+        batch, with the time taken to play it, are put on the done queue as a
+        single list, or the traceback of the exception raised while playing
+        them. The worker stops when it gets "STOP" from the work queue.
+
         Parameters
         ----------
         work_queue : multiprocessing.Queue
-            A queue containing an entry for each round robin to be processed
+            A queue containing batches of chunks of matches to be processed
         done_queue : multiprocessing.Queue
-            A queue containing the output dictionaries from each round robin
-        build_results : bool
-            whether or not to build a results set
+            A queue containing the output dictionaries of each batch
+        cache_data : dict
+            The data of the deterministic cache shared by the workers
         """
-        for chunk in iter(work_queue.get, "STOP"):
-            interactions = self._play_matches(chunk, build_results)
+        if cache_data is not None:
+            self._deterministic_cache = SharedCache(cache_data)
+        for batch, build_results, keep_interactions in iter(
+            work_queue.get, "STOP"
+        ):
+            try:
+                interactions = []
+                for key, chunk in batch:
+                    start = time.perf_counter()
+                    results = self._play_matches(
+                        chunk, build_results, keep_interactions
+                    )
+                    seconds = time.perf_counter() - start
+                    interactions.append((key, results, seconds))
+            except Exception:
+                # The traceback is sent rather than the error, which may not
+                # be picklable
+                interactions = traceback.format_exc()
             done_queue.put(interactions)
         done_queue.put("STOP")
         return True
 
-    def _play_matches(self, chunk, build_results=True):
+    def _play_matches(self, chunk, build_results=True, keep_interactions=True):
         """
         Play matches in a given chunk.
 
@@ -436,11 +978,15 @@ class Tournament(object):
             match_parameters are also a tuple: (turns, game, noise)
         build_results : bool
             whether or not to build a results set
+        keep_interactions : bool
+            whether or not to return the interactions of the matches, which
+            are replaced by None otherwise
 
         Returns
         -------
         interactions : dictionary
-            Mapping player index pairs to results of matches:
+            Mapping player index pairs to results of matches, stored as
+            PackedInteractions:
 
                 (0, 1) -> [(C, D), (D, C),...]
         """
@@ -451,60 +997,141 @@ class Tournament(object):
         player2 = self.players[p2_index].clone()
         match_params["players"] = (player1, player2)
         match_params["seed"] = seed
+        if self._deterministic_cache is not None:
+            match_params["deterministic_cache"] = self._deterministic_cache
         match = Match(**match_params)
         for _ in range(repetitions):
             match.play()
+            packed = None
+            if keep_interactions:
+                packed = PackedInteractions.from_interactions(match.result)
 
             if build_results:
-                results = self._calculate_results(match.result)
+                results = self._calculate_results(match.summary)
             else:
                 results = None
 
-            interactions[index_pair].append([match.result, results])
+            interactions[index_pair].append([packed, results])
+        if self._deterministic_cache is not None:
+            # Only keep packed entries between chunks
+            self._deterministic_cache.clear_local()
         return interactions
 
-    def _calculate_results(self, interactions):
+    def _calculate_results(self, summary):
+        """
+        Returns the results of a match from its summary.
+
+        Parameters
+        ----------
+        summary : axelrod.MatchSummary
+            The statistics counted while the match was played
+        """
         results = []
 
-        scores = iu.compute_final_score(interactions, self.game)
+        scores = summary.final_score(self.game)
         results.append(scores)
 
         score_diffs = scores[0] - scores[1], scores[1] - scores[0]
         results.append(score_diffs)
 
-        turns = len(interactions)
+        turns = len(summary)
         results.append(turns)
 
-        score_per_turns = iu.compute_final_score_per_turn(
-            interactions, self.game
-        )
+        score_per_turns = summary.final_score_per_turn(self.game)
         results.append(score_per_turns)
 
         score_diffs_per_turns = score_diffs[0] / turns, score_diffs[1] / turns
         results.append(score_diffs_per_turns)
 
-        initial_coops = tuple(
-            map(bool, iu.compute_cooperations(interactions[:1]))
-        )
+        initial_coops = summary.initial_cooperation()
         results.append(initial_coops)
 
-        cooperations = iu.compute_cooperations(interactions)
+        cooperations = summary.cooperations()
         results.append(cooperations)
 
-        state_distribution = iu.compute_state_distribution(interactions)
+        state_distribution = summary.state_distribution()
         results.append(state_distribution)
 
-        state_to_action_distributions = iu.compute_state_to_action_distribution(
-            interactions
-        )
+        state_to_action_distributions = summary.state_to_action_distribution()
         results.append(state_to_action_distributions)
 
-        winner_index = iu.compute_winner_index(interactions, self.game)
+        winner_index = summary.winner_index(self.game)
         results.append(winner_index)
 
         return results
 
 
+class _WorkerPool(object):
+    """
+    Long lived worker processes playing the matches of a parallel tournament.
+
+    The processes are given the tournament, and so its players, once when
+    they are started. They then play batches of chunks of matches put on the
+    work queue until they are stopped by `close`.
+
+    Parameters
+    ----------
+    tournament : axelrod.Tournament
+        The tournament whose matches are played. The workers use a copy
+        of it.
+    workers : integer
+        The number of sub-processes
+    key : tuple
+        The players and game of the tournament
+    """
+
+    def __init__(self, tournament: Tournament, workers: int, key: Tuple):
+        self.workers = workers
+        self.key = key
+        self.manager = Manager()
+        self.cache = self.manager.dict()
+        self.work_queue = Queue()  # type: Queue
+        self.done_queue = Queue()  # type: Queue
+        # The processes do not refer to the tournament itself, so that the
+        # pool is stopped when the tournament is garbage collected.
+        self.processes = copy.copy(tournament)._start_workers(
+            workers, self.work_queue, self.done_queue, self.cache
+        )
+        self._finalizer = weakref.finalize(
+            self, _stop_workers, self.processes, self.work_queue, self.manager
+        )
+
+    def is_alive(self) -> bool:
+        """Whether all the worker processes are running."""
+        return self._finalizer.alive and all(
+            process.is_alive() for process in self.processes
+        )
+
+    def close(self) -> None:
+        """Stops the worker processes and the manager of the cache."""
+        self._finalizer()
+
+
+def _merge_results(parts):
+    """Merges the output dictionaries of the chunks of a pair of players, in
+    the order of their repetitions."""
+    if len(parts) == 1:
+        return parts[0]
+    merged = defaultdict(list)
+    for results in parts:
+        for index_pair, interactions in results.items():
+            merged[index_pair].extend(interactions)
+    return merged
+
+
+def _stop_workers(processes, work_queue, manager, timeout=5):
+    """Asks the worker processes of a pool to stop, terminating those that
+    have not stopped after `timeout` seconds, and shuts down the manager."""
+    for process in processes:
+        if process.is_alive():
+            work_queue.put("STOP")
+    for process in processes:
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+    manager.shutdown()
+
+
 def _close_objects(*objs):
     """If the objects have a `close` method, closes them."""
     for obj in objs: